@@ -1,66 +1,60 @@
-# Title:	Assets 
-# Author:	Nicholas Wright
-# Info:		To be used with Zombie.py
-# Version:	v0.0
-
-# Define world data
-
-import tkinter
-
-import World
-import Images
-
-## Define World Levels ##
-
-MAZE = {
-	"Width" : 12,
-	"Height" : 14,
-	
-	"Background" : "#B5A7B7",
-
-	"Walls" : [(1, 3, 11, 3), (11, 3, 11, 13), (11, 13, 1, 13), (1, 13, 1, 3), (3, 3, 3, 4), (3, 4, 2, 4), (7, 3, 7, 4), (7, 4, 9, 4), (9, 4, 9, 5), (10, 3, 10, 5), (11, 7, 10, 7), (11, 10, 10, 10), (10, 10, 10, 12), (10, 11, 9, 11), (9, 11, 9, 12), (9, 12, 8, 12), (7, 13, 7, 10), (7, 11, 8, 11), (7, 10, 5, 10), (5, 10, 5, 9), (6, 9, 3, 9), (3, 9, 3, 8), (6, 9, 6, 6), (6, 8, 7, 8), (6, 7, 5, 7), (6, 6, 7, 6), (6, 13, 6, 12), (3, 13, 3, 10), (2, 10, 4, 10), (4, 10, 4, 12), (4, 11, 6, 11), (4, 12, 5, 12), (1, 11, 2, 11), (2, 11, 2, 12), (1, 9, 2, 9), (2, 9, 2, 6), (2, 7, 4, 7), (4, 8, 4, 6), (4, 8, 5, 8), (4, 6, 5, 6), (5, 6, 5, 5), (5, 5, 8, 5), (6, 5, 6, 4), (8, 5, 8, 7), (8, 7, 7, 7), (8, 6, 10, 6), (9, 6, 9, 8), (8, 8, 10, 8), (10, 8, 10, 9), (10, 9, 9, 9), (9, 9, 9, 10), (8, 8, 8, 10), (8, 9, 7, 9), (1, 5, 4, 5), (3, 5, 3, 6), (4, 5, 4, 4), (4, 4, 5, 4)],
-	
-	"Objects" : [
-		World.ObjectText(1, 1.4, "LEVEL ONE", "Monospace", 0.6, "#000000", tkinter.W),
-		World.ObjectText(1, 2.2, "FIND THE EXIT", "Monospace", 0.6, "#000000", tkinter.W)
-	],
-	
-	"TreasurePoints" : [
-		(4.5, 8.5),
-		(3.5, 12.5),
-		(5.5, 9.5),
-		(2.5, 3.5),
-		(10.5, 9.5),
-		(7.5, 3.5),
-		(9.5, 8.5)
-	]
-}
-
-JESUS = {
-	"Width" : 12,
-	"Height" : 12,
-	
-	"Background" : "#B5A7B7",
-	"TreasurePoints" : [(6, 6)],
-	
-	"Images" : [
-		(6, 6, 10, 1)
-	]
-}
-
-HAND = {
-	"Width" : 12,
-	"Height" : 12,
-	
-	"Background" : "#B5A7B7",
-	
-	"Images" : [
-		(6, 6, 10, 2)
-	]
-}
-
-RAW_IMAGE_DATA = {
-	1 : "R0lGODlhHQA7AHAAACH5BAEAAAIALAAAAAAdADsAgdnWWwAAAAAAAAAAAAKbhC2py62HHpxOnjVpFTpluHGg9YWd+AHm6KXqlqIlXLpvFdtrJvNhe9H9esPhqeiwKW+YpSvpjDWiUgZ1Zr0ecc8tNMfa1arTLjkLxpbTvu9YjYZ7gfJwvE1n3o/zHt/edNYnhESCV0hY6AdYlIj4pJjXJ3aI5GgJGXnZmKm4adT5eIY5ylkKevrzqRpKCudaafoqG4s6a1ubUAAAOw==",
-
-	2 : "R0lGODlhFwJiAnAAACH5BAEAAP8ALAAAAAAXAmIChwAAAP///+/v7/f39+bm5gAIABAQCFpSUhkZGd7e3kI6OiEhIQgACCkxMVJKUikpKaWcpbWtrSEQIc7WzjE6Or21vWtzc8XFxYSMhEpKQqWtrWNjWs7OzmNrY4SEe3t7c4RzhJSUlJycnAAACCkhMXtrcxAICGNSY2tjcykZIUI6SjExOlIZShkIGUIxIcWEjIS9UoS9GYS9jEK9veaE70LvUkLvGa2E70LvjOaExa2Exebvc7Xvc0J7Wvfe72NjawgAAObmrYS9vYTvUoTvGYTvjFIQGeYZzuYZhK0Zzq0ZhEJztbXmtRBjjELvvRAhjBCljBBjWhAhWhClWhBjvRAhvRClvd69rYTvvRDmjBDmWhDmveZKzuZKhK1Kzq1KhEJz5kJCzkJChHNztUIQzkIQhM4QUoQQUs4QGYQQGRBj7xAh7xCl7zqEOkJzhDqEEOYZ7+YZpa0Z760ZpUKUtff3/zEZSubm7xAQIea9OrW9OpS97zq97+a9ELW9EHNz5nNCznNChHMQznMQhOa9Y7W9Y3tjUhkQCBDm76VrUs6UUhDmEM5CUoRCUoSUUhBzEM5CGYRCGYSUGc6UGRCtEM5rUoRrGc5rGcW95uZK7+ZKpa1K761KpUKU5kJC70JCpXOUtUIQ70IQpe8QUqUQUu8QGaUQGVK9UlK9GVK9jDG9UjG9GTG9jN7e5lqEOu+UjEKUhN7F5lqEEDpSGe9zjISEjBA6EObvOrXvOpTv7zrv72u97+bvELXvEHOU5nNC73NCpXMQ73MQpea9hLW9hO+UUhDmMe9CUqVCUqWUUhBzMe9CGaVCGaWUGe+UGRCtMe9rUqVrGe9rGRA6McXm5t7FzlpSGWvv75R7lAgQGSEZKTE6QgAIEDpKUpx7e1I6Uko6Oubv9869zhAAUhAACBAAxVJKQubmzmuMe1JSWq21vbXFrWOEWjpKQgAQCJychCkxGd7v5rXFxTExSs7mzt7m3vf///f35vf/7ykpEO/m3ubm3v/39+/35u/v3gAAAAj/AGuR0EZigbaDBxcoXMjQ4AIS/yJKnDhRRQqHDTMu1KZQWzqKE0mQSMFRo8kUJB6UAClx5MUUFxXGNMkRIst/JQjKXHDRZkQQIx2WfODAwYF0K28qpahAJMenJJIu/XdiIMmrKK8eJElQgYMMRqeKdZA1IUKEHdMidCA2Ys+YTxmWFGrwgVIUWrVxTWhS5gqlKkYW3IjwgVmhB9neDDqT4cuGfH8oFWwwYeO4GR2kO8FZKVm9GWfC5MkTpjYVE6uO1Gv2rGu9I/+2pQiCAYMRI2wzAGI7N24AuHPrZjB7wW7gyG8DWL58BAAGy20DUKDURHIgz5lD3/4c+nIgkm/q//YNgHf28tm52651E8X229KJSyzRfTjvFQpUKDgxWymC4dIBwN9YwwkH4IHarKAgdf2xpEBy0THXnHMR8saAXWLVklt62QU3oXDRjaDUCb2VaOJzzqWYXQuT6dZdhMx5SCF0srFkwonn5ZgiEMIpxtKBwKVI4YTIObeCAyqApdQK9T3HY3Tv7QZgjf84cCCAHRYJH4sN/gQddhKGGSRyEs4mgZhopjlddV+q6WZ4P3oXJphq4nYXmdrJF1EJysm5HH76DdjlRAj8JiEDG7Rl5W/eSYnmhQsyOKhEK/gp5pBDMofhVLXQmWamzW2n1AG9xZgmdnSOwCVLDwTo5qNUUv9UqphgegqmcwcoNVxzr4a5QgbgFLUknX5SCKp2m1ZZ4rFujmDApLVBN+StjALXJm8WfAACCOxNhE0t4P7Xa5baSQqSpeNqB+e5OaLXK293ofvcRHxySGF+Cuw36UR4mAqmoCChIPAPlaoXYYrw2ZaCgvjtS+mGbsrLwALc1gICbRaD8AOt5Y3AI3bcGSviRNxuq4Kcv3mIHqroQbcqSCRAnC5zQMQ60Xjo1ormCLmKVyCzaGKX3zcq+PhTyQ/AqDKZ2/HG2wjJLlrkmMwKaQAIHmzbHwgwuttmxNulMBEKCCCQQgvkPEqnzjSveZMJKacp73LrygrfeZ6KeRwD3Qb/7GKY9Pb53XP55veRw//8h26iPgPheIgJvxjmCAswDA7i/1QacdeHlo1ACxZM1MKuYTbK4XbC5SYrOVJiZ6ixe7dcnsuTmTczyAzYLJFybhIbZs9xAgi03r+qYI7RfNoGMpRSAukcd0Akm4G0U5vK66XdGb1UbcZqh4K2IJSgAH4rIIDq49AtMLYEh5R93JwrlKAt+OBvu23f7KLpwAf8W2DAoyhQivxA8AEFOM1dpaNACewXr0fRy2PoWoF+9IU4BKQJYLKyXXJ+ML9t1c9+H8CGRESIuIKJaQEWICAIkoYmE7TAc1L5x40Q+JwMqPCD28qa/Rg4EdbtxlPGQkC2/3a4w/pNRmaaGqK2ssZErHFLV9khlgJKID8LyItnAiSitkrwn2M1YIAfUAr3OpacFM7vjB5U4bZKgD8HtAtNCuTfBxYgoScxADU3GZ+CTlAbPIGMIhlIUgZSkCYETOQHEmgB++aWAczBbXIAiGELmFW3m1iJhmLSXnvUFDiasaxwCjicwyyIJsb9iFn4w9xsVpC35TRgIpoTkwkMgID2STJNleyS8h7XSkMijgStBIDuGsS7621AA8iEwNw0KRZtdI855hIgs/S0r0u+ymjORNM32GQbBYwxTCagyDfMkSQ65o0BvozIBtgnAXHprZGIs86lYvg/UIGnLQdwnD7TxP9Mv6FrZHvyjq0ApQDg7atQaMLgRN44L1V2iZV5A8IrJaKAf6LzEC+M4SPryIBcElOfwQRAOvf1APJIaJj9uU2mcHOCCEAgAhqQFxD6uRRxsWw50bxJH+vYUIdZaW7MMdoCjsUAeNpIN96kHs2o+Y8MZMAc3yAkmkb6gxQcgn1pQ5NR9+UqXoVOIjMUk0cpYqWQBrUtKAgmQHFSgLaBqXAqEOVB02TKczHLoQ8N5kQjogBmmcBzh7jlscY6m11icjkjnRQw0YTSwq50OcfUAASUmSaDmmlDnsopS0rgV8y5sVdy1caj8HjUbn7zUOL8hlMX8LgwqU8iJ2Cn+fQGAJr/zkaePI1hNvD0HcJKJJ8/DKltJYICuT2Qp+UhqGUH5c4wKXR38sJrg1hJQ4lOpKLoYkAL2ocAjertnogLbkgTO6iSWqpmmFPpoUZwgpdqIAJyGy5LmhsjzYIEBNP07PvUJNehgqqoSmFdbpLaSqY+1XhSFRNVrWpViT3gBwObVDF5pQII/+AHuA2TbyNCqtbyE60S24DAOpCBwZk4X/qR66RIKaa62o1WB7CAwGZMYxRAWLqZ8zBz9po5i3rOALdEkwIuPDAboyCGSzFsmgxwYQinsi0kkNcCRGxj+1mssGmiQJN/MLfligWhYrIvRThLKwacwMI2bvJsPtssbI62/zq+SSoSexoRBxBtkJhE50TW6bmQsgwIk8owT1vbSvBOBbhsC5OK2wNUd9kqOvjJj5cbVKhWPjciAWqlPWdXnic7jLql43EsJVQABrQvoxMR9JzKo8+JFRakJr4eqkjbHxKg6FBte0DhLtcWlWaqUY2edE3lJWaS7ZdjjvthAAnUaAD0l6hbpYgJQJZUvTHVAeBwaoLDNFIUsO+qWVXTbQINqh01e8P/6PCqtSPff6TVz8g9Mb4W3SUWh8nFsCTfbFeNKlAdgIoLxBxExcTjikISnbXsbqqBVmix9Xq/mg4RrWdT0lddaIITVwpvZ7acdlNEApsutkS4huxYP2fZU/9hs5tCS9SMg1U61baUgVX7Ddaiq9tXdd+4PD0VVX9neL3Fp/JMzhx6B2zOP18ZcnM3QaP3p1DouvQ/JqgAOj4K19FxAI0FXmhRy/SFZQvyqUr3WrGIt07fcflUolzo2QGBBPhSO7uqdutHCds/xwaOyH8yvN1sqDdItuSE0WRQq5cu2qnejpz1Rlbj4RlN2jgk+2pJDj9viNyTu42F3iR0Xn5YLGkVN3fWDVeP+4euSgEXuKypnBmlSdeFE3iaqGRwWSY8sKl+VNwSVvapKBmTMxqB3CdzvdLZ5gHg0M/wb9b3azKXWXv/B8lLhyIA8SbwLFE5fyeSzdLJnRz3ihb/b5k6znLqeDm93wACJh/SFjSAYYFO08JW8P5TodsBTks0cpw+NkfVkf70x1prA2n4cndtYVPO1RYEwzAkwDBMIi8P0AAP0DAlNHjWRVGGcihg1wJhJBEtkCYL8H4OqCAeN3Q3JSEmsAINuAIoV2tdBRwG4IAOwBmd0WsbJ1IAyCQ7Y4DzpVSK1xacVWDvN4QPMIErcDEEAnQAUHgtpyuKt1OlQ1ZOZQ7bJiG9hwLbtX4nyByI1yVhJSEjEEOHQCGegm4dpn8p0m6hx3jzwTHTgWKmdxP2JiH41iVqYoQuEH1LoYNiQnvTdHsa9VgAgG5J9j7BRF5dAkyt1Fi9xixy/9VlgwJy1gMAvDYV0weGTDUo2scxLPdOcAYdciZzFKECd2YcrRR5EmEI7dQ+wXRHjgRJQPBVEeFzhrYU+PdDRFdbIOZAEvEBN1UrEpQv/HeASCd1s8Es0TOBcCdw2VVwf4gAtKRRwUSIurJPrMZtmGNe8JNeGcgcdRVfzNUuoAiEEqNfvWJQogVJcjdDDFBtbCgRX2EOj3dCh1RL7GMdrdSFDbJRYEhPRGeGuIg9I6CGhUZNQbhqcMWDUzGH3pher7cCLkCBnxY0fvgoCQc6C0cr1HgTtjNemKOIfeiQpXQzlRWJrscclbg9O5OJXeJGQIUdz+aJNzFJzuFNG/Jro/9ITg7AWlM1EarIXYU2U6+IJtJIKy04KrskXCCWXRPxAWqiXJijOGJijG1BNe4yf7rGjF40EdsweM8BdgoHVuc3iA7peWAoUh/pMaCih7rSjcDxjcwShxHRRbzCG9F3kHjDkg1iTW5SeG/2NmpZbaASThMRSIFUhczRe4hkj2MJAPrYH/wYKoFIQyNwlDdxhm6ihuU4HzIFSlT5ZagXXsW3HBMYkWx5E3zoKbQnN2WzXZLELJ/pe2b1HIjYICB5KIxodsxSV5BYb9DXFpf4c4TpU7PJG0bDQoenFB+4GzbpMbJ0Jb5jhalxVayoe1dyIOsYTLcUUQBplpkEYkTVlJ9REncKOWxR54TXqRvyZCxg8gARmZUVKDc4A0kuhFFhOYucdijpmZ4UAWuHmI0vyDzQaRsopVR0SJLHUp6EUix2SY4DGCH7CSDk4BPK0mz14ZXO/+FxtWCgyWGhnoMAPFYCLuCeD+BzMRIcRCVmkYkc9CQvlskSmKkmagh8BklUbyiMURmap/Q8vbE02pEpEqQC4GAOssdQuDErK2UCRViESOgW2uA5xheg1iYrbaM3ePCRh/UlIYUbBbqbJKk/kRgyKAmcHypP3tGNzyOgtkGhmzgn8fE3iOU5wgYCFlACKSR+rVdHzvkoCmCYBgUCRVEUJrpuYVYdG8cAsvgPH3gwz3F/x/E4PqqZSEcvDJU7+BKbSzE60qEiUicdZoUwzAMA5nBhJ/Ci01Ut1CMzIiMdCGAUwjIRX1E0D4I6Zykjx2I3hIZrtemCgvNrL/I16OUzEP8CHACDoirCAHKZOH7yNHr4DeVnQWfaMs5hHk9yKL33U9SDMtbza0miAiqAfZgWHYLJOUT3Q9DxRDwXERLgd2TyZyyTpjilnN0THJLkIr5Ri55ReeiDHsaimdYChk2JWZ6EYiqAqXj3r8/TqdXnG/OZMM+TG6Y6KZpjoPNafM7xAOn6D+yBAn+HIm5pKc+Dq7gYMnr2S13VOqOHOrrBY1SqHrzBmyjCI8oxjCyxrs3THXpoMRbTKhf6d8syNbfBppuaHpuaMg/7HCYALk/UlqAIAjfiItKiso4yHMM5Fa2yK+LVJkLSHXI3OpunUjGkOFDbUUJnrjgjJQrpHj4LHFX/mzx3Q4D5YbA3oQ0Hkhtj9TfvkTpnmzBNqkrYZSAG4rAoqhu5KX1j2yQcdTe2IW0+dEAAgooOg12HCzlvqzwoNTqnIyCigyW2oaASkQIHwhvLxxIF8z5+VyCoe3ywan0Bcp2ctqvSphuji2O0W7u2e7u4m7u6u7u827u++7vAG7zCO7zEW7zGe7zIm7zKu7zM27zO+7zQG73SO73UW73We73Ym73au73c273e+73gG77iO77kW77me77om77qu77s277u+77wG7/yO7/0W7/2e7/4m7/6u7/827/++78AHMACPMAEXMAGfMAInMAKvMAM3MAO/MAQHMESPMEUXMEWFHzBGJzBGrzBHNzBHvzBIBzCIjzC/yRcwiZ8wiicwiq8wizcwi78wjAcwzI8wzRcwzasvjt0w7OxdTrcw7SbDg5wPODqwxHxABfxABFLxEo8G/qhIEnsw03juUs8xRSlghTkwNhFDi8jvHYkxVQ8xSpgmk9cwKWrl76bMjT7xWr8D3p0xQ1cxsZbJGm8xix8AoHqcSwAkSwIwQ5QhCJhvIwyx3SswqCbG1usFOMzPnILwCjwDXaWrLTLqYN8w3SLG8/SFhA5PmOsw30iyJN8woZ3yWKhRySwyDPMHZ78ySVcyc6ySnmoAJt8w5vqxarswUpbCyxmAHVKRemqRysAMLUAcMLMRoMSzMO8QH27FMJMGwCXzP8UoXrhI8zhEz44Fs1UNBvHDHCqhMr0ks1DvD3enLE65c3DrErkXMvDWwKRtgI3EhzD4U08VMV5uC5lbCCnyVd1CwAUWoi2ATDGYRuHLBHfkMhl7EIv1ALi3CCSW7WZ2qMqxQCx7ITLYVA2WyC62CWsDCD3PHXjgaJTowJGFst2DMQnYyK6gc7Cq85N4QLhZi2mtUZMQQIRCTAl5RsMu9GVoiKzYwLdakPoeXGGGbUBHRErIAGJ1AJI/TkmsNQMkLTSxSTBoRQ/4K3eql5Hahvf3Ig1xB7sMTrCYSHIOiiaaqwjgADrvEo9+qN3swBFmALJshSscREH3UXCgdLBWwL/dgAO4zNtwGYb3xrPfKXH63K1B4LT+9kdEeuyb3obuwq6FgITcg3WCd0fmqM6eWS61xnR4oEcUwRwmnogHrdGICC2PtTR64HJ6sUN7lwi9UEOhTUcPKEXpG3XxZuOACDKU+HLKeBDLdC3RRFIDdACBoDUzuwltmECploLEhKxHekkZkwRJIDULZAsJJJsOAbVwIHI74G7fQIgFCHdLbACB3AAYdEepd1AzoHWtzHUbCwcDF2N5fHWOUzbw+tMt4HbSzE+EUm3uuHbgYpdS92BILGh0pHY32Hg0XEjS71KC9BOFPoDh7DUJlDc+1LZZjxq3J0cJkAO5MDQ7bR+R+LIGzTlHifdHn/nAaiNG+9NUSUyGwiw1NNNEVmjLf/0PbyGlw2z4ctF3U4SwHP0IbMUXgsChqga5x3MrU/tRiIMwOFrBldFurh5FCPcvR0rsAFnNlZKDuUswWVPcxc+JEz4sk2LYR4rHhEl3dQ49uJLDbk1rrtDxSP4vSR5SAIZcAA0qBROuR3gSuDLkagtCwDMHR0KmeXPfV1GjRKyd6SInBxTXpO14AHfMiKNIukh6xmB+gALsc+wJC1lThUOKEB3PBt4oBu91+a4a9s4jsl6vMkfYK57XiJDTCeBDh11CBKkUuJiYWu4XuFRuySTfrulksYkgiJSvakUpxvszUq30ek4oc2CJypt8dkSYOq7+8+t3BZ69GDAiTt7/jT/tUVE9qO2jnPk5RGb6ZAb4w7u6r6uAMANzI7JQWLGD9Ic+eGtppxk6C7sdhQvlZ7rYJLsvvHuv0XeB9CC31AfA6TuOwQ3uAG71O5QqL5KehybeX59N7GhszNkJ2DlP8AZG4B/yJHYqFLrFDHstuEAVr4BHa/yKX9mG7CcWs7r3aHdupENLhSDOBbsbWHya0UR7sEjPa8USUM7qEnmEj8+BnVJ/XxmG+/xTm/lBtAb0/7wuDtUSDsb4LAgmwwC3C7RF7qfgY4dsXkATvL16cmwAj8V2G3G6UACDdAAUWYb5PDW3Jgbwh4gxd7va9cbnV4wI5D2/2DUimQuBx+1YH2d/0NSslRvu1YPAKk+yhBpBxTfMgL+zHIi4S6U+S503CYwxI9K8hNBKtmB+S2A+S6UDaNT+jfC3mhtLSPigE29pjmvUrHJ8/EC7WJRcQDA3mz397ORAkYtAebiAEeqKqYv4apf+qrPAJq++HhlHGyb45mMblzfHZ4PJprNEudh7ukRvGu/SiJhxMOR/XY1AgVw995x+9kNZcqR7Hw/GymhgkbzU3Tm/LXNHI+f2wtC8e9B4QDxjwEAAAws/EOYUOFChgiBAADCYENDhicKMgBCUeNGjgpXMADJoCPCEiVLOBg4YgSKkRsZjCh4YuQJjAU1/kgpciQJiABaaFzxEICJlv8ODnw7IDOhAwAqdbaEGlXqVKpVrV7FmlWrwgUqRxAdCW6FixUsO5YAOYJBCYq1XhJkexUkRKUcD9R8unVkUJh5W4IYWPCg3MB1N9IMfBPkw5YPCDIA2/Djy8gcTZYAoRDlQ796PX8GHVr0aK1dC/4cqWDFCgWGNYK4aLCt2oJxrT58+GPm4oykJQ8EORVEgaYAzFqdyyDdboIjNKLAu9EkCgQRfQIFXnnhSQfdNTqIGNH3ePLlzZ+Hqk3l9dQuSCg4vhH2S262F4JYP2IwctyuKSLGqBb0gnqps44AI8g4rCIayL+GaHrIOYpwSuy77g4gAQEDWlgAu6a0U+gEEkb/XEGjExBoAQEE0GOxRRdfLO0iA1pSbQVwHGTog5zsU6iW4tbCKjAAJuoIsYI2+KCkzMb76KKpPBAyPqqSw3Ehmh57TigDEUKBHAa8XJKjoJykSIWQQCxTARUUcABGN9+E80VtAkOtIwXIckFKigALiceEEBxIT6kwAqlKhUoY8QESHDihUUP1WqEgtYRLEID9qqINgOWKFPK5gR4Kc7uQgPBgr5TQREiBM1tabTUV4oQ1Vlk/S6EgIGZMjQTWHkUIvz73jI1XjmoCQNiFUlgMV9+aDE4qKB8TNCrgGBD2yqY8Be4EFErYViEUrANCwI5WIOdDjcxUa0uG8EphVnff/4V3JAdqfI81BfxMyAVw3ov2vgIZCHW7Eiw4qVV7FUA4YQUCVgg3IIiMas6QFKbYs8km/U9NihVwjCAg+m0pJE2ZI0i6JEvgmIQU3lON408BEFfMl9RSYRuEVVgTYQTSQnXdkLJJOGfVXo23aKPf/KE7B8zxEqQ2KaqxtZH4BAlfhlQlNKS3QupXZGMVIiGkprV2KuasxoRMI6xnDkktIB4CeaStq9W6JQm0/jdrBsxWGyOnJG3bK5B6XsgErZvyyikJj2a88RazPkCjbyb/xur7UliZBL7LbMGEzpNDwFFDVX5ggbg5cgvvkDa3yoEFSHhd7Rbw9vIBz7RZeQHdOrJCofQFOtyphRY2TK5EqT7qizWbww7p64YsmFktwR2nvvrxUpAAAQmq/KHRDRguE2cFWK9I0QcwR2ABBB4oIckPNspZBfCjwl57BLBfQBvPflgT5++0URnuJDBAom1FfPIbSQn6V0COqOAB5rPfAp4WFb6AJB0nOEA6vrGA7EngfVfRhjY6OEAE6M96J0RhClW4whSuACZfYWEMZThDGtaQhhcjnA11uEMe9tCHoUEeA7LxkUMiFtGIR0TiQhQgqRwm0YlPhGIUZ4VDKVbRilfE4nmYNcQsdtGLXwQjq5gYRjKW0YxYJNfgzrhGNrbRhyUQnRvlOEc61tGOd8RjHvW4Rz720Y9/BGQgBTlIQhbSkIdEZCIVuUhGNtKRj4RkJCU5SUpW0pKXxGQmNblJTnbSk58EZShFOUpSltKUp0RlKlW5SlawttKVr4RlLGU5S1rW0pa3xGUudblLXvbSl78EZjCFOUxiFtOYx0RmMpW5TGY205nPhGY0pTlNalbTmtfEZja1uU1uWgUEtajFN8VJvm6W84TgDOfa8IYAghHMnO/sVUm2BQJ6zg9O4FBBBlSwgMMlyAQ3Wxg8zemA1TRATfpUwe5kRbXkVKo5DOCG4SAmUGvWwgH5dIAETLDRFKkIAfcyiZsumk8KXER6zXEoAAqglk3/UdSaJcCdyoADE8SNYAHpwGlLXaSy/O0sMIEZARBoM1SCRM6l1qSQpCpF05cwCGAvqoXhHlMpA3g0fb9TX6UycFRrnoCmQxUSTX+kUPOA4AMgKEELKgWZgSygAQ9ogEEV0A4FlDRBC/MAPbnaTNG50J8GMIE7DLDUx3xlcHUijZlE9kITPPCBIhDAAAYgAHsMIAAB4EBgCsAAj0pgr8w02M4SlA4LfMACFujADzbwgyUmCG/kUazICrIACGhAAxBIAD/4IdnLXpYDm2WrASDTxM/+MnspMoFYQ1ABdVSgAhAQAXR/4FDibJY8rZ0qAwpAAQF0l7e9Be8EDDBe4UKk/1nFRaYJvGQ4BrijvRXobnzjqwEKUKCuBugLABCqgtNFpVEZXEBzRpABBxDYAr21B3gVnAC4PrA6WEIvMtfp0QsouLcXOMEG0rEBBFTKsQ/QaVYU9mCClPa0IbBwihOQMAoEOEIRljBwGpBaC/ygHim+rGQlG6mUMkABegGBemX7EALwlh84VjABNrDkDTRASzA+ptbGhwEqEwDJdRgAljOw0Y1WynhaSd2otAsEAdQhAGZGMngJgIIf/KADkRIKlI05lyElYAIJ4IBl03zZDfyudEL6clYQVIACkHejAtizhQnggQ8wGrsAkHMxCQWEH8hXz3vmwAU0XYFPQcZgWP/5gHUMEoHmRiDRFhZACFQdggw8OdLDpLMFdvvdRNfB1pPVbl+4bAJ7jgQ6BQEAZL17agULILoiEAFTevJqWMMECAcmdooHYDjgZu2D/lXaEoUCgWinWAAQAHeyXctsYabFUkfuNngHoD4VDTZBllNby/iZIG6nG7zfvq0GDlApcgfzLc9Gs70va9oPfAA8zTnAWfU6ks8drgD1FngABBCBCGggAvuGcL99mRb9RLy3Fa/4B1yrAJwmpSXsZUBVPaoBj0vctrfFeMk0vvFPQdvj8oVAgoCwPvOdXHot0BgFKtByYyNbBBkY98x7WSBLtVzBGvCYSk0QUeL+I7ltrUV3CDBQiwm0nABUxkAIHq30pQPH5k7nhwYKAATiuLbqUh3BA8Bd2wQQvRYeuDt21UX2WZr77E6vwArsSwF32+Q1/wBnSgCgAB0PAN0RX3MHLIACu8qc77mcy7OdDt4LLHnDHSYI4TBTkk+NgPGzTrDHlbyBDmwAzob/vzwuo/f3lg9gArfngN7Jx798mqnt7dh8bxNwAKMcoGPXir3sA0N7j082vkhPkNLSQdYTmO8BNQGCAoJ/2QRkoB0ZyECAM578Ws6s6dvvrZYfw4APT/AfDmhB9nxKHO1vf8VqogDoLU9+Ws6l4+gHL6QjtHSJqECLrZQbrgxAvwR4K7gCPYzhv/4rDuaLuAEggAskAOgDiZUqCNtJCKwhCA0xgGxQwO2bgNIpnQ4DCW6IwPLrCwoUuAoYPAXAL0ITEgZoAI9oKgCIq7jaAPSbgPRJn6oirxaUwBEoABi0t85LhwPYgBZDQWDjQR0Uiu4gsA9YQKtSkWxIESPsuxdS/8J0uwPnci4RWLUQmBYPRIggCrbo0oChM8HAGq+r+h0vlCUhCcN0k68LeDkIMIHHUMN/+AjOuLMESIB9cLrG+625QIBPs0NYCgzNA8ALoziKE5JAHJOIiKxhIzrnqwDh2qwFuBkGekRWeovze7ztawXcy6zmMIBWUQC1sg5E274MoADB4zGCWIEN8J5SfKVI7IDIorXgIwBDNMSf4iyskiqCuDSBEwACeMY7WAAiLDwAoAA2Q4H+8sVQOsUOuMB9KDL06647uAMC0C4Bmyq3YYBmtDcOMDoRqEatYrRv2sZWEpIN4IB8nAB2rD35EpKUqhR+7DYOeDkNiMfoq0dIpPUpByDDCKDF4MMyHftHgGTGlpuACogAjMQvgAyxhFQlIVkAJtuAupvEAJg2gASCbLAqgYy2CqiFRnMLinQej/SkU5QgB0gHByDJkpzIBKHDBWBJYouAggMBCzhIguhImjwlOuMG8jKACivJAOhJmCC5DEuHoDy1WvgwiiwWpWQlw4motAAJqJzEATjHlEqHRjOrgBO4D7AqilQOr1wl3PmdbFCpgiDLSezJgvgAUsNIp4Me2UqpAkhKuRwlhNmGFQiwwOCAqJRKirQAi7MtrEw0CyCItgPIEZhJw8QknDyAA2iASslLANxL44gu6GJLe7MALeHKwv/kTFCqJxDIACFpzJIcAOGSrYFYAQLLgKtsORTgykrZzNfEJIsSq9HcvjowAHcIrD/0GIP6PsZrOcsMzqZwTeIMpR8QCgCoAOejzHR7oAV4gA6jKcPZqGx4SIEDzursSuxEpR8Qqwq4QAG4AwDMAI0JzQRxL26AjO9MMTPjB+oMzhG4Tvf0JJzwCg0wxp3cvDowrdJStqlKEP9UsMbTTvYcTgOlJPikqVqgOIsDQDJUBw/YTodKT2JrvA5gzwLIUA2VpAuFiQ8wwxAQAQBc0BAQK4ei0HuLr+mqzhGYKBfNzvUAABXIoA0DQB0LgAjgyhNNNH4gR/pUUa6kqRYV0kf/wgnEOZgSLMkKkEIdjUgUJQBwTIANqM6BCNIr9SQUINItTJ+otAcvzcwiU9JEGwBNuwAOSAeuZCtqUVNRQoHz3CjyQoDU3D45BUh5wNPa3DMC+IBw+gAKKFHXsiqy+tNOKgE88ChuaArIcExEdagRgMlagLg0yyxzy1F/eqC4upRL5SQQuMXVcM6hSL1JjIBqcyjxyYA8DIAEMAqj0D+HMgAC645ec9VKAgGcwZnkUgkT+FQTWM5lhIi4Wo0fTLQEcDPVOj6HyoacSgdyOlZL2pZsvJtmNdTguwAFsBkFsEt/4jIuTbMytcptrRQEmCd4C1dkBYG8QgCvcNao5ADP0OuzUG2K+tuz4WvCAxC/lEKAvAqnfBWlsIEJE7C1VAy+Vgg3CMhFhzLYeFUa16HIFYFYUiIBf93E7hJHPE1XimS8Ou2tZySAO0jXwevXlNq5kSXZlDAADIRG9LPAC2yFDEhVglAASwMvO7OzCPiw8kop4MHZUGIemGiz1apRcZysAYhQh1oAdOI6HOMAq5pVrX3aiE2ODTuBdEAxn5UsAXAAzKyUBfAADPAAD2BUBftaj9rIph1bqNUarFoALIzKrK0UE9AGrDI1FftMnKLXBHH/2r3tpBVogWwwgWwYQQ1BAcfcU4BMOcrNBpZTsTZLrcVtisZ13E1SAG0ooXkjCGstScEdWgAo1aMtLdMSXQAg3dLNJIJqlQQBUseMOYKlNxxLABSoMRTIT5QaXdztpBOwQgfIFNadxMwNzgKoWgsr09TqgNq9XeW1pHCiJ+hJEOgFwN+lSP2ordqCxu7iAH0isIV1LQBoF+7dpLujJ94VX/ST3tIEgA44XwXFwAvIp/s0jVDdXvnFpEq53+0jX4r8AJXVkGw4BMmFqORaK/YKRAPWJKBK4JuLr6x93RGoBQ6YgHwcGOI9AFwdXMptgQvG4AMO33MVuAFIgGL0VfYE/4AQiFmeBccIeF0AsKpAa2FMEpJ04NkdVTAsS4B9LbjadagfoFFkE8Y7hUvxJIEHIMUgtiTgAACdFOEE8E8lrQP5qoDmrdnq3FXiLYFL4wCuhEX3w2JL+ioFyFgCONdnNMYIoFFVW4EeDLAXAt6mXY36esgL4EonzDBtfONFikQKOEMr662YteOMdK4QIMoPQMHSseG14rkHolMBIGSK3IBsRIFrS+RKyq+QzCB8jMhUW7UfEMIFoGBbyWS43LU8vb2cQ8nMAKdSFmKaMoBVfYAPULWsA7984hjHGqyv2k795dOVYgBJroAQ4Epe3qQNTI6XcKu4eoCv+qg9XoF2/edHZmbmBDlNCPAAuKRmTWIvEwCuzfqA/k2tbE2t1XLfWbbhCsi0CxCBaU5nTJJcyqU2kAgBPHVJKru7giu4el4rhxpnh7qA20sAqMvMfsYk+VORiyiA7uSt1Au4OuAHwbXn6nTkALiASS0Oir4k81EfJCwIDMBIilvQmN4ythJWFR7B8VLhdmvS3uKAXVsqlLak3uOY7bSqrd26rEM2GlUAqxIr9vuwD0uYbWiA0qRFfrhbFYnlvQPqRWoUnFqihUSBDiDenCQ+J2QyCgjPB1iyDLMA6EK2uQO3gjxnihQAdOOAyB1B8zz/r62OJDZrMwUQqw/INwiggAYo7Pq6RdVogNVQgCcOgQhIX/mS7InjyjvQsQvQrsExnBHk60uyiBeqAN3qLT3TrSMz7SOzLDPDsv9UMESdSA6443p9oCrubEs6AeKACeQsSczWXFvmAAgQkk1m4dp+pBIoDu502d2GDNyslB+YPAuQXgBYgTgi7kky7gSJgMZzzAtAAMpFALdVmAfAzAwYmIGp7kmCDuBwSPp00u3jbmUE3n9cDnA9b0W6boLwUIpTB4u1P9Vqs3rmDIdK0/oubnD5gazLOsdMgKwLu43lSksl8OKOut28Twcw4m6TL4xjZgiP8EaCDqFYAV11TImL7a/opkhK63BJuu9b0RAVuXCBM1P25PAUVyTg1JKpg1YYBkAfrc4Zp3FEQov88icdR78Y7/Eff6T1nEgTePFTw7faWqK9FKqIQGQk/yO0kNDHqFUbbbS5pQC9DlWhUhArZyTgDCqGbvJEu4DS0YYHWIF2MOZ/pDYTqHIy56N9M2mKBdgmbEJepDHqai8G8HE796NvuKgMqF0md8zGo2E7Az0t1q5BJ3Q+SgGsagGTLogtL8szW9vIytsmnvRC6pyNKs11HHEca1eGlvRQz6OQ4AZML4hTx7GjBIBVZ/U7eom1S7mb1ixTl3UFUyuAtP/1W68jOgvJDDsR1/p1C6P1AiV2OxKSBri7WsCAhfX1Zb+swvtHB9jlZ+8jIcmAfL6A41V0bM/21wWpkvD2PdqaA4jsylvH5D51BPDpBGmAj113PVK8DZAs3cIuJk9tbN/CEXxbgMr3Vqcp1rUHvcvTfGTQEV8Bx1rM0JPcDTl4PNp38NI757oAfF52BXirt6rgya26i/cicDrnhNf4BCmAEMi6x/74BttWp9hrkz8jtNqWLF3dlX8MgmvrZW+HiI94dLZ5NkKBkou53u2tRzPbDUhbWUcYw2biomejeWGNjd2AgAPsu1JXBQBcWbfFqId1ql+jb0iUbS4O6FWBagv/+Qbg1c3zPoRxcH4jezNaAUEVzgCEDOZstxbY4EkssO+rvJSqezMiARxnr6ZQe+HC8Zv+e/Szh3RYE1vk58IPo7ApDs49hB8IwAdWQYJwgGXfAOJLh0dzKMsnI564iOJDW/AyOKURktD/dWqPWwF1qHBBfTDCfMEwrRKoUR0LgdM6rUqRfVm/LWSb65QaAWPN/Se6vnTxywio25e+rdhf9gWVaIAM5TbD1+Y3orDhjHzMUwbNtAroeMws/lN/xmf0UpMeAc88gGH3fh+SWMgw2pfFwASwfnMnaTYGCAUCHfwraPAgwoQKFzJs6PAhxIgSJ1KsaPEixowaN3Ls6PEjWsiLJIAAYGBCwICUAwKwDDBAAEwCDADQdNDyJs6cOnfu5EDzJ9AHK4aqCGn0KNKkSpcyber0KVSQJEoCMKEy5c4BBWgWsMnzK9ivF36OAApgwYMFCxREbev2Lf/cuHLn0mVaC0StWhJIVp2QIMEEAlln1rwa9nBYnwxmEgYwIpsBPC0a1K1s+TLmzJo3SwThGQSCsgCyieNgOkHWrYVVIm7d0wSDAgxE0zQB2cADzrp38+7t+/dEECpUZFBhgCTJFQ2Gehj8M8MdAgLuuK5+k0OD5Q0QAB3BmATw8OLHky/vFMTQoSYA8F3hgrlzxxn+/l1pvXoCB/ozLDDL/qx5AQo4IIEFGlSCNggouFhtH1jwwQcaxAeAAhdYeIEA91UngAgiQACBAmYxtoCBJZp4Iop0oYBACy0gMBMQskVQAY0c7FSHagCsoEEEPAqmYWsJbDDkBg/4R5M2KSr/uSSTTXKEQjYmGGBCASQxYMBhAzT2QAh51YIakIhxYBtstNGEHIlOqrkmm2yisNhi2SiIwAJZNoYAkRvYGOZhd4TQYQgKlNUYTWm2eSiiiQr4w2xbzUmnnTQxgEA66ei3J59gCVDBjBWkAxSMACo6KqmlcvZDWSOMoMABlW6QpYKQPYpABZlWZ4FZfBlqKq+9+goVoz+lY0EHP1iAGAIGuGhANocYYECttraGwk+E7vorttlquxGqP1kgwp8iZLnAo46VFa20PF3VwZEAILAtvPHK+1CwNGXQ6gEb1BFWHQKpoMADoaLbGgEFE8CBhx+CqdNVP/BlFgJezjsxxdt2/1voAxlTkOUG6bQa4k8Di2kaBxX80EGxF6irErv+AYEAhJ5VPDPNpJ4gGhAOdDDkDwZLxxMGQWPwA1Ai7xSBB7V4AEIDGT/QQAb6OaBBwQIQwGkEEUBggQUlWLACEITSZMAB+NZSM9ppO/npTz8k7QEGCRScQIY7QdChCESHfCNMMIWwwQ8/bLBCWkJFnUEGIZB8QZchdBm1A/wdOYIBwxUHgtqZaz7gZx84IBoDKqtEAH1163RBBRZ6UPROCSidtAMKZKCACn79FQHixAUMmwHt+k6Ts8pusDnxxQN3QuAnUDAbAAVAYLvc0cHEE8kc1AJUBDf55VcFS3uQ9Aevy9pNujpPP40AlQz+fiQDUUp5gvHxy69ZeissQBgD3zoubp99i9BYBOzBkgEoDQQe+ID3aoGpAPgsApJaHwRFBL/5UbCCcZEAAjCYDdpQYHbtOIB9wDIAfoxQA0DRQN8IMDsKqOAHrSBAKxIQwgDQJwEmnFwEfzdBC/Kwh0xpwbOmBJQFKGcFCrCOA38CgYLFkHAZ28AABIiTAQBmAhMQwcP8I7YclmSHPvwiGD0Cp0llZzkisFDqqmOPJNJEcRyYwAXSopYGRC5q4fNSl/LSMpdV60qQiRIEC+DFMP8SspAUUd8DDuCAslWghta5IU1qcaEK1BFxxSnOBrjmNcBtoAPmIAwQgGCCUXIjPctBXOT6s0WzDNKQrnylQhg0ggzgTQQ/0hAbgWCBcJ0xdRVQhwERmA7ZzY5cLOIOSQogJ7UsIAIXWqAFVslKWFKzmgZpTDoqIA9t9iNMkATABpSWlxomQB0V0EAFwOW4EEConShDQQcQ6D3oja9gtRCIQFbJgFZas59gVN8GajhDJAJFBcXaAAoG2pKXoGQAdahDSmJiNQFA1KEu4UcABFA9CCQtL707Ej/9KVILMg8ADzgZyhZ2n29OaZQmQGUG0uEgByUtj+sUQS241gEUmGP/BRQYitOEIjUHROAq3NFiOkaqVB/K8qT5CmiYIsCYxRiAAe5ggOXakQEUWICrBswLBtYZAg8gFGUZCKpaFPSADGg1A9ljSR0+KqKkLrWuFGyMARSkFg3QpxWPLMlWItMsmHUUBe3ApyWLY0wEJHIDZUNBOz+QOgtxoG/T8dlR/bOCHyAPBXb9bNruchfCjOABHUvHBhr5l1uCxWf/k41JniUnDfBIax8AQcwgVIIP5AkFXqpFwmhbQ9ZyQAMQ6NGL4ISzBwwVtM6tGApOcADpAqVnBoshYFT6laz16AOjfBY3ZrMYhdrDHi8JB0z2tS8SsuYwHgiqCZKVLNWMgLFP/1vBc/Mrr38NpQFA6QBMImrZLOHrAAooAGz5Ipvh3sShDp7iCBW6kwrk5XG0U8AKgBJfDL5Lvx7O1go4fIjGHAtIA0jWs6TJgMlWYIHpymgNLYDSA4CqqqP8MI4RdQLknQBzBknBTFRFk7Ic66H7CsCRsyQbCDJzAQd4MU8OkDuQVUtVI8gxlte040qV4CD3607zLGCY6mhpK1XyHbnU8ioo6yQdh1NBuxiQ5TkXCAUlQAEKSHDM0Iyxz0MugALawd8yNsDFYeFHjnzHgL6yls0t2ejkrkznSZcHBRn4RnHQR8ogq4pBhBoBBUKNT3xqNyxaOlOcC4A3CBjN0XL7S/8FEl0tStPaNzz+wQr67B3vOGZ9QAhqTDlZ6rBIE1SjLrGje7LFstS62ZypRZNho9xe55ABFFBAqD/AgQtsW8JfOTUEuca1ECSbeiIasrPTXRkvUSuU/+Gifwrwr8OGoKHeBov6fGeCWoQAA7WQULl14pN2qbvgcVmASxGQRXhT5ScIuBDqErZEMuNP0dKBCUYDPkCVDNw/kjY4yKEigTGCCjbSDlsBRsDMWb3oJyaY7AU0UAt/e6DRhyl2tegp0GT77AJmAkrIg56UElhOBSYQjZBnY9+MLXYBd/sQTvPigaN6p50WcMB6YKMyiCIG3L8rAL4sVRzaqczRPfpQLRZJPuSzCb3tHznBA1KQlsYwAC0ZO0C/+/2972GAtrTtUdY0sADRyPuSG4DQg5xJ2UitjwH8dhwGcAshQ0vrjVaUqkkaU5bw/YPtbv///EVUwBizmEBqbm0JCSs6gNo604oJ4ICRJMUAboxSzCrBadIwYKet4Jzbi7uQ6co9AQTIaUpIPwGeUeBj0DPfIXj+AQpi7x8EuJ5uN8FAV2Xc5AZg2KfrMUtZSpBkn9mcYTiXlO/f2DeLanz4sZIrhcyhn5A2v/7/mG7ZptJrXp+FoRS1zwD8wAGYA+KEl8nJ14hVS8OVWJKxn6ktme/ESPoNW8C5n4IYAM6w0L/Qlf11oEG41PcRhgUETS18wNNkRwYIzsnMjgq0gwPUkDpUWC0QiccABQrww3olWdeNXrHlXd9pXE4kQBk9QGa5y5xQhgcmITlIG/OoSgd0TVf/aRVxOABqbcAJiBuEaJM2cRdtKRJxwNlPdEAC7AMMZVxrnJhsfZ8W7VTXhIA+WM3c0EeyJYARGVERMouygEcSeuBihM0ImBwDLMe1KcDddMgHVApqTUDftMJBbYAI1BAF4OFRzUYGGJdxBR9iNFkRmkVQOQCN0AgE7E8I3FuYJABbKdZPAEGUKEtu7GEHjp6UcIMBcEPUmEOrWNEEcIA61BKggAsqtcMurZOMBc4GNNwDSFe+UKC6FFFa+M4hIMAzPgDKoIyMDaMZvpgQ9lcRulQ2tKIr1h8D8EX74CFqocwHGNkAEIDrTQAKlM0GOIBPDUUGnIDHHIAIaI1xAUVe/9EJAlAeWIxaf7SLbBTAKDUZMSEOKQJJAjQZ/NmYCXjjNzIfYwDBAlzbUCwWnTCTUKTHPUaAOmiAqFEACohVxyySAyxZE5ZE2blGNVra+QFABqwf1yEZz1lAMAkKUCBY3UUkOOpKHVLAo2BkxjQNBUCAOmQNiIQaBQQjTjmWfqRD+kAgTaxk15XAE1pABkRQBlzFNfJcCd4FlYHKtfCk0NVCSdVCz6HONnlk1sBc93CNg9TjAUCAS4wQHJLOCW4HUFzAmIUF4EUArvhaBgAhTgjAnzhOVh5Jh5Gl24FAY4yiSpCT5SVAOn0IBAyJO/LSAl2FANSh/QBFCKBOGh2GOP95AI0diZXIB2HeBAEETrH4lxYtJmMKHQiYCwCQG0tIkU4A5oNYALaF2la2101IkQAIxGFJHwAcABZmCYb9VECuz2CuJktMwMrB3xDNZmOSlgN8lQdgYktMwIy0JafQCE+IZo8w5BA50QrACjQmCwTNknSyRCu0imMhZ7XIJnaCXG2mygMEmgJsQ/nBGH3o5leEYljVwqNkA6j8h1VkhUoIgNj8nH9Ep3QSwPeUIBhOX36WZTjShAr0pgV4J5BsG2VVzweQhZTICum8EAG8REpogDqJAMMBgArEJ0vcwR3ARGCKyFhuaLp9wKDApG59AHVICxw9kxVxgAXQBh7GVwL/vFAC5GjfaMA61YJ1QhCFSqdE7SjE+GiWlYCLuAgTLsYoeRpNiIAOJtv6Xc9PnMBtWUBzZFwEaCTdzWiWriYOssSJxqaXethQKQA3wgl7MAA5kJxj8E/ADUDjhMBJestNJZk6mBJssI9W2qgAGNeHOEC74GefflaZeEdJKaCV+QduBpwALAfTVUst/OVNVMCoXSm83SkQ5kfkOIB9DlmPdmo//cBw0A7JvaRZIGq5DQDg7Mzy/MQHiNVNaMCjAKvvyKrGEQCxcE2GKaZoeZ6uWpMKLEAKqEW+pWaZupTspWKpllsdGJABaeqQbcDShM9NQMCMPquNWijceEBYAgUCBOBZCXT/Wbb2Ewn04X9YCZkyQDsQ4w80jRyB5oCVmwDVQQjkyAP81AoEZ0r8jwLGq73YaADwAw7yA5B6HAOwoArwa78a0r7u6wOYCYM8ZNM0wA9wpyIdzruhpcEQZgikImM1zQqk3+pgLPhBK5vNJD+sVivojX+YwFBgmGeVbCGBAJkoKLWZBEFSAOqgDmvBoQCMxU94QPUkZKbYw832UeYlCxBBrc8CBdBCmWUlwN7Za7vU1zHRH9PGz2eUAFQaqmPUVC0skcHM0FV0HABYQHgWlaOt3t8ZLQAEUV5dEsCcrVkswG19zwQk2+JoQBGtwCZWi20wi9zObfGUjSKFCA/+RGAQ/8A+iGhOAO4GWKIIeO19DABXeU1YysmcqOAP4KTjSorTLECr2Qp3RcDNqp1/0J5JcKDnVhCLiGlqKgBqncAG2JvrTsC7ZcATGgvq8skARFY3uFRVgaoJQFzP5q7seccPHKYtSen1Iga4gEv4ft1ihJfxHu/8mIC7oRo4HRACpamDpgTgUoDzSlf6mthvpUOyyElsyIYB/MULhcCv5u5WOMCDTB7J0M369SVYqBM7SaiiMUD8ym/80G84hg1jaIBDVdRhiGY6paJQ/BQFBOiLiQBaqIVcMcBNREBQwarjlsWjnBTXjOTfkfBhQF4Jwpt3EIQH31WHGoBxKkAFrITrsv9ECR4Q4i7dA7hwukCA0zSAGhrA34qbBTxAk2owxoIgAhwkQnVVByAGsZxMOoixFpVEBx+x2ohTLahhUYqAcVnxTmzHnOijiyiIHtuK5aaHXJmAz6AEIqeD3d1qDvdakJ2JCAcwS2QAwjKyogGAEcux5pTAjgkOcmDy+MgQEllmLQRPATNLC/iVxolAsw4ZB3cM3gXYAKCwBjhrIzcPJgonSxDLEx6An0FQHGsyzaCA6WETn1jWBaTVBd5GIGuIeikqCJqFbBnADyByhEWULYsvAwTfVYSQovob9t1GVa1PWWSyMKeNAzBTCtDGk0kLAXTMkKTskDUzn0xAIcJwnD3/Si18YgWILwRdSZmCTy10QJleSRA93BiSoWVxqe+Y8znXjAoggDaoBVCkQ7oQAGq1CnKqcsDZkN89pyM3DxApiAfg8d2ooT9PjgnQHjVD4QHQRpxcSYuZxgQI2J76Tjk/tNoowLJg4E+0s63QYXZgLrXRc5gQAMRZckrnrhs/rtOkQwh97Po4tE5XzAqMEiBRhUVLSwKMWhEqY7oIQA1V61KXNRc9Spbe9NticlWjTa71WcoBdabkhyWFxk8YdZhcBVmbNV839U88wE1I9e9QdVvPS66NgJlpdbrMMsmoK02ANVfzs1Lzde5OSmQcgvuM0hB1islM8yqNAGEXdrwExkxJgCpNyLW0PNQeAQBHQ9nf1hJIU7Y21wZalYvDQR6jMpMEyBpVhLZob4v++cdWsxniypAJS8ssXwi02V02yzYO0cScLEBM9g0EsOEPqCHlBFEGSN4HZG5N/LZVrxJqH3NMFONPVFbfLPbi3JO/4LBzLyhjtFR8pRlGOoBlVTdK0d3TKkBL+jT4+TZ4Y0uuHcl4K2QdpTNQ4PHfvdi+RJFLlNcA7PV7Swog7nA6CM4G8KU9PBQRKkiWhgBxIE6QbZFJSFu7FP9FgM9L7P3ccGcKAUiNIgOFB9wUlB2ZDko4ZaeoAaQgSsnRWjhOXkxuAJQXBZxgi79XxmjDSg8kocQGYuOQywbO0qZ4tpC2fxS4hiSAxywSSD/IVxEmjpe1STxKCXhIhyhHxkwNd7X27BjRD9yEBZRtipk4pbbLAtQqgFP5oXwGCKTAgtJEi2OvWl6AY8Nkra6ZxoW5NmdeA9zzTJsGd6nDBfjMDIkmt8F5uKbDQTnAVeXb+tDJA2gDROo5qaAA9P1Ay105Nm7PadKETwFnsvkfASh6vI5RfMVKBsCcztGHdKiEDpLfTZQASxvA47GT4qK07+yjgpC6qaBHetAvUi3/9jMVehB1I+XGzNSlNBUfDgRDnCQjRh1ggECw0C1NQNEN3j+XeDYwe6n0udylwHo8DGFg+etuzwS0+h/SngnUiaNdgBd7NxftOzPNI8/4Zwr+hRV9+1cUTHTkjWuaDq1aSgNM8+/M3mKwe6nDyaReLAcnG+IqF7+zWQSEOE8/0Iw+gIPsVk1HVAGXnkvor3UIQKe0nuvRJANNawc4wHIox/l5B8aPSjSJl/0CBb3fx3RMh3n/hE6GvNpWD2yuz63TSYd8SATsnHo9Sjt35euWaIsG2E3cwdvsLbdxW3IV28f9/KGgAG0Ib3K+GIsSwAmQBRDwGgKAeQQFJQcgvGDo/y8/LFag57W9oy4BgJUC3QTCwdbbon2ivMkjv5sxu/MHwJMFaHHm0UbdA6GiT8qc8BV9+PpXLFbRW0dKpN5OcAjeLFC/5YVam4XiI8qbQJBX2AoBtJO9lkuqXH6ib2ruZAAHWDBP1IEy/72GYJR6fYUAfIhxCTlLBB7w8h9QAIEHtH6bqD21tUvs24qDKeoiWYoa4n7AKXo6SOkdPLHh61Xom5rvl754UmACLNnPLQeG5bn0E8jr95F/XL+t5OnWXOU4uwtABBA4kGBBgwcJJtAAYeECAA8ZNFgx8YOAARYRZhS4gCOCDRoRXhQwkkNJDhNAChRwgeWFBAgTOMgw8//Bw4cIOC5o8I9nT58/gQYVOpRoUaNHkSZVupRpU6dPoUaVOlUoihEAGEAskNVmAQcpwR6sECJErRDZbCIIu3aghokSTXQtYeGDBQhsDy7Aqe0jXgH7EiTYB0FE4QhgB0yYcFIAQgEQIENIxxVrWqqXMWfWvJlzZ8+fMaNgkHUEAtOmgdj8ijcshwivIyBIyzpshQ23N8h+aGJC4AQEWCdoeWFDunQbagU3SdyBgwMfwlocMD0jAQHWPzDYChEAEAMfSoAoAZp8efPn0adXf1R0ZdMdrz5cTRvkhAjq1MWeTR/kBRQ/ULBANwBMmI66sAwc4ILXNIjAgg4CDCG44TL/UIACBX5Yq446BggLAxMYANGmEQw44YcTQVhPxRVZbNFFF9vrboTUbLLpAP4MEomAO34wAcS49sMRoQs8+MADDwY0gSCRRiqogicr8MCAFqZUIB0H0jnAIn4OPMi33wiqAINaMMBAL9MyELI6kzhwyKbRgCAngxfprNPOO/Fkb7T4aqRsPjUHIEBQAj6QaCLKEOCwSzUDuKAWD2qpRTcSL+CAJUsruPSkkkQgKwQLJlqhgQ3ooqvDlEqqFKWBIjjySL30+pPRgQT4EgEfR4OIARXy7NXXX4EtL0YA+KwRAFlxHMCkxdgcEIHfBD2VUQ4iLctNYrMxAAFtH+j2gRUu/1xBAZxivSBTl0ZqEqxaPmhXBIJE2OAHEykQddRZQVIgJ9lobKCEfy0IVuCBCS54KNHiO820rpDlj8mRrLNuQANS5QC4WROIoEEIrmVgLvAsmMsCC1CAEMIjQfBAhEEJGICfAAaoI6yyzNKAIA9EFTWFnBrGdyB2U7aAWAaAaEGBbRRYweClmW76zvYYGGEBb1eo8UafEUKAKwOgrOClWVvpuqbdMi2bMMjK8nS4r/kjzDBpO0DgENPmnjJNrA8aTgMaR2DAgClbcFrwwQkXtm+sPlhoISABuBrvgtwk0dMQOMCXAHnKHpvEkR6GWNDrppOONUyfHK7yl/nZIGogtA/LVYHHcxRpAq5Iu4qBwnH/z113qBAmtpauDbDRHtgJ0vohAyKF9AJ8M2bQTdaJJ+gChhZKQLHAEkwHqwKwMsEdEyiI/qBWDMjWACCv+mD39dlv/yfRoi7ggAdH5tNxrBMc4FoTsszysFk10AABriB4ACiAksQXgBCcYAMH0JKBarUPCR6AOzl5QM+IJ4DiHCAdVbNJThagNPeNkIRNi9EIrIQlBzDuAMPDm3DKlqSZzOR/jLLNDzYQN5sYQFrE04CRPlAL64xkH+YyVwb81BwHQCeBBCFA/w7gwZuYRgIPKOEVsRgsq1CGewaskQPyh68PgJB23ECANkwjoVkpaiQNeMgITHCHHWHkca340nWu/3MBBzrwWgCIQEsq18SBPNE5B2gAjYwVuCwukpF0QlhWHkCBCzWAcRSATQQuNi0IaEwDt2LA9/wWIjXiy2UDWAGNGMAmtuEPghAgiwjGmJPgaQcAE2gFAX6TrsY08SSLqUW3phaX0XwHBB9IUSORmUxhdechFJBJBhxQoxW8MgSrFFKtfLOA8p3vjQVIzuOkyLWWrEp8kDLmBrKVLcoAIAG6HNQdephAfgRQgA2gjAlOhAIUHFOZ/fTnZVDwkNT87knqKCAAFtC/DQSSUQbikAX6lwE+jRJrUgRAcTZwAooSrwEWVMBHx/UmMpkFAh2qw8sEOUhA9hEBLTCNA/4ZU/+ZOuUHRHuICJjFASAxAAEzkcnyHseudlmAK0D4Jt6kiEILKeCo0XtATkZ1og30UV45bKog04XLrj0PK6PZ1UzBGtai1NQmIRgON3bYgAeotQKwMxd+RFCjq+LrlG9yx2g60EQU3OYHHyhbBTJQo/OZIBuvS2kABKCxTX7go5JcJ0RQKFbJTpYnP5Drfe6DPhOcZgFtfZylLBUBmxgVdgr4m4/eeNEw4iV0i4KZgWhWCxFEoAL3UQGuwLfUDB12ALWtbS2y5BwKrLVb0qTsccFqWWZaYHLueFNXTaAO2LGMA3KFXQbegwA+pYMAt2zZRVwbki8BB6XgJUmlWKIBxWH/9zTGdNdhYXYBeaQXUuYETwmU+5AFMPAEJ0Duf5NJ1uNlAwHZ6GOfagiorKrAW2N7yAE8JQIOBEZQQrIUSypAGQbAagEZYOABUCCdRQlnOOeKwORckgA7tmOpDVAYTrxVqZJYs4n5s8iN0zW7N01pSh4A8I+zaFm+GYvID5HurC4iRwI8YJvZQGQGIkWmCftGSLi04wSMRbsVzEQFWhIxQTjQNXNlKgJlUp6KA9PRjoRoNOTiyJQDA9+wEKAyROYnkPHcPgEbsHXF4hMDEnzNL2lABJDBwIgQQNwG/CBkdBFSzPhRBwE8lituXoCRjgQBXY65Auv4a7zmtYEIfOkA/0pUgAm2shUQEQ1pH92tnEFyB4UZgHVY+dZEFJBnXefuB7UGggnOxw3GETnQOLrOoIYjWq48wKdQntw1s1rk3RTYNCOL0B3wuKBOPykCnhaBcTioDjQn4EHyckABRnA47nHPWw1IR0Z0ucuUEqBC7WCwQAFALhJYcdf9FhxZU0NgnAzIWCMoNt5aUaN0REbTkQ4vXlrRm8VIO8u36cAPQmAdbF8gPx1/jTpCoIB2ZKAdo8ZlAiYnNC8WS2F3O4gqBRkzxE5Oe2/yqiL9nXOD9TorQEj0Ux/wWJscHGt0tokCRlYXApyUUcfGpdCLDE1odgAyhYaM4jArpqlxhHLoLf/1TCgg7dIU2ADbENSXfDMcckYvqwm4zXEoQBqs9G0EONf53YMFcAB8SyJulDbRfZaAGi0ApArIJKNkJmmK96meDVDAHjeAgcIYpgLqiFLURvMBzHYyG4QdtrGEDWwKXOqttKUthhkavZMLp8EIOOBdu2J3vM8+Tzzfzd/mBnUAiOBLPtOl4HcIQhofxMa6TFAAyrv4Ppng137Llhm3/gCRKyADbkR3AQgscCIXi1gI5chTQXgmnCTg+Al06ADUq15YPmqM6fYb7eFf+54DQNhsljYDeE9lfOlSx90RuF6GbyBkJn86x/hkhh8mTfmUT2FCKFQegPsUsPuIZWrAb5vBgO1vskXe5ExBjAgCxiRSIscE4m8E6+QEmGlElM8BSIYuNFBIQuBIHuUtVgABEMlrAmMCCq0wfgCY1moFiAuEbsVHDIC5zCIEIvAIkZDipI/FxoXaLO37OKIFYU0gAkWO7mAFrgKOSHALW8QE8a11Fs+ZmiMd4ok/6qAC0g8CZigDrmUERABKIiBASGYDFEAFMsAOZUImwg+EVKZTjDAJAVH3pA0BGs8JESBUVsABTuRENDDxYO1hsPAqTCBSQKAWuP/wEs8jHRCJzYANAo9HYaSw6azNAhSgRjog6VBgW7QFyuqrvtgFhLYMmhzgDRlEEAHxFonMby6QwLRlARroNjAJjwoCgmRmCgMg7CDiBw6gv8YDE52xM4AL37bMDhUA6kbDR3wkFBll8kSgFMvq4zgGmBpAkpIGESkAiq6kOTLAAsYEUp4LF+GxyEIk9FYtIobjuxZFALgx9eRMirhB6hwABZ5xIC+jEmsBBBzAT3DoRLpI+bTx0bitAqLJJirgei7AXlZgAVyKSpivO76jLj5AGTPgSjbgP0bGq7YjHlVSV7xKmoqxGA+CAEoGhzxrCpERK0IFQwhyJ6PiP/7DGx//wi4KLQQOavEessoEZR/yawQ4gI06YC5KQPJycHJ+yVsy4OIujgPSJQFMYAS2whZXEgkb0iZWgGV6qO0mhx8TqFZwiQD8DidDxb94ci6Z4gSW8QCAEgA8QGM0BiwfAh8V7MZKYjE2oEYuYFDILWQ6AARCYPLIwixqIVTczQNSxgNe4mUmLdX8MixxsQHYRANLTHEgIABhpw4IoHQqwMEiwgdX4ADo8jWTwgFUABwYDJHMqiU+Tx7hrBWEpLbyAwK6Zd+KUl5I5gfUSoDAz4KmZgXKZEwqIPF6aABG4ys5szprBAEA5ESASiCeCk2+rIlGAttEwDQITAIZoFsagATS/wE22bMoPkpcUqBGcEoxJqAoKU62yALwZqYdPWBkQsaiLKAVWxEE/LNd3KsWaOtJ1m5JBssA0M06rdMAqK9CRtM3cChLfgA2NIA0SWlyMIDRRsb1vJIbvIUEXLM9URQoVmDfHoDgKsC87LPIgGCAVuDV6CMdPkoFHIBlOqAraiEyIsBlkC906AghUGoYZw1CrROOQmQIX6NrngQC7PAObUZ8CIAbWocMpSPuDCBEtGEBdgamUnRMeWJndsZFpUMADMATjcUADuFvXI4+vmQCjrQEakReTpGJBsJlNoQ19AeYCE5JVfI8gc5Q6qWdroMDGuxdxGcAxsQ5CUIB0kngEP9AAsSUTFN0ZziiBWrkRbmkDmJ0+9xvV4TEHurAhZBPZlROPnDDRh+t9TZTUJXPBI6zo1QRAb4rACbAWxaAUaMH/TiJA6QlA8ynpbLBpXgFU1O0pU6LT9rKHlwGLZLQsNRE0rrmAChj60iAWtVEALARtWR1JXPro9LBP1FA8sjkNlni8IgnQYjDONJBa/ZEM3NNWVH0W7nIU2EmN5WPW2kD7TAgBAI2LxWmAUipIxYmXAcVPR/gB8ZEYPXp4mrBN6wDvtSB+lgsGz7JK72KAerVXtlTRNLNWRMkVBdPARSlDMECAorwAxoMLWinq9QCyTBqA25SYW8xKx6UASzgksT/L07lrJNgpSHT7Ss/FmRfE1dypawu7AJilSytx3qOEiEUayGSpxa88bFmtqFAsgQCC2fh8StRTQWwktHqogTm6rAggNo0FhtPq/OSFWlfswXMx7nig7k8ZdWQ8AEuiV3BwlwwxyX24ZZ+ICWvE1Bgy1NqDmxxEQO3iewqIFUWFL4gQDMJKxswt8AOIRviVm7n0jTotittzkcSDVwycvHiY8O+Tz8RYyA+YBBHZ3Jc7DTEZZIYFx7Tjc+yYjQQdQASoEiKaTsFiQNg8AMoYF9aznNfk1lvRQJHhAHAJWkeAJEobsMGjnXBgulW1Vi2di04ILYewPMOUVwyknpvVyy7/y/VTKCdpiMBPsav4Itakmd2XwwBOld5CZLsOm/5zuc7juQDKAgJr6JK2YI6AiVATsSeioyHDKQgWGYCsoSDMiAna2EhCIPWqPN8cfEqNHMEPCBtPqUE6qIC0kVlXyj9NKAJ6/dS8ZcgOdIA0CotFCYEImN7j7CkHg4haus+NGCPDsDBEollVi8BXMlTxtABNsBA/Wo5vnUsNfgI48MAQOg4juMHCsNtFEcDTDjwchACKODFeKaFeTJ0RQQidGKAeiMw/jAJRUCXNGIAB8AB+i4RZ+jAdijZ/DAEWvQ0InjhNmRRBiCduOmJb3EELmiGCsxHKKAV6sGOPACE/BZvOLEgYMlkAbgBhk2AI8JUjHfyfBiAG8ZSW1pgboboMW4xA9pFhLVRTCDzAAASZbDWE3lWnyxAGakYiFIGStRhcqmwfDZXdAkZEN1MGyAlUjCgbAO0vrYYXzjAPy1gAbqyAMzoNFiYkzGxHiXwcIZml9APEEuDBCjw8BIEA1SgDh9PoapODd8RItqtdiciAi5MLYlvlLOFX4NZ+eAIG1NsAipAYSwAtLQSVd1Kqn7AeKYITaz/eSCjxou27yHahTIXNwnljoattsG6DKPALR3aocl2Vx67ygM4R+YK2AJjmJA7OgLn0QS4IR1wKKPWUAMcsWnluek2hQPeMt+O1X4T+hnLuHotoJg+YCJxcSsakyEeOSdGEoqUiFj/ZpDvj3sqooFZq0Gftjqr+iGkGRsP4OKK4w67IQNweDouLFNgp1YWYwJueltaak52GhM7VgFztzpTo2M5tgDWTXeJhU2JzAMEAiYLeDSw9KrvmXs5ixwzEoZhmAIvqKwDoxVaQYGnyKXYuq25EAHwoHyESfkEO8vg0XzFjgGiWl0KWJiceLCTEI4eN1SON5RMgC6MZKP270vs/+lBT6MFJpuySdAHu4XgFtp2TBsXLaAteZO19Pq3Bbh7EFG7bGcCRiIcppY/sKk3VgBEYBh0EaCacRv+3vN0U0sC3SxQjVtGV2Bk5iKSNUIAwts63/S0amQRGa0sHpYb8+M1LqCEl5lWNmUCCKjztIWKbju74e8bVMAOSWChzZNQd7sl07vIEKDwOHRPqSMBFzxce1BcHOg4SAVAOqAIG9P4wEIA2IQCmsyyTeN+AXz25MVEStG3JfC0yO60Nptxv3IrSBjbHpIA0hjLJjxcqbfzOu+CTM1QdnRQnhuxJkwx2BBh/6YFTPzE764EUADKJYor4hoAcjobDsFHhK24w//bKyGgaWGGChNkhxcixnccCX8N2LiBAh6kAzrAh4NbALDtvlViUxJABRQGRIStyZ085yzxH6KxuxPmNDR2ac/cWFLD8T7KAeLNjlSsCbXl0Bk3PlDALMuPLUDcJFZAkCnjaPsc/kyQyt8ItCnTAyjIrs38iQcOJ5R4BQNEt59K0hfPbwZr1lic4uKjAKDsA42pSD7YU2pSI+5gOCgAG0HZqzz902ePrESdWGxJjU9a1u+PAdqW+YDg2qWvHKVdRikVxrauzvqkyNINAeolaTA7WyaiXtLWIAhgOAjokrv0R5Jd2e/OsuQutegiZdJhO1KdkOODTbUcXAX1GkMEQh3/oJhroULes3U27A5pAuiibwEsAL0W5EkjgBsv4EirI1Mw54uz72/2nN7jj9kRHcM3QAXAcNvPXDvIzqDjsWM34JVEQAXsjcW2yQDcTYl88DgvRJJCQMnuYE53OALIaYvbvWxmUFswm7DmXeT9DWEgsLfBsN9VXlB7CpFV0gDIkc0FlixyRvoazWsVhlTmAqQ9nAqh1a8FcE/DvEM6JGPmuyZsB9jg1ulpb4u4nM+q/swNABGlFRBTwzvExfEsgBuTkwIiA5aUKB1M5DZQIAKop77lnF1PRe0zQiHSr4/qubDsfvaGZda5Y+/T23Zs6trD1gQazK9MjwYfYgX4wYWC/17iHCBHVRg7h6NDNL4Yy+vy3UYEruWAPI/POz/P8F4QMzkn7Fn0b9cOqXH6Quq0D+AXHUBhMCBqE6Cl0+EDJG4CSlkAFiIHV7Bsb0MDuG15cD8AoJUKX2v9laUVCS5bqKTphx/PUMCziSwbBqgB1vR8qR5sAYIBgIEEGVhAYSHhjw0LF4wgCDFiRAwhKn4wYADBoRACOgoQIaKiiAokKySoMyAlgQQE6iWAoAEChA4PFix4AAJDLQwiBgQIYI/fT58BiP4sGuDCwQ4oEBAcYSAbRhX/qlq9ijWr1q1cu3r9Cjas2LFky5o9izat2rUoRgh8KHEgAyBAGNiNizev3v+BJlRkaKdiwd7BhAtHVHAh8QUFAAQCUEBBwYoHjRvbNXE3r0C7CDp3ngsAiIUIpCMISDlgQk2bIQYIRXnUJ78B9lKiHLAygW6k/Owh/U27dwB+GmzadDfCbQEGmBkoWAs9uvTp1Ktbv45dLAoGbg17L1jZcuaCdhkYyOA38Pf17AGoUHyBgmMGKxqsUECZIEapTvcWAGATAgs49V8BG8ikgQaz1REABw08ACFHHbk2AGxE+cRgAHWwpBsBRAU1VIjDhaiBgJ2ZAEABy5VnwnPZvQhjjDLOSCON25U3XmGO6bWcCSZwYwCEEBoQ3goUHDmZkES2xyRhFFRAWgUrLPdJH10RCWSBCDKJgKJclc03UAQlhSDXCA9k4EAGGQjwE0oJTPBmCA6k6QABI2IoFIhC/RaicBcO5RuDA3DJADddcqciA+44V2Ojjv8+CmmkM5Zg3AJdSoSAmn71N5ACnirQABAPMRdVRg6kg+oGtXiw0woQ2XdfA54hcGmTtsa1wA9M0dSCAS0gkJGvCAj5gAMMdfBDAXCZcBOxQmoZEwazwrrCCqf5hNsdAtwRgqcqtDMBAeLe4VNtvdGWUlGoIXUhtj/NhhQEGEUF0QgmZHOvi5Luy2+//v77Ty0qfKOCCi3gtQJIILna2AgfsFrLD5sBIKBxGlSwTgXyeCRABwQBAWF9+d1Kcl5AlJpRpZUWm44DB8ga4I4IHJBqOjTT/PDDFnyKX8UL2FmUULPxE8KRkVXAQdITBA2U0CIKyu6f7pYLQWdS7QiAsC3/UAVw115/DTZ0IIz9gWBxNVDLTrU4cF9kSScNwYACqpp2LRcknZg6pKmTAUSzIlBttZyWPBiOWEvkI2ZZKtyrCQY0oJNOKxjwown/DYTAnGhasOpOFVxAUgQgsPqBBQecfsC1TydQWgQLpbPBB+W6Vpu6tk89FO7YElcpdwONMGsGYQ9PfPHGY/UAXBABscAHzn/QwQEbwK5tRxdUavfnd8M5wQW1hPC9fI7NuoDmDphN+F4CFWCCO7V66XtlIbx9gQHJMfBARRUxLJdAQGSjAL8o4AP6C4FudDOBmMQkBKTzAJtuhxqOSaY+DkBNhYTyJ3ZFLUS4q0MEbmKTSwHP/0QOOJ4JT4hCST1AVBJhAAJakA0EgKAC6oDS2zgAgcSZYH4TmAAHQEcSEXBjORSrFAfuIC4OfIoC6EtfvSxjuRwVxFnBmxOq7GOfBUgRACNQWaUCdx8PpUQAiflhAlpxxlbcRkNGseAAPOC8EngAPmKEoAbbdUekiKBU2dgRAypVwhQKcpCErE7yuHileSHgA62DjwiWY6havG0CNKxhLXwEpGEJiQPiEsAEICOZwTlxIMvZD0a+NKqBTEZkq1nANtTkAHNM5kFNxFpNILQAkdVnlw+41gDI+EMOcGgl8ErXuurAjzrUoRYfAMEHalESk2Brmura3bqmic0SeaZeEP8iwQMOUMhwinOcYiHBeLCWnCIaxwLPSwcQCGIBDZCmRIpE1QEcAAE4cWACEVBYLQ43yivZMx0qWM0DMmMCmERAnhHQWwTE9zG6APQhBTiVzWR3GgFsgC5AMIGHUCIAkoAOiCS55tRSgkGUbGhWH+CYMadZO2xucAAcaCY7OTWCatkHnOTsqU972oDywMUxI3gnAKQSw2ygaU6MGQgQVjCnUxmAG3ZZQIISBIEQKIxOGVBAj7ZYMh9JxQC7bIADWKUT9I2AIQzR1Q/euoAeGQCgBVEWAIymgB9YcAOYwYwAkPlLMZFGBBigCAZOA8GTsksAavuewkTAppfekZrG3JD/PBM0Mue07QQ/7axnBbkCHJnsY82yCUTMM68dPSCCELDAW39gP7mg7HKj/BuwOnMAHyaNf0BoABapyEfNUM48lUoHhQYA2x8Z4A7nEsBVNRAxtwpgNpStLmrEJS4ITE96H6VuNSX70tkI4IaZ9dQ2FLCBz6p3vcNTgAQ8Q1cAEQsBSH2fXdzisxXoTwQZIJ9xXkhfBEzMiRYoIGZSlA6PDEABlKOcDnVogANYoASli28D/NKNDGi1IhEoCjItUKlr8YMAMoGACDbg22rVEbyULYovIUAnB3ASu8acaTWTOUaPMExZBfPUD9gL5CD36xsP8CYJlBeRBfjWt31lABHj/yIkJU8YIaHy332MNLlsHIJyqUxfCEoSAeUZN6MOMJEof2SeH9StFkaViAJohirtXWACFqwFz8SIG4VBIB2VIgB1LfhdNx53ABqg2akioBgOCPqljBZ0A57SjgBu48dCrrSlaQSCEpTgICZA8pdwNIL/xHcgQmoA+t6pvIuRRANEDehAalEaDUDkAAdMgAYq8r02Zy6qK6gUXqDSmYxMaAB3qLWxd0fiEm+AWL7EpknVdZsc65g5JlhtNQMdQY5xjAIF+Zan0nvpcIv7OmMDwT+56GmIXM7JbrmLH30m4NBQzGeOFYEHWAQeW4GpwPoDFr4y0NB5IggCtEWABTqA8P8HzEp51BZrqfDgSzImxiStoPF1YQKTDkTGU2L8c6MtOBtzSTsDDzpT9ZrtbI614m6JCZVcABNASo975jSPDora/LHwnNaUh6OrAja96XgvZ1ZzJZxdSjlWwAUuMirw1AU8QoA2qyBpb1IAzvWDxRXQij++TMCmE6JoQduDABFQaC0SkhCUXxu8Ihd0SEASAvgkAJvIBKlHNMCzSzmnx+Cuud//Tpa5PuTqmikPHw/h5Muo7JZngqUCDFW5eXV6PTh6QMvuSavKfY8iG5jVDx42OogsYAMnID0C0k0xhPzAdGpCz2lQcgFiRWDRA9jHY8VUEpfSfve1Qc2GDngBm9n/rCeL9rgGsNiAbBiVAYDJwKQBD/3od6XTqDbM5TIC38SboOQNIJJj2rqQjwEJD1Eh/GAo5z4KlK50nDIA7tXxAeWt4FvoKcA7mVOp9xHkAZE7+0IW4ksVQDmGAgG0RwBaFRIXIC6tsA/atnsPSHsJ0EqyA4HEQSyT1xjegl7Sx4Ed+A8HM3jeYRcfAGacggAF1F+eAQElAQEQcS+HcDXfYQAJUToWcALScwICdhmJVgtEhxGOMyenQwEPkU7hMR/MMiALYA7SA4C3wQF+gR7qEIHP8wEXYEETdzcQqIUWJHGJMXdaGDfGoXcwpwIy54FnWHMYqCOzYjeKYYLg8z0p/9gZInBVIYAjD2Z+eWEvaRMCGGABS9VfTnZU+5Q0IYBLD9Bp6dQBG4BwfeM/yvM/GcEfxnEqG8AQvsQBbLUBVrhoXod2nJgSMSETs7eFpZgbLLF7tSYCs4I1PGOGaAiL4YYiqIcXCwBHzpM2OnFJECF5F+ZtcmNmncEN4uFUhuF+JdEBiVdKlIMA40IAFYB2FsApJqATFXECeMEAbcUUGOAB3XhwCNEBFnQH0YRnbpQAbHUCoDgAB6Am7WABpQiPWkgAKLCIP5AB1IY1znFeKtB3seiPlaZ/e5E5LeMyqJMOB9YY5Ed+D0AB1UIBMWRbwLI8eRgXUGFiILEBDuY4+P8CJIkGAQbJKQwgPbDTVEbYGBPWTB4wTxHgAROWEAQAdT3UQ+VoQROAKjZTARa0DQ25AsYVjz+5aARAkA4gHyvyFAXgKZHBWf/IlEGWiIUjWz4yVYoSRURkAIsHQoI4EJViP3XBQhT5aczhPHDkAECSDVR1Fzu0YR2Qf6fVV7TIAJETAhowRgMwE6VTAh3SSb+EcjV5M+mwDhakcJ2hAEBpmBZEACWncNiIJCuwlE0JmZ/VHGDVGBDiWwuAVJRTJgWxADCRIA4glREGOzbTGb8SkOrjZAXADenRDi5jMy8TZWniFyvgOIYSESqCjSniHKCEAi82lh9wWWKihXUwAXAd5gA5iRoZEBkUsAGH6ZwhpTEV8AF4gZSSQQGPGZn/2dlTLVA5tCUR9+Ep3Uc5fYRI/QMgtXYAyvNM3XgRqaUjdXUZS9YAGcBOpSMZKTZfiGRXyzNgcrEiBeAZC3AAFqQBaFVvIUCKEDgB5hOYqJEOrfcDfemcpcgxItBlBREZ99GP2smhhfRfB4MXGGEoC7BE/aGMy9EAFuQx6IY0SaMOyUGEhZNJKRNlVgIEHYBdBMBME5aMp6UsSAYylskpBYACG3aRCGJBEVCNHtBKPgmBHFApBYgaFyAPijGhVzoo1JmhCoCdHeqlKXSIonRa5uFCRtKQRTcQGfErFMAxPwARIqAOerNH+3GaEREkK2McO7IBtfYBP4CDRpl4itJm/38EQoOzOFpSGuqgjhVQQK00oFp4PcYhpSlxQ3SWUVhKoR3BLdjoil/qqSlUMAUzMnvhKxnhR7BjiSVwQwfAiwG6DU2nAE2UFyuAEJs2mJ1BJQWgAgWkRZXDlQWBZI7jOFhTAs91qW5UARcpAsTipA94AQGGAMSXbR2RoxKKqVyoN3pjAdiYYX6BAp8KrsfjMnPiKqPWP+UBHs2UNjnzTJPDR6WCAMLHZ4ThACBhYoioQyvSAJbYED5CXEJyenqIKBDRDqRnidZ6AQEXAYZ2ABQIgfXzg9L6S6hxB4ohTde6ewRgiZZYklcSVQ7wreEqsmFzAulQsh3rH09BECHgmf8hoFOmFkOlOoDZwIiM+GiDsQHk5YJTlRFgJBWG8jhYhD5gohedYRzW2j2KcYsfILG7dwH4gi9Ne3EYF3YY24lQa5txYQLCdwIlMLJf6zWaVgIo4ADl+R0P8Tk/JC+OgxEsVTce8FYMMarYuAHRpHURCZGHMDNulVz+urNRgSJ09QDepgLWmgA3BB9V66xN1hqdyFWTarXmWCliyhcHcRAeALaZ6y/m5kzpQIt5sZEYcTdJEwEcyQ2/4hkiUBraNT3LRq8DlwFYdrfBViiY8QMeMDofkHhIBjy+9hST2Q7CtwGGe0No1CFbWD9UKbWnwQGWmT+Ry4UpkQCTixfZEEf/H6C52fsvKPAdDHBWnRNNEaCJo3pE2qIaD5J8hHGVSRgBSvOsnoGmAJABC2GJeAC/LLIBuWsBMoNXGkCIYXep15KsV+WAkPoAJVeAE4KJAbIAHAG9HqEtHEB0eGEC2mvB/2IBn4sXG7BfCCgCtXCT6SArnsEB+0AAdzABv7oXwOYZ6oBAEox92bAo3KEADtANafI3jmMv6ZAQKLAdBAE4RqMBtdaXpxEB4NOHnQSTE8vE13ItStQ2ECChDnLAD9ATTlyXTZzFWKzFKQEfEeAZeBCQ9nLBZbwvJaDBcQFZHhGSxvFNzdRM4bISF8C76kOMinYaUUcQbIsRidcYMesZ/xDpM3FFRCYwKzmpYIsmABZQxQ0wuvukhZ5UepaInFtMAM7jTJUcuRkAQg4REemWDWYsyo+yv2kcESJwcv2hLPNivfDhAQiRENgnkYOBAJDhNlA3rNwwLM1yKADQZOhqHomzJAMBJPOSoNHrSyhgEzWRuFzMxQOQABbgTBaAyIJ2BwGnDnTWxc68xd3MxKYjfIRRwaNMzpNiyhERAjnqFOPxELVwwuJClBkaILRix5Z3OjLmEQlApwigmE8pEYnyH6hXF/d1zEzsRh3gM4paRpGcAI2ljhF3Q0ts0FjKWGjnpudXzhkNIyUQP4XhANdrAN5JSu4MkwSAiHO1a3Myt/+1+LGa2AEmy7GX4T+0tSwmYilQtHEKQJ8dcBATEMB1ealrYzPf240JPLE/ncfRNHfHmlHapqkKfNRR3dQKhtTQ/CYJcAGE0QIazdXXgcbfAVVR1VeCRxAYIC66EbCNgXC6crN7UT5o4nyBowBohwIKsCiLYld14TcNKRmt9ACT/FYFVLXPnFEiEI3PAwKQZdA//Us/dDcJEHFAPbGnCNlVHcCaikTVetQcwwFgmaZdDdrTgcbnrG6hNkLbRBAlMFIVYIJwFwL3OBgLYDQUYAJGZQLSY4kZEGWnqV8i4cEiMFJlVEbkss11yQFRslAKk6DHyoUCUGsewtQRlBL8JFj/1upGUPcSCvN0WuzcWh3a370WX015jfE3R8cA6VBA2fA7BjBwZas+/Awr80yiTecXwncAlPsYrUNDUII03HNDnMTNfPlLWG2xJeHTix3VA35A3MzUFVA3h2XZmy0AMBnNLkmX11JrFaC+4M3hZ8HRpB0XmTlWUpFLuxTQFENS6UAYw5ICN4Em9+QAy7Eo6QAfQcUcO7JWAhAOuudSBBDRQO3E2nbCiYzgjE2t7xzd3YwBxLLUUs3dAz4rJdDU/WRiZDIYW93hWS4W4t0e5KMA58VE83IInTZ0LHcBG6AXb0FtlKMBPfRDxJIBBrsQ9KgrYjbRUM2XOarnxqsbdOSA/woM1ZctbVQ91QL+RrMC2U7e1JtNYjHRTyGhVUy0GqCLVAig5Zf+FaPNJCujOZwMakSEAMGUiYZBhE/XEQnAkyuwDVzFOd3oARCRYHw5bIsu5B3C54cbTa2AxYTt5LLuUnjexAIAArfVAk1e1Qk+XqOrAXDsAcBCbb+mpgKC6dO+FVxOeVolEyEQjdtuP8uxABVHAK1w0d5h6hPeerFbOdzAtBumPAPabHg+1c6tTxzwdh8cjXgs6FQt1UEOdUhO6CmhXaiq64ou4PHuESHAiogyahTQeoFE7Q9fFRzdn4RhVIiWGK7DryBQQDpIMbrBgG46H6LVQgBQ7ncA17HrPj/MUaR1AxHD6+tAbug0JdwYMDotiToHsN3ILt1GDtXisg8mHNl8WQG4240wGeEJDtQQsHRkbq4O8AMncAIhC/H/D7+/dwHiBFHZZDQrGHDVCWCC/o3m+jEvsRUX5U4AsBS7s6LTmmPn757kHpGwCoQe7RC7wGgagV7oSB3ZE07E/w7NET3hRr/vEt7UCSBSFSCreOG1U8/4//ABqCtgni0RHADuFaBDo1Ea/QEV/K0OrPo7B+xbo2oviWP23gQhebVdSTIkDRahvh7vsh5Y37M/zjsrdFnwep/3hH64Mgnosk7ZE/7nvY/3AzD0z4PfEQECjc/4ICAkKTDMhjFnpAsXI3AAdRMCZG8AKAgRNawpbWbInmGFmnrjW6uwlHE5RosAvTn8tM6X2v4Bm7Zl9CXLCKABwv/v6y/gBAAn1ZDo/+wPEAIEDiQ4cICAgwgFJlQoQEQDiA0YAKBY0SLFEbX+beTY0eNHkCFFjiRZ0uRJlClVrmTZ0uVLmDFjqlChQAWCizkpIljQE0EIESIgeAAwguKKAwccpDMBgIHRB1EfIGhhIJsBFRlUOFBglAGQbFIfXFBIwB2DAgw6EGBLoEFFbh1QWLAg4iDDhHkNCrCgwKaCbFV5pkvn4EAFvAsb6lW8WMCECpErEGR8t6DCxIvvRNCgIcIPEyYYNNVZcQQDBiBkrmbd2vVr2LFlz25dy0EGBw5wTiy9c8GD3x5qhcBggTeABxmUt2taAAgAAwgMtJCe7RACBRnaKWjndGfUBv9jBdwRkIDixB8CCNwhsAJjARAfPIDQsLdy4wE/VlBosALBfwQe6GCDDX4gyzEE71uMgwgiWCcC/CJMUMKECAgqqAN6swg11EzQiDYQQxRxRBJLNJGlB57TEAgEwotKNKd4m8iEbGg0gMPTjKJIAQtKsOCH3c4DIK0FcrstK78y4Om/DD5w8oMFQjMBgQTaImDCCQ9YcoEDNkhng1rYYwtLBRWsIAQ0Q7iSQjYbakygCUQb7TgNEdhvhRVO1HNPPvv080+QUtRwJ54WwEmnDrkJbYQCnMOoqBUKHDCbiVDzjgEFnvxAgf4gEksFwk5IZ6r/HrDyMlQv20Asuj6wQM3/9chLdS/K3lxIHQwwCKEWWmf1FdUETLDKAHcG3Qk3c8wBdFlmm3X22ZPcU9FYao1dwK+aDEir0QKG5OYDglb4yql0DigXMAOsUqCwpWStlcyB+vJLAQjqhWCyghTsNV+CIvDgXw/WbFNfttgjaAKxDh20gQ9AcBhaiCOWeOIRV3hu2mo3PA8tSx+1yABDAQSwRtSASIczzhaoyAQMamnZgbRGS8dVCzxQ7+Zf+Q3hB7osuOACeS7g4F1UGbL1XQ1c/aCEnH8Vk60QnIxvm3lVNjZPirPWemuuVZIWAIwztugsji3S0TTvelKbgbPcUUG4WmpR2AB7IdiAorReHU7N/3fLLEiDllueYIIECC/6aKMRVAwCC+ayYE2/J2SvlQQScADPBijQSrkHLhWSt+cU6Hp00kvX2mKxNVxgPwpWuJEbtHLiLavc0uHgdg4+KHSB47IhfPAQ8FSAAhEii0Cepi9jiANxOPhZvYKPJhpxW0UYUK4rE0/+sg7KLTdkBPCgVnTTyzf/fD7F5TD1nJJTTsmrDCCtotgLSOeHDjqwgD32PLDuqgKIZkocqFwCRHAbw4hAHpLZXqoqR8AqrUdgDUweBH6Av7VQ0FcfyN8PNpANBIBwfhoiH/pMeEIUukYBHGrK2VLHABVYYGkWUAEFhuceHXkFNcWrwAKhR4AP0P8oNFLpT4M8A4E01cIznFGHBn1lpQk6cVYiIJAHoyhFgVQgAuqIgAjENpESplCMYyRjSRxAAuA8wIUXsRQD1GaoDhVgBYRh1/sUwMZGAUADP6vABTTARQ1sIDSjWcHmMvCvWiBSOB5IE1CwKJCnEeBnF6jA0B45Kwt24IJX/BUBIqOOPhYwAS37lwVkR7+KAGEiIwhjGV35yjGWQFTmGuGG5CesL21AVCJDgLDSlQ5N/iAdGuPNHvnoFxsuYARGKcAGemYBbSwpho67oActcMl9iNJVJfhACC45q6Q9iZO+SsDw/GIBlGmAVNnIRrW+gppWwlKe8zRf3GphgjUWRVj/V0GACDqjgRAAxydXqVGrOFgpjoUmGxEoXAIuIBU4VooCNfGLooQVKQJtQDtJEuU4fcWBPkaGPyt4QHq+iSrI8FGDCUBSO/gTkQ/EDQMfWJ93cmICPO3nBPTkaU/LV8uVEdQAEYjMBSCQMPlZhZtOQsGGhMUNA1SggBx4YzbSYoICPOBOKxAN7B7gpRP8QAGs2wbhGqpBShpPoFw6KbBEuVJDPkBKJgjBP0NAp9Iw4DbmcAAKfPpXwGYNRoiq1NDY8lCpZKCaG9gVmjzQqRWADwEXqBzlLiQCC6ygP/65znU2GykRpEkBAn3AZfHVwAgAJSjhCc8G2ooq8nj0V7jj/4AFhLqCebnHWAYIbG99GzF8GisBA+FAGhcAJl25zJ4eKFdSFPDGCODOj52BAAbMlZReKiobSUmKB7jIxef+5gH2rAWEKIjEltkGNw4A12vda6Va5JSkvzEUtVrwW/zm90+D1dBwBcIBKTHAmwbzgCblMskLyOucTwLBIjHgTwhoAALKpIgBOsMZSwrEAWvNJWM1GAK56K9enTmte03MgQjXCwF4HRRv9ftiGI8omlQxQD4pkgBZXYBtqIEVWxzQuuwUDngF8lI61nub9X7gnxqwGgBMcLuf+VfDESkkblTAKwpi4AQEOgGCKVtAE7+WAxfWgMKoBYT7xljNa36NAkJIgKfOlWYCbbmARWphJauNAAEEqQB5oxS/p5ALAiizGljGFMUNzGu0UrkmBT2wFMNMUGi3k22Yt8cg6prZWCNwMZv/Pf3pljisFrJkMUX2FgIPMCBd2fAAByZwO1IF6GAIDu2u/FedAwQFAiJosglm5YELFkhkJm3gCdTWAIGV+RDR0UClLZ0zDNzSAO7sEAJAfW1sm4S8P+jNB9JrAasIqxa3SwAHGiAdWQ8kAX2kZFCAEoIQ/icdl+VdUQwgK3cJBNjVjE50iL29DfQkKgKLgLBCU59nP/IDy+yYkErjjhsxwNrZpnjFQVKCUgNAvgog8gkwULdE2pMgGpALXdh9gQhEpScbcDe8Y2aAKbrsX+DrgAYDLhU+G8kBJU74h4mY8Ys84M24tXjRi/4Bm1qERYVqgAyd/iQLRPjCBAkBAjMg/7TCXUBk6Tj1uf+zgFTdAaBpGrYGT6ByUxE3V//6cuV6PhACiNJd+a7FG7uFSp2s11xG53u2QRBonaionxcaFX050JaCfGBYkx0PATjQxnYE7tHzcsCstPjPN/47eel4Y75bQYBWtAKkk3y7QBw6SSiOZzypTh0KGvywvsfe0x9QZU7OJnF3iyAD1AGhYVWv+qpDWsoJmEhaGuAlIn/pS78vSBdDy+s0NrqBB6Bv2m8mwbi72tXOvuQdLoCm0Jq1clciD9JT5wHZp//Tf0+6TgYfFBVYJMMCWVMFAleLKpn+NGi5lgKoxrNWIQjyUw8RSK9aYK0HYBqc8RVZWRXWGv+nuKuSVhiIfDOxpOmZCxgct7sSIAI8NtKJjFA/EVQzjOON27MIBJCwCMsAhJoA1YtAUQIzSEqAGzmLmCkAbvCA5xMB5qPADPCJ5DASDBAYDrw++oMkAdAPzVqBASwI8njCBTTCIpxCKazCIhQAf4kpDxCanzm89RAAmhqUi3mnESzDFwOB/asTqYOADBiSIZk/2kqAzxsTdZsTfCoAHakFXWu2I4wtAVCSQjGSDMCyBuoAc1IAIjzCWeE+J1KHWgCBRKok3HmahQNBsKEfVWIAM9zE3/o7ASo1iWsk5Yob8bsAnYMAAbyZBMgciGiyApgMMbmMNfmBrNAOAhkQb4r/wlRUxBIwJI+6wp67kumKMHUAJS1qJAe4REuUuL+IJ058xnkCAQSQgP8gjUqpCAQAGD1sECOSMA0QARuiAArwpii6gwTQJQJ5i4qoADqcQlGqhWeqph8QAXehwjUhwg/IiqzwQypMRXu0QoD8xzXBNJRpEHXQAPzxIN1CFKcYgQXYsnTYKWicSHoCATx5s2nTGABAgGrqgAjgHwKwgIxKB5HJRXu8rAM4G55bk3JzNciQjArwEbrgQWC8ogG0gI3KgAnaSZyJokRUxAX8yaB8DAT7p9R6oxuxxKJgJYpsyp7SOU1bGfAoLYLIgPAggU7pD74ZSgRrqnXsQ/qDDGN0/zUh24AuYSyePMKazEflcIBDg7uhVEu4BEqhrEt1oy17EYF7CrDeOA2ncEanDEwx+oGw+gGrwSsGiJ9s4Jv18Lr/UDSalEsYTABTwht23MUx+6fh4kA6cgBeqUlUWZMPyA3cSMu51EW7pEvJjB4JEqVdCwqisDGGVAHBrE15Qh2HqzAhykWBOACKcoBGOhAnHI/YIoqvNMLxqAAPcBIPmDP1qAfpsArXgst7RM4rYcvStM647MfqrE7knEECMpx7tJIkqsRB2T/UoE3bXE8yEhfZcSO1gRX2EEnC6IC64YBYRLx7vAPzo4jJIMIrqQCa+YA5u5JgURQDSIe37M6eHP+PD8CNdnDLK5xQBvXOCaVLDpQkBFNL8kyv/hwU6aAOB2BPEk2hOwKbHNrI4CQIL2uoAlXNQzNPAMAXOlSPzyiQH8DP5+QYBkgHufzOt8ROt2zQDKW/mizS7sxQ70ykBoOVH2qL+XASbtstSEuHEihRLEWfrlARHZG4JTs5yjIr56EkyoIeI11A/qyIV2zHMVEHC9AfC/DC8sgA7lAAmwFQuGtHB7UynTxT1czT0zRT71SPz6scmvkBQnxSAhAmL0nG8zSAHuGmD8lSSiWdrkililiA22me1Kq1L2SLFIOAw/NTKvxQGq1HAZUhAs1Q8tKA2GLTtCSAEsiKdtBJg/n/oTMtUjO9PgulP3MU0x/grsc5NCvJAMyJMxCtVGUtH3GpvaLYiSVbFanwvQR4nwzgwVutwjRdR/28vlcrHCUNHAyAEKHkVTPtC6pBRKDcVdAUVEUkVgL0IPzRR8WiwJthjygRFqB7lIlbVn/lmhW6GBSsl6BwAH5CgFGNO6GDCCft1gw11XpIvXaMJAIYjuGIACV9UndVD/1oHQrQT8RzVyhKUnY9whBoyx8bHgo4AJAtmKhkSNTo13+d2YlZodG4u2X6iTT5gc1RgQh6jDdiTCS91w/VQV2DnldVjzGNjB6ZyRq9UHNdFfEaWnZ9S0BdUHitWO3gHLWpPHskgEORBk3fMBSsof9Zs4UYBRiktMBGb9QAD6ALFOgACCo3yLzX8XzYsymvCxvPI0Sv4eggD1NUQUVSLfm6z+NQXOVQeLXOIj1Z3FCSkEFEkCygVnjZnMCWrThbzX0WFQiNpDyPBRAl2gIpmAw5DLjMxR2TbaWI6DorWCUABxCvBzCMwmhY6tTVK3EAwaCSwZXCrO1JkOXQEKCjdLiR0GBCDmzJ27Hci6gZJt1c6F0WFWgBEKqxTOVCrCug5XySLaoAdZjb4IUeU427OXzVAdwAitoKIZxCq71bAijc/2BNgRTZxB1cOqSiLzmAGmQAZGsL+1OujOyN50C/6C1gQNENADmOBYDJAmWLdPD/PwVwgBj8nQnIz7ZIU95A3Yy1kg9QPo16nzs7lZFdUJL8ug0m1uAV4RT+IRHwoPzRFqzqX6gxkgPghkFBDQPOYT85Ixe5O4rw2AYQgQx1gE7RybZw3NxIWA4kjxJQyRR2RzFtHc0qAfb92gvegIiQYVx12A22X429knCKjxBKlxUYHFf7AIjyYTYSIBPQYTfWkwPAHPekCBNoABfAEwg4NHMoYvLMgG5QDi8c2Q+4QXakWI2lnMqZAIjQrGviYoflWK3Sqgls2S9G4RPmVbYIp+WsDgNYgdsZHChZm9IogBqpkTc+ZRKRJe6aH6M4jQLAgB9Kq8iwEgsAEDzQUbbg/8YISIfiG4ENYLAThiIaTBcTYFklxdon7cX3WWFLFllLVuEz2RuR8eQxBQ13EA01FpL+swlU7mYQAQEUQIEfQIH5uaqzYMzHeLVXm7Tcwa3h8UJzfCYFwENGoVdjNtclBr1BMoAD2OJKLkLmui4kZeZjHlr2VY8KeL4QWID4GYtJOoFHAcUHOAGKlkhvvmjYeD3/sQgTsKgeK5j12AcV1EuasYAIIoAJqCo35LRhWQCKHeFg2T8FfWlFJU9V/YARzumRrWmdvgCh2LXozIYGgMkDyGaduDJ7wmildo24gcT5caM0EuIRngAj4TqiAiV2voA7oQBl4g08AJAF0Gkraf+FYTGBDXhmiW2LsUOTnc5p+0VrFJ4uzpAOVVuABnmQYTKWDFhqvoaNuGkniuAGcRTHPN7gBHgjDCggsdyiCKBT5ViARmGUN+pfkX0aGiSoDYikfz60ClDBZqtiKxZr320LkGLsALbr78oQDTmNEe1r126NjOQ05ciKzx5ZhJGKj+6e27ifxrEACuAQ/p0XIxZryglRAzjrtkbrcnu1QBbrEcZknVaPCUCwXkoXCmioBOgAamnt1+5umGiBisCK7WiHwr5gtjA38PhoC1CKcqEL/VEARXEHd7ChbajVp1HUKqmc6biKH5Agnm7ZwoGgtq7pt4brHyLdBVqAYaGA30n/gCnVEL3ybgl3iRY4G4IygQ4QiqA4aQ3tQrOagDftoMvaAJE5AHntb+eOu+NQ0BSHos+jnMlscedO5PErmA9graGepArooA5YyIsYgbni7gkf8pMAb/oRDXdQAJ65IA4nIAKaLuoaMQgAJVACkiUpEMdp8QQQmbWQ8Zz+ZALy8i+nLVoWmbargHD0j7A5D6kgAYsmcjgfCSPPiQUAMgbP6QhomH856X2grVDuCRR4koBJ8XLKKZwW85EVh0lqbkQ/rEW3kg5goQLdhwsYwzV3ChNAIAe40jjv9JCY84sQlupgdCgViwuwkncUi27aGxnXtXtpdCiqtbqCdSuBSXbm/wDr8p6TvgCxxUZIfERPD/aPAHWLUBSLInW2sC0QyoZTH2EMEAsdBD8Zl64GpnUn4SappnVPepBibJDIiBpVrfEKMBaJE3ZzH3ajRo736YYMbCgr0QCnK4Fqhy/N0krP6IyO0nYxr/dI0XcC4IzOwIA3+gDJUIe6wYD2c79zX/iNqPBrTBuPVQANgEkriYD743DyDEfi4UZJJDd/13IO8/coDyiVU7ILWzsM+IF9dQqZZfhgXzEezU2KcAAv0aRGD4HsyAoRoPIIyMtm/3ix3nIpkVBtf80CnBcV4BluKgGRCeDeKHeXN3dtGBZtQQ05OrKekY9GP8CImPjIkAddKyAeoE/xI8mAYdX2H9mADjiBdlCB7TiAYDJEc/Lx0tCzqP839wX4aupFi7Rgr+2Fm7jZ+jeCAFoj2J8fe5j+Ebn4aFjPgHC0CeVYF3Mxy9xQiktd80oBAgm4e2FfAOqQjhgBgAXYhsEWnkJC9FbwgHizMARLp8NH/JG1dX+XDkV5gC89uehMl7wSrwYATM6X8BkLDBQUi3rv/Ub/AKgSFlHFHYOMgNeHfStxHukfP4zXacXeclXjhqEOKe27Het91tLAlgj+fU8nAZGhE9ApgX+JKdQfZIbTAOYe0y6E/hRvBQqWcbeNGw+AYAXocoAgQCABh4IcDABIqHChQhS1QICo9W8ixYoWL2LMqHEjx44eP4IMKXIkyZImT6JMqXIlS4z/DyQskIBgIYMCDGqGgCACQgSBPn8C/WnhZoECETgkSDDhAtMLE4JCjSp1KoEJEdRFqPCUaqta6dJtSJehnYp2P/a1ElgBAlsIBhgwjAvgQ8u6du/izat3L9++fleSWLAAwUy4AGzWZHCBKtUPBriZMKEuaVKDSBljzizwwofOHxYzTmcCMjcHph1YoJwgBNgD6QzLTThixN/atm/jzq17N2+KK0g8ELxwwYriKy63SqCZQNoPeAgjmKxa9fLqUSMYX6EhbdAETS+EsCDeQoax5X9sQE9BsOACseHeZNB7Pv369u/jz/sb+AIgChtk4ECAHAyU1EACKXegggom4MFg/wgsUIFAyU23IIPWdYfggRBkg4ABCIhQIIMJXIVVBBBokGIGKiigAgUPwPgAQjTJxYABkRkgUX478tijjz/ipsAKQj6QEFwLNLBCAwC2mEE6PnGX4YQERPCBByB8wEFyA01Q0AQJcKdcgj6JeWCZZ5qZpoUJVNBmBSF4UEstHqSlXAQQQihCPQnsk8AKMWYggqAhqBAbQxRYgEKiQDLaqKOPQqoRi0Ku4F9CxAmpAAUUaJqBgRpa+FMC6siJQS1fGiiOQVsBNSaGUdXD3FLyMBWClR58oFoEwQUXok8N8KpAWxBkoBBsDI2gQAnLlhCps89CG61u6ZymgEJArLDBAf/aZuPfCAgg6CqoC3JwVQQRXMBBuhfUYmotEUTZ6quZoeXVBiekM6wIGqCoAVJ1DtahAq3UU/AGAIwQW8IApCOtww9DHHFK+KZzgApwATHCASFwHMJMAACRTYVlqqncUk3xy68I24IVwj4ikmygzGLSDHPNMqeZIAZfueaaAwdY4GYFSBmIQGQmNJBVmw4YKhsADkgctdRTT42va8UqZMF3hQGAwARdTrBlzBpWZhCcHuAK7AMNfBDlmG/LK2rcZNKtoQcBmmZAASa4Q8HXXyeY1IwALIBBCKZS0LRsDVPduOOPN0qtadYqtEHHISyQjQEGLEAQ4MzJveB0DiRZ3AL/MVpQMtmr58w6mhcq14oFnHI63ge1pFsQmGJKLmCMD3ys8E1QQ1688cfz1rsCCwOQAZZYAg9hA5YRrHrOlK2w+Y2/t1134ON+D2r4sIO6zw9rA7sTW+g2tZVyH4y3QXzHIksUA4wjn7/++9vlQItCegsADyCLAjIgng+UIFfUgduF4vWAhI3ABBaAnwUg8LLwYfBCGvze+MyUFAdExkYJiFVVzDW0MakrXRCAjaWQVQD2LOAH/JshDWsYEhcpQEgIS8gKepaO283pVAaZ2c3IRpkiGakzWNrOzWJ2JieOyIMFooxlMsAAE+xNNRzQiaAuQCE2uSkEBQBCC2u0tges/wAFNlwjG9tIqT8BwDAemI5qvhO2EYoPZqBLABIBkA0RhACQFRibFFX3qZpZTyARKN0KENChbJjgUxHYHB4MEAKlKOUAAsqAAugnFwR84HltHCUp98eiITUANhsQlKDOdS6spOgoE5rZiL70pQfcJCHlyUA3PPCdIuoRZ3oMpnIuEMbSucBoJtgcZVpxAZ5V7DQOgA5hElLGuCCglNrcpvFUMCQFFGlhKvDMB1gJyBSh6AKUyaPMLNNHPz4HAenQgCsPKSJDcpCDCKInPTGggNIhwB0M4MYIAseBOHkAAytgSGKYFxf/+GcB3JwoRaP2Rlxa6gErUgFHWaQCB7BlJ3KgsdmIVNPHb3koG9nC1wbUKUycvRSKNEvALjPwA1dGoJM3McA6vdMUpilOLpaSaEWLalRngVNJSEwYgHapgHY8NVCsdCktm3jEHXYNOg/QVA4l9MQnTpGIYk0KcGCUDlvS1B034sZ0uqQUoAY1Ljch6lH/62rXHv3pASlIAWxuihV1fKcC5lRn9WZKRArhsigmWAHtZPQYyczUg0VE00wto0wTDIwy6WiBI3k6MwodIK4MNcFc72ra09ZnBdpIAfCM9LQg+tIyl6vAnpLTJYPoES37oIDmOqQk00EmMhHY02SDOUXJVoCfEHgQAjyVnFYcgJpJ+aIt4SrarBJmBajdLndvEz3C5HKnm8sGVRNguHYNshV9Sm4E6JmUPn2RABn4HQwHB4DJ2AymIzuuciygAk5mYBuaosAP+KTe88FoAXdMipsukAGHxtU4CvhGdyts4bxIAJKkTYh7iGMc5EwABGjzgDqm6IEO/KADuWpdAk6Q/8Mc3igyEGJPBOgoWcrCdCARCOTlOCYCTCbgfEtagWrUkUMKNPK61kRBKEN54SdDOSUtiOP8arJVTiqAaEnpjHhqLCYLHCDMBaZMnwq0gbGUZTYFGEE2YpQ0TBKoqiwOa1KMmZVz8VMrBElAB4rDqXVq4GgmULJsPBDlQyOaJC0wDAOgswAKSFPLHBiPBZjIJwtsYAMd6ACfppMWEPwgxT9gbHE24K5aaKACSjMsHVs9U1TZ8msR8CGWNYUitngAYTZRMnwS7etfc2TKCGOA2q4sIAd8ybaJ6gAKvLxlFIS6BD1VDQYmKJ5NZqAD7TLVTvgFgQVGdtp0/pqWwRQB2v9RCskUuF2cNgDhoF7xaMCeN70nIuyupSfTYQFLOojWigkoKsUaaKYHSjBBBU630wkQQbva1bFql0dA20JPalrNX1d7Rx2qdnYCOIQjiLoHNsd697UUggAYAafeKve1ARZmgLI8tSxQbYcGjKlqbbnm2/VIjgcsYPC2zZRCIjAVt1lpgey0wzQBErerSZoADVxONRpwM2PVvcwbeTKoD5Dmyrse5SkvjJozFsztMIABD3RjlyGizIlRjHCFK4djtTic0CzgIcLAsAEWnzbGa5GeUOuqYhUrQZxM1VnNEXoEGWgyCLzueAu3PCEGcOp6grOA/66oHUta0iUpg4EEdgb/44DsWAXUsY4I2J0w2YDhAzDuetX84MUK6BjDKd3tEyGEKIRm2ON7b2Gwj+B+1fodko3DqwfUQjW1aPIcXQ0B2v8V9R/6EHvW9vrrb+CMyI/TnMjJEzwPjuSKO4Hvy29XFCjdAcxbQIpS1HPxyJAy/0j/jylzOFN1/vUceGqnypN2TX3T9b3eBpzO2iDFl0TAV3zFAhQANzQgVu0eA2yA+VFgUZ3ApFCACYSdt0HAiSlKB/yD/OFNoKgGnMwJBgjgBBgHgEjTz/xMOgig66XD79DTuYgAiqXHAsTR7skF/lTgD5aSCiAAZyEAXCQMAnCM4VjACWjLBIqgA7RDN9Tf/5aFGgpI2/VxAAwZ0Hh8nwasQwy2lUGkA+sJxgOowOWkEsjwIJXdBPkB4RuOkgqYQDa0wIb5BwJYG6Y5iWmEYFL8Q9r9V/4lgEXEoGeAnmeswy+5WkGsy+WA2r1swIvwSm9xDuZlwEysGQ8ywCEQxiHIEByCog0pAGld0WxIXqidwA84AMy1Qx8O4i5JoWoQogBaxEPIiVMAzpeUG4PdWQSEhWsowFpxjvYRRQQ50hAO2ghck2gxgOVpwyeGYjTuzwrMzzJB0gJY2wdsANdVBEflkI6sxO+IgNC017kMEmU4wPFJ0waUSi2owO+M14dwFQUEDw9mg2loUuNJ4z4iD9w1Bp8ftQD1PQREoEB6pKJF5NA2jBNL1AJMQEgItElW+FgIcNwl4p3gAY05zVeMUCICKICAKUA97h4CZBoTgiM/oqTjdJI1lSFxfIQ3qoAFMKQ0QUBTVECxjZkfakTFuEbmGADiKQQ3/ORPrqHJRcRDpGRSquRNkBYjZcBHfIUDpIM+qkQtnAATnsDcdUyMLAAIdsTdwFwDnI5gjAZpIYCE2dfuLYCcyIlSuqXUqIBMwMRVXqUa0YcCrJY2aAMCyOUBVMQPBEh5lCHwQNLmKIDgpQM1CUtbLFRR0tVb/0JmxIDAsvhcW/7DSfLGCUiTa+BLs1CEAxgHBRBeZ4whdDgAim0aujmAlVjJOyXeY0ZmbP4atF3lD1ihFVLlP2RAcZCAdlGEBcBQOvjctQUmalhAB1iAa15XwsCmbDqn79UCNlQECogdDG3KpqwADA3aGjJAcz7nd5YfCjBXAZ5OcWjKA2hOJWWd4hjGCHgneMKn15XAkAxJOoRaesgeEgWQJjZjfPpn75XA72wAZZZAqIUa1hQlNfnmfzKoyqFAC3BWC/zAqZmTBUBgyUWYeRJPg3IosFGnVpUVGv2WDspGxhgLvB0cRHToivoaCsgEZ8nEXu0VTMhE8DGAiSKM+H/FBRBhJov66KH9gGtUTEd5EzUZQAtoGAMsjPgxQI/+6JNCWQncJgpg5Tb+T3YkiZFCUFxAaZd6XURggwdI50Os4n/5o1x4aZr6npQmygGUJWklDFyo6Zz63oMOISTtoHzQ6Z52HQj8j5AAR8rx6aDSGwicxin15go4KaHWRkAAADs="
-}
\ No newline at end of file
+# Title:	Assets 
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# Define world data
+
+import World
+
+## Define World Levels ##
+
+MAZE = {
+	"Width" : 12,
+	"Height" : 14,
+	
+	"Background" : "#B5A7B7",
+
+	"Walls" : [(1, 3, 11, 3), (11, 3, 11, 13), (11, 13, 1, 13), (1, 13, 1, 3), (3, 3, 3, 4), (3, 4, 2, 4), (7, 3, 7, 4), (7, 4, 9, 4), (9, 4, 9, 5), (10, 3, 10, 5), (11, 7, 10, 7), (11, 10, 10, 10), (10, 10, 10, 12), (10, 11, 9, 11), (9, 11, 9, 12), (9, 12, 8, 12), (7, 13, 7, 10), (7, 11, 8, 11), (7, 10, 5, 10), (5, 10, 5, 9), (6, 9, 3, 9), (3, 9, 3, 8), (6, 9, 6, 6), (6, 8, 7, 8), (6, 7, 5, 7), (6, 6, 7, 6), (6, 13, 6, 12), (3, 13, 3, 10), (2, 10, 4, 10), (4, 10, 4, 12), (4, 11, 6, 11), (4, 12, 5, 12), (1, 11, 2, 11), (2, 11, 2, 12), (1, 9, 2, 9), (2, 9, 2, 6), (2, 7, 4, 7), (4, 8, 4, 6), (4, 8, 5, 8), (4, 6, 5, 6), (5, 6, 5, 5), (5, 5, 8, 5), (6, 5, 6, 4), (8, 5, 8, 7), (8, 7, 7, 7), (8, 6, 10, 6), (9, 6, 9, 8), (8, 8, 10, 8), (10, 8, 10, 9), (10, 9, 9, 9), (9, 9, 9, 10), (8, 8, 8, 10), (8, 9, 7, 9), (1, 5, 4, 5), (3, 5, 3, 6), (4, 5, 4, 4), (4, 4, 5, 4)],
+	
+	"Objects" : [
+		World.ObjectText(1, 1.4, "LEVEL ONE", "Monospace", 0.6, "#000000", "w"),
+		World.ObjectText(1, 2.2, "FIND THE EXIT", "Monospace", 0.6, "#000000", "w")
+	],
+	
+	"TreasurePoints" : [
+		(4.5, 8.5),
+		(3.5, 12.5),
+		(5.5, 9.5),
+		(2.5, 3.5),
+		(10.5, 9.5),
+		(7.5, 3.5),
+		(9.5, 8.5)
+	]
+}
+
+JESUS = {
+	"Width" : 12,
+	"Height" : 12,
+	
+	"Background" : "#B5A7B7",
+	"TreasurePoints" : [(6, 6)],
+	
+	"Images" : [
+		(6, 6, 10, 1)
+	]
+}
+
+HAND = {
+	"Width" : 12,
+	"Height" : 12,
+	
+	"Background" : "#B5A7B7",
+	
+	"Images" : [
+		(6, 6, 10, 2)
+	]
+}
+
+# Images are kept in an asset pack (see Pack.py) and only read when a scene needs them, indexed by their number
+IMAGE_PACK = "Images.pack"
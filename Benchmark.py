@@ -0,0 +1,278 @@
+# Title:	Benchmark for Zombie (frame times against maze size and entity count)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py, run with: python3 Benchmark.py --walls 100 1000 10000 --entities 1 100
+# Version:	v0.0
+
+# Generates synthetic mazes with a number of walls and men, runs them headless for a number of frames
+# and reports how long each phase of a frame took. The results are saved as JSON so runs can be compared.
+# With --display the same mazes are also drawn on a real window with each of Display's presentation modes.
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import Display
+import Headless
+import Level
+import Physics
+import Profiler
+import World
+import Zombie
+
+def Summary(samples):
+	ordered = sorted(samples)
+
+	return {
+		"mean" : sum(ordered) / len(ordered) if len(ordered) > 0 else 0.0,
+		"p50" : Profiler.Profiler.Percentile(ordered, 50),
+		"p99" : Profiler.Profiler.Percentile(ordered, 99),
+		"max" : ordered[-1] if len(ordered) > 0 else 0.0,
+	}
+
+def SyntheticMaze(wall_count, seed = 0):	# A square maze with wall_count unit walls on the grid lines (plus the outside walls)
+	rng = random.Random(seed)
+
+	side = max(2, int(math.ceil(math.sqrt(wall_count / 1.5))))
+
+	edges = []
+
+	for x in range(side):
+		for y in range(side):
+			if y > 0:
+				edges.append((x, y, x + 1, y))
+
+			if x > 0:
+				edges.append((x, y, x, y + 1))
+
+	walls = rng.sample(edges, min(wall_count, len(edges)))
+
+	walls += [(0, 0, side, 0), (side, 0, side, side), (side, side, 0, side), (0, side, 0, 0)]
+
+	return {
+		"Width" : side,
+		"Height" : side,
+		"Walls" : walls,
+	}
+
+def Populate(world, wall_count, entity_count, seed = 0, hunter_count = 0, compile_level = False):	# Replace the game with a synthetic maze of walking men (and hunters chasing the first), compile_level merges its walls first
+	rng = random.Random(seed)
+
+	world_data = SyntheticMaze(wall_count, seed)
+
+	if compile_level:
+		world_data = Level.Compile(world_data)
+
+	world.ClearEntities()
+	world.ClearPointListeners()
+	world.SetWorld(world_data)
+
+	for i in range(entity_count):
+		man = World.Man(rng.randrange(world.width) + 0.5, rng.randrange(world.height) + 0.5, 0.35)
+		man.velocity = World.Man.WALK_SPEED
+		man.direction = rng.uniform(-math.pi, math.pi)
+		world.AddEntity(man)
+
+	if entity_count > 0:
+		for i in range(hunter_count):
+			world.AddEntity(World.Hunter(rng.randrange(world.width) + 0.5, rng.randrange(world.height) + 0.5, 0.35, world.entities[0]))
+
+def Run(wall_count, entity_count, frames, redraw_static = False, seed = 0, hunter_count = 0, compile_level = False):
+	z = Zombie.Zombie(headless = True)
+	world = z.world
+
+	Populate(world, wall_count, entity_count, seed, hunter_count, compile_level)
+
+	# Keep the phase times of every frame
+	z.profiler.Reset(frames)
+
+	frame_times = []
+
+	for i in range(frames):
+		if redraw_static:		# Pretend the window was resized, so the walls are redrawn every frame
+			world.version += 1
+			world.Damage()
+
+		start = time.perf_counter()
+		z.display.Frame()
+		frame_times.append(time.perf_counter() - start)
+
+	return {
+		"walls" : len(world.walls),
+		"entities" : entity_count,
+		"hunters" : hunter_count,
+		"compiled" : compile_level,
+		"frames" : frames,
+		"redraw_static" : redraw_static,
+		"frame" : Summary(frame_times),
+		"phases" : dict((name, Summary(z.profiler.Samples(name))) for name in z.profiler.phases),
+		"canvas_calls" : z.display.canvas.calls,
+		"idle_frames" : z.display.idle_count,
+	}
+
+def CheckScroll(frames, seed = 0):		# Follow a man around a zoomed world and check the scene after every frame (see Headless.CheckScene), gives the problems found
+	rng = random.Random(seed)
+
+	z = Zombie.Zombie(headless = True)
+	world = z.world
+
+	# An open maze, so the man keeps walking and the camera keeps scrolling
+	world_data = SyntheticMaze(400, seed)
+	world_data["Walls"] = world_data["Walls"][::10] + world_data["Walls"][-4:]
+	world_data["Images"] = [(world_data["Width"] / 2.0, world_data["Height"] / 2.0, 2.0, 1)]
+	world_data["Zoom"] = 3.0
+
+	world.ClearEntities()
+	world.ClearPointListeners()
+	world.SetWorld(world_data)
+
+	man = World.Man(world.width / 2.0, world.height / 2.0, 0.35)
+	man.velocity = World.Man.WALK_SPEED
+	world.AddEntity(man)
+	world.camera.Follow(man)
+
+	problems = []
+
+	for i in range(frames):
+		if i % 40 == 0:
+			man.direction = rng.uniform(-math.pi, math.pi)
+
+		if i == frames // 2:	# New items are made on top, they have to be put back in their layers
+			world.AddEntity(World.Man(man.x, man.y, 0.35))
+
+		z.display.Frame()
+
+		problems += ["frame " + str(i) + ": " + problem for problem in Headless.CheckScene(z.display.scene)]
+
+	return problems
+
+def RunDisplay(present, wall_count, entity_count, frames, seed = 0):	# Time frames drawn on a real window (needs a display) with a presentation mode
+	clock = Headless.VirtualClock()
+	z = Zombie.Zombie(clock = clock, present = present)
+	display = z.display
+
+	Populate(z.world, wall_count, entity_count, seed)
+
+	display.Open()
+	display.screen.update()		# Map the window before timing
+
+	z.profiler.Reset(frames)
+
+	frame_times = []
+
+	# Frames are run back to back with the same simulation as headless, every frame is drawn and shown
+	for i in range(frames):
+		clock.Advance(Headless.HeadlessDisplay.FRAME_TIME)
+
+		start = time.perf_counter()
+		z.world.Tick()
+		display.Draw()
+		z.profiler.EndFrame()
+		display.screen.update()
+		frame_times.append(time.perf_counter() - start)
+
+	display.Close()
+
+	return {
+		"present" : present,
+		"walls" : len(z.world.walls),
+		"entities" : entity_count,
+		"frames" : frames,
+		"frame" : Summary(frame_times),
+		"phases" : dict((name, Summary(z.profiler.Samples(name))) for name in z.profiler.phases),
+	}
+
+def Commit():		# The git commit being benchmarked, if there is one
+	try:
+		return subprocess.check_output(
+			["git", "rev-parse", "HEAD"],
+			cwd = os.path.dirname(os.path.abspath(__file__)),
+			stderr = subprocess.DEVNULL
+		).decode().strip()
+
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def Main():
+	parser = argparse.ArgumentParser(description = "Benchmark Zombie frame times against maze size and entity count")
+	parser.add_argument("--walls", type = int, nargs = "+", default = [100, 1000, 10000], help = "Numbers of walls to test")
+	parser.add_argument("--entities", type = int, nargs = "+", default = [1, 100], help = "Numbers of men to test")
+	parser.add_argument("--frames", type = int, default = 200, help = "Frames to run for each test")
+	parser.add_argument("--hunters", type = int, default = 0, help = "Men chasing the first man through the maze in each test")
+	parser.add_argument("--redraw-static", action = "store_true", help = "Redraw the walls every frame (as if the window was being resized)")
+	parser.add_argument("--compile", action = "store_true", help = "Merge the walls of the mazes with the level compiler (see Level.py)")
+	parser.add_argument("--display", action = "store_true", help = "Also compare the presentation modes on a real window (needs a display)")
+	parser.add_argument("--check", action = "store_true", help = "Only check the scene is drawn in the right place as the camera scrolls a zoomed world")
+	parser.add_argument("--seed", type = int, default = 0)
+	parser.add_argument("--output", default = "bench_output.json", help = "JSON file to save the results to")
+	args = parser.parse_args()
+
+	if args.check:
+		problems = CheckScroll(args.frames, args.seed)
+
+		for problem in problems[:10]:
+			print(problem)
+
+		print("%d problems in %d frames" % (len(problems), args.frames))
+
+		if len(problems) > 0:
+			sys.exit(1)
+
+		return
+
+	results = {
+		"commit" : Commit(),
+		"python" : platform.python_version(),
+		"numpy" : Physics.numpy is not None,
+		"time" : time.time(),
+		"runs" : [],
+	}
+
+	print("%8s %8s %10s %10s  %s" % ("walls", "entities", "p50 (ms)", "p99 (ms)", "slowest phase (p99 ms)"))
+
+	for wall_count in args.walls:
+		for entity_count in args.entities:
+			run = Run(wall_count, entity_count, args.frames, args.redraw_static, args.seed, args.hunters, args.compile)
+			results["runs"].append(run)
+
+			slowest = max(run["phases"].items(), key = lambda phase: phase[1]["p99"])
+
+			print("%8d %8d %10.3f %10.3f  %s %.3f" % (
+				run["walls"],
+				entity_count,
+				run["frame"]["p50"] * 1000,
+				run["frame"]["p99"] * 1000,
+				slowest[0],
+				slowest[1]["p99"] * 1000
+			))
+
+	if args.display:
+		results["display_runs"] = []
+
+		print("%8s %8s %8s %10s %10s %14s" % ("present", "walls", "entities", "p50 (ms)", "p99 (ms)", "present p99 ms"))
+
+		for present in (Display.Display.SWAP, Display.Display.SINGLE):
+			for wall_count in args.walls:
+				for entity_count in args.entities:
+					run = RunDisplay(present, wall_count, entity_count, args.frames, args.seed)
+					results["display_runs"].append(run)
+
+					print("%8s %8d %8d %10.3f %10.3f %14.3f" % (
+						present,
+						run["walls"],
+						entity_count,
+						run["frame"]["p50"] * 1000,
+						run["frame"]["p99"] * 1000,
+						run["phases"]["present"]["p99"] * 1000
+					))
+
+	with open(args.output, "w") as f:
+		json.dump(results, f, indent = 1)
+
+if __name__ == "__main__":
+	Main()
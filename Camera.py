@@ -0,0 +1,49 @@
+# Title:	Camera module for Zombie (which part of the world is shown in the window)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# The camera looks at the middle of the world or follows an entity. At a zoom of 1.0 the whole world fits
+# in the window, at 2.0 half of it does and so on. The camera stops at the edges of the world, so a world
+# smaller than the window is always shown in the middle.
+
+class Camera():
+	MARGIN = 0.5		# Extra part of the view (relative to its size, on each side) the static layers are drawn for, they are moved rather than redrawn until the camera leaves it
+
+	def __init__(self, target = None, zoom = 1.0):
+		self.target = target	# The entity followed (None to look at the middle of the world)
+		self.zoom = zoom		# How far the camera is zoomed in, 1.0 fits the whole world in the window
+
+	def Follow(self, target, zoom = None):
+		self.target = target
+
+		if zoom != None:
+			self.zoom = zoom
+
+	def View(self, world, width, height, alpha):	# (scale, x offset, y offset) which put a world point at (x offset + (x * scale), y offset + (y * scale)) in the window
+		scale = Camera.Scale(world.width, world.height, width, height, self.zoom)
+
+		# Look at the target between its last two steps, like it is drawn
+		if self.target != None:
+			x = self.target.last_x + ((self.target.x - self.target.last_x) * alpha)
+			y = self.target.last_y + ((self.target.y - self.target.last_y) * alpha)
+
+		else:
+			x = world.width / 2.0
+			y = world.height / 2.0
+
+		x = Camera._Clamp(x, width / scale, world.width)
+		y = Camera._Clamp(y, height / scale, world.height)
+
+		return (scale, (width / 2.0) - (x * scale), (height / 2.0) - (y * scale))
+
+	@staticmethod
+	def Scale(world_width, world_height, width, height, zoom):		# The scale a world is drawn at, at a zoom of 1.0 it fits in the window
+		return min(width / float(world_width), height / float(world_height)) * zoom
+
+	@staticmethod
+	def _Clamp(centre, view_size, world_size):	# Keep the view inside the world, or in the middle if it is bigger than the world
+		if view_size >= world_size:
+			return world_size / 2.0
+
+		return min(max(centre, view_size / 2.0), world_size - (view_size / 2.0))
@@ -0,0 +1,249 @@
+# Title:	Chunks module for Zombie (streams the walls of very large worlds)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py, build a chunk file from a world with: python3 Chunks.py <world name in Assets.py> <chunk file>
+# Version:	v0.0
+
+# A large world is split into square chunks of walls. Only the chunks around a point (the camera) are kept
+# in the world, the rest are left in their source until they are needed and dropped again once they are far
+# away, so memory and load time depend on the area around the player rather than the size of the world.
+# Chunks are loaded on a background thread and added to the world on the main thread.
+#
+# A chunk source has width, height and chunk_size attributes and a Load(cx, cy) method giving the walls,
+# a list of (x1, y1, x2, y2), of the chunk at (cx * chunk_size, cy * chunk_size). A wall belongs to the
+# chunk its first point is in. There are two sources:
+#	ChunkFile:		reads chunks from a chunk file through mmap
+#	ProceduralMaze:	makes the walls of each chunk from a seed when they are needed
+#
+# Chunk file format (little endian):
+#	Header:		magic "ZCHK", version (uint16), reserved (uint16), width, height, chunk size (float32), chunk count (uint32)
+#	Index:		one entry per chunk: cx (int32), cy (int32), offset (uint32), wall count (uint32)
+#	Data:		the walls of each chunk, x1, y1, x2, y2 (float32), at the offsets given in the index
+
+import math
+import mmap
+import queue
+import random
+import struct
+import sys
+import threading
+
+MAGIC = b"ZCHK"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHfffI")
+ENTRY = struct.Struct("<iiII")
+WALL = struct.Struct("<ffff")
+
+CHUNK_SIZE = 16.0		# Size of one chunk (relative to one size unit)
+
+class ChunkError(Exception):
+	pass
+
+class ChunkFile():
+	def __init__(self, path):
+		self.path = path
+		self.index = {}		# (offset, wall count) indexed by (cx, cy)
+
+		self.file = open(path, "rb")
+
+		try:
+			self.data = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+
+		except ValueError:	# An empty file can't be mapped
+			self.file.close()
+			raise ChunkError(path + " is not a chunk file")
+
+		self._ReadIndex()
+
+	def _ReadIndex(self):
+		if len(self.data) < HEADER.size:
+			raise ChunkError(self.path + " is not a chunk file")
+
+		magic, version, reserved, self.width, self.height, self.chunk_size, count = HEADER.unpack_from(self.data, 0)
+
+		if magic != MAGIC:
+			raise ChunkError(self.path + " is not a chunk file")
+
+		if version != VERSION:
+			raise ChunkError(self.path + " is version " + str(version) + ", expected " + str(VERSION))
+
+		for i in range(count):
+			cx, cy, offset, walls = ENTRY.unpack_from(self.data, HEADER.size + (i * ENTRY.size))
+
+			if offset + (walls * WALL.size) > len(self.data):
+				raise ChunkError(self.path + " is truncated")
+
+			self.index[(cx, cy)] = (offset, walls)
+
+	def Load(self, cx, cy):
+		entry = self.index.get((cx, cy))
+
+		if entry is None:	# Empty chunks are left out
+			return []
+
+		offset, walls = entry
+
+		return list(WALL.iter_unpack(self.data[offset:offset + (walls * WALL.size)]))
+
+	def Close(self):
+		self.data.close()
+		self.file.close()
+
+class ProceduralMaze():		# An endless supply of maze, each unit grid edge is a wall with the chance density
+	def __init__(self, width, height, seed = 0, density = 0.4, chunk_size = CHUNK_SIZE):
+		self.width = width
+		self.height = height
+		self.seed = seed
+		self.density = density
+		self.chunk_size = chunk_size
+
+	def Load(self, cx, cy):
+		# The same chunk always gets the same walls, whenever it is loaded
+		rng = random.Random((self.seed * 1000003 + cx) * 1000003 + cy)
+
+		x1 = int(cx * self.chunk_size)
+		y1 = int(cy * self.chunk_size)
+		x2 = min(int((cx + 1) * self.chunk_size), int(self.width))
+		y2 = min(int((cy + 1) * self.chunk_size), int(self.height))
+
+		walls = []
+
+		for x in range(x1, x2):
+			for y in range(y1, y2):
+				if y > 0 and rng.random() < self.density:
+					walls.append((x, y, x + 1, y))
+
+				if x > 0 and rng.random() < self.density:
+					walls.append((x, y, x, y + 1))
+
+		# The outside walls, split along the chunks
+		if y1 == 0:
+			walls.append((x1, 0, x2, 0))
+
+		if x1 == 0:
+			walls.append((0, y1, 0, y2))
+
+		if y2 == int(self.height):
+			walls.append((x1, y2, x2, y2))
+
+		if x2 == int(self.width):
+			walls.append((x2, y1, x2, y2))
+
+		return walls
+
+class ChunkLoader():
+	LOAD_RADIUS = 2		# Chunks (in each direction) around the focus which are loaded
+	EVICT_RADIUS = 3	# Chunks further than this from the focus are dropped, more than LOAD_RADIUS so moving along a chunk edge does not reload chunks
+
+	def __init__(self, source, world, threaded = True):
+		self.source = source
+		self.world = world			# The World.World the walls are added to
+
+		self.resident = {}			# Indexes of the walls in the world for each loaded chunk, indexed by (cx, cy)
+		self.pending = set()		# Chunks asked for but not loaded yet
+
+		self.columns = int(math.ceil(source.width / source.chunk_size))
+		self.rows = int(math.ceil(source.height / source.chunk_size))
+
+		self.requests = queue.Queue()	# Chunks for the background thread to load (None to stop)
+		self.results = queue.Queue()	# Loaded chunks, a list of ((cx, cy), walls)
+
+		self.thread = None				# Without a thread chunks are loaded straight away in Update
+
+		if threaded:
+			self.thread = threading.Thread(target = self._Work, name = "Chunk loader")
+			self.thread.daemon = True
+			self.thread.start()
+
+	def _Work(self):				# Runs on the background thread
+		while True:
+			chunk = self.requests.get()
+
+			if chunk is None:
+				return
+
+			self.results.put((chunk, self.source.Load(chunk[0], chunk[1])))
+
+	def Chunk(self, x, y):			# The chunk which contains a point
+		return (int(math.floor(x / self.source.chunk_size)), int(math.floor(y / self.source.chunk_size)))
+
+	def Update(self, x, y):			# Load the chunks around (x, y) and drop the ones far from it, run on the main thread
+		focus_x, focus_y = self.Chunk(x, y)
+
+		# Ask for the missing chunks, nearest first
+		wanted = []
+
+		for cx in range(max(0, focus_x - ChunkLoader.LOAD_RADIUS), min(self.columns, focus_x + ChunkLoader.LOAD_RADIUS + 1)):
+			for cy in range(max(0, focus_y - ChunkLoader.LOAD_RADIUS), min(self.rows, focus_y + ChunkLoader.LOAD_RADIUS + 1)):
+				if not (cx, cy) in self.resident and not (cx, cy) in self.pending:
+					wanted.append((cx, cy))
+
+		wanted.sort(key = lambda chunk: max(abs(chunk[0] - focus_x), abs(chunk[1] - focus_y)))
+
+		for chunk in wanted:
+			self.pending.add(chunk)
+
+			if self.thread != None:
+				self.requests.put(chunk)
+
+			else:
+				self.results.put((chunk, self.source.Load(chunk[0], chunk[1])))
+
+		# Add the chunks which have been loaded, unless they are already too far away
+		while True:
+			try:
+				chunk, walls = self.results.get_nowait()
+
+			except queue.Empty:
+				break
+
+			self.pending.discard(chunk)
+
+			if self._Distance(chunk, focus_x, focus_y) <= ChunkLoader.EVICT_RADIUS:
+				self.resident[chunk] = self.world.AddWalls(walls)
+
+		# Drop the far away chunks
+		for chunk in list(self.resident.keys()):
+			if self._Distance(chunk, focus_x, focus_y) > ChunkLoader.EVICT_RADIUS:
+				self.world.RemoveWalls(self.resident.pop(chunk))
+
+	@staticmethod
+	def _Distance(chunk, focus_x, focus_y):
+		return max(abs(chunk[0] - focus_x), abs(chunk[1] - focus_y))
+
+	def Close(self):				# Stop loading, the walls already added are left in the world
+		if self.thread != None:
+			self.requests.put(None)
+			self.thread = None
+
+def Write(path, width, height, walls, chunk_size = CHUNK_SIZE):	# Write a chunk file from a list of walls (x1, y1, x2, y2)
+	chunks = {}
+
+	for wall in walls:
+		chunk = (int(math.floor(wall[0] / chunk_size)), int(math.floor(wall[1] / chunk_size)))
+		chunks.setdefault(chunk, []).append(wall)
+
+	keys = sorted(chunks.keys())
+	offset = HEADER.size + (len(keys) * ENTRY.size)
+
+	with open(path, "wb") as f:
+		f.write(HEADER.pack(MAGIC, VERSION, 0, width, height, chunk_size, len(keys)))
+
+		for key in keys:
+			f.write(ENTRY.pack(key[0], key[1], offset, len(chunks[key])))
+			offset += len(chunks[key]) * WALL.size
+
+		for key in keys:
+			for wall in chunks[key]:
+				f.write(WALL.pack(wall[0], wall[1], wall[2], wall[3]))
+
+if __name__ == "__main__":
+	if len(sys.argv) < 3:
+		print("Usage: python3 Chunks.py <world name in Assets.py> <chunk file>")
+		sys.exit(1)
+
+	import Assets
+
+	world_data = getattr(Assets, sys.argv[1])
+
+	Write(sys.argv[2], world_data["Width"], world_data["Height"], world_data.get("Walls", []))
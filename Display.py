@@ -1,173 +1,297 @@
-# Title:	Display module for Zombie
-# Author:	Nicholas Wright
-# Info:		To be used with Zombie.py
-# Version:	v0.0
-
-import time
-import tkinter
-
-# Creates a GUI window to play a game
-
-class Display():
-	MIN_WIDTH = 800		# Minimum window width
-	MIN_HEIGHT = 700	# Minimum window height
-	REFRESH_RATE = 40	# Refresh rate in Hz
-	
-	MINIMUM_WAIT_TIME = 0.01	# The minimum time which the process waits for between renders (100 FPS)
-	STAT_X = 6					# X position of the statistics display
-	STAT_Y = 6					# Y position of the statistics display
-	STAT_SIZE = 14				# Font size of the statistics display
-	
-	STATS_KEY = 123				# Key binding for showing stats
-
-	def __init__(self, draw_function, title):
-		# Required values
-		self.draw_function = draw_function		# A function of the form: def Draw(canvas, width, height)
-		self.title = title						# The name of the window
-		
-		# Values which may be modified
-		self.max_fps = Display.REFRESH_RATE		# Maximum FPS allowed
-		self.show_stats = False					# If statistics should be shown on the screen (e.g. fps)
-		self.on_ready = None					# A function to run when the display is ready
-		
-		self.key_listeners = []					# A list of methods to call when a key is pressed
-		
-		# Running variables
-		self.alive = False						# If the window is active or not
-		self.last_stats = 0						# The last time.time() the stats were calculated
-		self.frame_count = 0					# Counts updates to calculate the FPS
-		self.render_time_sum = 0				# The sum of the time it takes to render a frame
-		self.fps = 0							# The measured FPS
-		self.render_duty = 0					# A ratio of the time it takes to render a frame to the total time passed
-		
-		self.screen = None						# Tkinter screen object
-		self.flip = False						# Which buffer is visible
-		self.buffers = [None, None]				# Canvas Objects
-		
-		self.width = Display.MIN_WIDTH
-		self.height = Display.MIN_HEIGHT
-		
-		# Misc
-		self.font = ("Monospace", Display.STAT_SIZE)
-		
-	def AddKeyListener(self, listener):
-		self.key_listeners.append(listener)
-		
-	def RemoveKeyListener(self, listener):
-		new_listeners = []
-		
-		for l in self.key_listeners:
-			if l != listener:
-				new_listeners.append(l)
-				
-		self.key_listeners = new_listeners
-		
-	def MainLoop(self, on_ready = None):							# Open the window and call the draw_function on every update
-		self.on_ready = on_ready
-		# Open the display
-		self._Setup()
-		
-		# Set the first callback
-		self.screen.after(int(1000.0 / self.max_fps), self._Update)
-		
-		# Main loop
-		self.alive = True
-		self.screen.mainloop()
-		self.alive = False
-		
-	def _Setup(self):
-		# Create the screen
-		self.screen = tkinter.Tk()
-		self.screen.title(self.title)
-		self.screen.minsize(Display.MIN_WIDTH, Display.MIN_HEIGHT)
-		self.screen.bind("<Configure>", self._OnResize)				# Call _OnResize when the window is resized
-		self.screen.bind("<KeyPress>", self._OnKeyEvent)
-		self.screen.bind("<KeyRelease>", self._OnKeyEvent)
-		
-		# Create the canvass, one for each buffer
-		for i in range(2):
-			self.buffers[i] = tkinter.Canvas(
-			self.screen, 
-			width = self.width,
-			height = self.height,
-			bd = 0							# Set border width
-		)
-		
-		self.buffers[self.flip].place(x = 0, y = 0)	# Place the first buffer
-		
-	def _OnKeyEvent(self, event):
-		for listener in self.key_listeners:
-			listener(event)
-			
-		# Custom
-		if str(event.type) == "KeyPress" and event.keycode == Display.STATS_KEY:
-			self.show_stats = not self.show_stats
-		
-	def _Update(self):
-		# Run the on_ready if set
-		if self.on_ready != None:
-			self.on_ready()
-			self.on_ready = None
-	
-		# Find the time passed since the last update and calculate the FPS
-		render_start = time.time()
-		time_passed = render_start - self.last_stats
-		
-		self.frame_count += 1
-		
-		if time_passed >= 1.0:	# 1 second passed, set the FPS
-			self.last_stats = render_start
-			
-			# Calculate stats
-			self.fps = self.frame_count
-			self.render_duty = (self.render_time_sum / self.frame_count) / time_passed
-			
-			self.frame_count = 0
-			self.render_time_sum = 0
-		
-		# Flip the buffers
-		self.flip = not self.flip
-		
-		# Update everything
-		self.buffers[self.flip].delete("all")			# Clear the canvas
-		self.draw_function(self.buffers[self.flip], self.width, self.height)
-		
-		self.buffers[self.flip].place(x = 0, y = 0)
-		self.buffers[not self.flip].place_forget()
-		
-		# Display the FPS and duty cycle if needed
-		if self.show_stats:
-			stats = str(self.fps) + " FPS, Rendering @ " + str(round(self.render_duty * 100, 2)) + "%"
-			self.buffers[self.flip].create_text(
-				Display.STAT_X, 
-				Display.STAT_Y, 
-				font = self.font, 
-				text = stats,
-				anchor = tkinter.NW)
-		
-		# Calculate the render time and time to sleep until the next frame
-		time_passed = time.time() - render_start
-		self.render_time_sum += time_passed
-		
-		wait_time = (1.0 / self.max_fps) - time_passed
-		
-		if wait_time < Display.MINIMUM_WAIT_TIME:		# Restrict the render cycle from taking up everything
-			wait_time = Display.MINIMUM_WAIT_TIME
-
-		self.screen.after(int(1000.0 * wait_time), self._Update)
-		
-	def _OnResize(self, event):
-		# Return if not running yet
-		if not self.alive:
-			return
-	
-		# Get the new size
-		self.width = self.screen.winfo_width()
-		self.height = self.screen.winfo_height()
-		
-		# Configure the canvas
-		for i in range(2):	
-			self.buffers[i].configure(
-				width = self.width,
-				height = self.height,
+# Title:	Display module for Zombie
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+import math
+import time
+import tkinter
+
+import Scene
+import Profiler
+import Input
+
+# Creates a GUI window to play a game
+
+class Display():
+	MIN_WIDTH = 800		# Minimum window width
+	MIN_HEIGHT = 700	# Minimum window height
+	REFRESH_RATE = 40	# Refresh rate in Hz
+	
+	MINIMUM_WAIT_TIME = 0.01	# The minimum time which the process waits for between renders (100 FPS)
+	MAX_DROPPED_FRAMES = 3		# Most frames in a row which may be skipped (not drawn) when rendering falls behind
+	STAT_X = 6					# X position of the statistics display
+	STAT_Y = 6					# Y position of the statistics display
+	STAT_SIZE = 14				# Font size of the statistics display
+	
+	STATS_KEY = 123				# Key binding for showing stats
+	
+	HISTOGRAM_BARS = " _.-=+*#%@"	# Characters used to draw the phase histograms, from an empty bucket to the fullest
+	
+	# Presentation modes
+	SINGLE = "single"			# One canvas, changed in place every frame
+	SWAP = "swap"				# Two canvases, each frame is drawn on the hidden one which is then swapped in with place / place_forget
+
+	def __init__(self, draw_function, title, tick_function = None, profiler = None, key_input = None, damage_function = None, present = SWAP):
+		# Required values
+		self.draw_function = draw_function		# A function of the form: def Draw(scene, width, height)
+		self.title = title						# The name of the window
+		self.tick_function = tick_function		# A function of the form: def Tick(), called on every update even when the frame is dropped
+		self.profiler = profiler if profiler != None else Profiler.Profiler()	# Times each phase of the update, shown with the stats
+		self.input = key_input if key_input != None else Input.Input()		# Turns key events into actions, dispatched once per simulation step
+		self.damage_function = damage_function	# A function of the form: def Damaged(), returns False if the frame would look the same as the last so it is skipped (None to draw every frame)
+		
+		self.present = present					# How frames are shown, Display.SINGLE or Display.SWAP
+		
+		# Values which may be modified
+		self.max_fps = Display.REFRESH_RATE		# Maximum FPS allowed
+		self.show_stats = False					# If statistics should be shown on the screen (e.g. fps)
+		self.on_ready = None					# A function to run when the display is ready
+		
+		self.key_listeners = {}					# Methods to call with every key event (in the order added) as listener: True, use self.input for actions
+		
+		# Running variables
+		self.alive = False						# If the window is active or not
+		self.last_stats = 0						# The last time.time() the stats were calculated
+		self.frame_count = 0					# Counts updates to calculate the FPS
+		self.render_time_sum = 0				# The sum of the time it takes to render a frame
+		self.fps = 0							# The measured FPS
+		self.render_duty = 0					# A ratio of the time it takes to render a frame to the total time passed
+		self.dropped_count = 0					# Counts dropped frames to calculate the drop rate
+		self.dropped = 0						# The measured number of dropped frames per second
+		self.dropped_frames = 0					# The number of frames dropped in a row
+		self.next_frame = 0						# The time.time() the next frame is due
+		self.last_end = 0						# The time.time() the last update finished
+		self.redraw = True						# If the next frame must be drawn whatever the damage_function says (e.g. after a resize)
+		self.idle_count = 0						# Counts frames skipped because nothing changed
+		self.idle = 0							# The measured number of idle frames per second
+		
+		self.screen = None						# Tkinter screen object
+		self.flip = False						# Which buffer is visible (always the first when present is SINGLE)
+		self.buffers = [None, None]				# Canvas Objects, only the first is used when present is SINGLE
+		self.scenes = [None, None]				# Retained scenes, one for each buffer
+		
+		self.width = Display.MIN_WIDTH
+		self.height = Display.MIN_HEIGHT
+		
+		# Misc
+		self.font = ("Monospace", Display.STAT_SIZE)
+		
+		# Show the stats with the stats key
+		self.input.Bind([Display.STATS_KEY], "stats")
+		self.input.AddListener("stats", self._OnStats)
+		
+	def AddKeyListener(self, listener):
+		self.key_listeners[listener] = True
+		
+	def RemoveKeyListener(self, listener):
+		self.key_listeners.pop(listener, None)
+		
+	def MainLoop(self, on_ready = None):							# Open the window and call the draw_function on every update
+		self.on_ready = on_ready
+		# Open the display
+		self.Open()
+		
+		# Set the first callback
+		self.screen.after(int(1000.0 / self.max_fps), self._Update)
+		
+		# Main loop
+		self.screen.mainloop()
+		self.alive = False
+		
+	def Open(self):					# Open the window without running the main loop (frames can then be drawn with Draw)
+		self._Setup()
+		self.alive = True
+		
+	def Close(self):
+		self.screen.destroy()
+		self.alive = False
+		
+	def _Setup(self):
+		# Create the screen
+		self.screen = tkinter.Tk()
+		self.screen.title(self.title)
+		self.screen.minsize(Display.MIN_WIDTH, Display.MIN_HEIGHT)
+		self.screen.bind("<Configure>", self._OnResize)				# Call _OnResize when the window is resized
+		self.screen.bind("<KeyPress>", self._OnKeyEvent)
+		self.screen.bind("<KeyRelease>", self._OnKeyEvent)
+		
+		# Create the canvass, one for each buffer
+		for i in range(2 if self.present == Display.SWAP else 1):
+			self.buffers[i] = tkinter.Canvas(
+			self.screen, 
+			width = self.width,
+			height = self.height,
+			bd = 0							# Set border width
+		)
+			self.scenes[i] = Scene.Scene(self.buffers[i])
+		
+		self.buffers[self.flip].place(x = 0, y = 0)	# Place the first buffer
+		
+	def _OnKeyEvent(self, event):
+		for listener in tuple(self.key_listeners):
+			listener(event)
+			
+		self.input.OnKeyEvent(event)
+		
+	def _OnStats(self, action, pressed):
+		if pressed:
+			self.show_stats = not self.show_stats
+			self.redraw = True
+		
+	def _Update(self):
+		# Run the on_ready if set
+		if self.on_ready != None:
+			self.on_ready()
+			self.on_ready = None
+	
+		# Run the simulation, this happens whether the frame is drawn or not
+		render_start = time.time()
+		frame_time = 1.0 / self.max_fps
+		
+		profiler = self.profiler
+		
+		if self.last_end != 0:		# Time spent waiting for this update
+			profiler.Add("wait", render_start - self.last_end)
+		
+		if self.tick_function != None:
+			profiler.Begin("tick")
+			self.tick_function()
+			profiler.End("tick")
+			
+		# Drop the frame if rendering has fallen more than a frame behind
+		if self.next_frame != 0 and render_start - self.next_frame > frame_time and self.dropped_frames < Display.MAX_DROPPED_FRAMES:
+			self.dropped_frames += 1
+			self.dropped_count += 1
+			self.next_frame += frame_time
+			
+			profiler.EndFrame()
+			self.last_end = time.time()
+			
+			self.screen.after(int(1000.0 * Display.MINIMUM_WAIT_TIME), self._Update)
+			return
+			
+		self.dropped_frames = 0
+		
+		# Skip the frame if nothing has changed, the visible buffer is already up to date
+		if not self.redraw and not self.show_stats and self.damage_function != None and not self.damage_function():
+			self.idle_count += 1
+			self.next_frame = 0
+			
+			profiler.EndFrame()
+			self.last_end = time.time()
+			
+			self.screen.after(int(1000.0 * frame_time), self._Update)
+			return
+			
+		self.redraw = False
+		
+		# Find the time passed since the last update and calculate the FPS
+		time_passed = render_start - self.last_stats
+		
+		self.frame_count += 1
+		
+		if time_passed >= 1.0:	# 1 second passed, set the FPS
+			self.last_stats = render_start
+			
+			# Calculate stats
+			self.fps = self.frame_count
+			self.render_duty = (self.render_time_sum / self.frame_count) / time_passed
+			self.dropped = self.dropped_count
+			self.idle = self.idle_count
+			
+			self.frame_count = 0
+			self.render_time_sum = 0
+			self.dropped_count = 0
+			self.idle_count = 0
+		
+		self.Draw()
+		
+		profiler.EndFrame()
+		
+		# Calculate the render time and time to sleep until the next frame
+		self.last_end = time.time()
+		time_passed = self.last_end - render_start
+		self.render_time_sum += time_passed
+		
+		self.next_frame = render_start + frame_time
+		wait_time = frame_time - time_passed
+		
+		if wait_time < Display.MINIMUM_WAIT_TIME:		# Restrict the render cycle from taking up everything
+			wait_time = Display.MINIMUM_WAIT_TIME
+
+		self.screen.after(int(1000.0 * wait_time), self._Update)
+		
+	def Draw(self):				# Draw the frame and show it
+		profiler = self.profiler
+		
+		# Flip the buffers
+		if self.present == Display.SWAP:
+			self.flip = not self.flip
+		
+		# Update everything (items are kept between frames, only what changed is modified)
+		scene = self.scenes[self.flip]
+		scene.Begin()
+		
+		profiler.Begin("draw")
+		self.draw_function(scene, self.width, self.height)
+		profiler.End("draw")
+		
+		# Display the FPS, duty cycle and phase times if needed
+		if self.show_stats:
+			scene.Layer("stats")
+			scene.Text(
+				("stats",),
+				(Display.STAT_X, Display.STAT_Y),
+				font = self.font, 
+				text = self._StatsText(),
+				anchor = tkinter.NW)
+		
+		profiler.Begin("clear")
+		scene.End()						# Removes anything not drawn this frame
+		profiler.End("clear")
+		
+		profiler.Begin("present")
+		
+		if self.present == Display.SWAP:
+			self.buffers[self.flip].place(x = 0, y = 0)
+			self.buffers[not self.flip].place_forget()
+			
+		self.screen.update_idletasks()	# Redraw the changed parts of the window now, so the time is measured here
+		profiler.End("present")
+		
+	def _StatsText(self):
+		lines = [str(self.fps) + " FPS, Rendering @ " + str(round(self.render_duty * 100, 2)) + "%, " + str(self.dropped) + " dropped, " + str(self.idle) + " idle"]
+		lines.append("%-14s %7s %7s %7s  %s" % ("phase (ms)", "p50", "p99", "max", "histogram"))
+		
+		for name, stats in self.profiler.GetStats().items():
+			counts = self.profiler.Histogram(name)
+			most = max(counts)
+			
+			# One character per bucket, taller characters for fuller buckets
+			bars = ""
+			
+			for count in counts:
+				bars += Display.HISTOGRAM_BARS[int(math.ceil(count * (len(Display.HISTOGRAM_BARS) - 1) / float(most))) if most > 0 else 0]
+			
+			lines.append("%-14s %7.2f %7.2f %7.2f  [%s]" % (name, stats["p50"] * 1000, stats["p99"] * 1000, stats["max"] * 1000, bars))
+			
+		return "\n".join(lines)
+		
+	def _OnResize(self, event):
+		# Return if not running yet
+		if not self.alive:
+			return
+	
+		# Get the new size
+		self.width = self.screen.winfo_width()
+		self.height = self.screen.winfo_height()
+		
+		self.redraw = True
+		
+		# Configure the canvas
+		for i in range(2 if self.present == Display.SWAP else 1):	
+			self.buffers[i].configure(
+				width = self.width,
+				height = self.height,
 			)
\ No newline at end of file
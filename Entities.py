@@ -0,0 +1,116 @@
+# Title:	Entities module for Zombie (compact storage for the state of every entity)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# The state of the entities is stored as a structure of arrays, one array per field with one element
+# per entity (a slot). The entities themselves only hold their pool and slot, so there is no per-entity
+# dictionary and whole arrays can be worked on at once (see Physics.py). NumPy arrays are used when
+# NumPy is installed, otherwise array.array.
+#
+# Reading one element of an array through a Field is several times slower than reading an attribute, so
+# loops which read many entities take a Snapshot of the pool and read its fields as Python lists by slot.
+# A snapshot does not see the writes made to the pool after a field is copied.
+
+import array
+
+try:
+	import numpy
+
+except ImportError:		# Optional, fall back to array.array
+	numpy = None
+
+class EntityPool():
+	FIELDS = (
+		"x", "y",				# Position
+		"last_x", "last_y",		# Position at the previous step
+		"velocity",				# Size units per second
+		"direction",			# Radians the entity is travelling in
+		"facing",				# 1.0 if facing right, 0.0 if facing left
+		"animation",			# The current animation stage (0.0 or 1.0)
+		"animation_time",		# Time since the animation stage changed
+		"size",					# Relative size of the entity
+		"radius",				# Collision radius
+	)
+
+	CAPACITY = 16				# Slots made when a pool is created, the pool doubles when it runs out
+
+	def __init__(self, capacity = CAPACITY):
+		self.capacity = 0
+		self.free = []			# Slots which are not in use
+		self.count = 0			# Slots in use
+
+		for field in EntityPool.FIELDS:
+			setattr(self, field, EntityPool._Array(0))
+
+		self._Grow(capacity)
+
+	@staticmethod
+	def _Array(length):
+		if numpy is not None:
+			return numpy.zeros(length, dtype = float)
+
+		return array.array("d", bytes(8 * length))
+
+	def _Grow(self, capacity):
+		extra = capacity - self.capacity
+
+		for field in EntityPool.FIELDS:
+			old = getattr(self, field)
+
+			if numpy is not None:
+				setattr(self, field, numpy.concatenate((old, EntityPool._Array(extra))))
+
+			else:
+				old.extend(EntityPool._Array(extra))
+
+		# Hand out the lowest slots first
+		self.free.extend(range(capacity - 1, self.capacity - 1, -1))
+		self.capacity = capacity
+
+	def Allocate(self):			# A new slot with every field set to 0
+		if len(self.free) == 0:
+			self._Grow(self.capacity * 2)
+
+		slot = self.free.pop()
+		self.count += 1
+
+		for field in EntityPool.FIELDS:
+			getattr(self, field)[slot] = 0.0
+
+		return slot
+
+	def Free(self, slot):
+		self.free.append(slot)
+		self.count -= 1
+
+	def Move(self, slot, pool):	# Move the state in a slot to another pool, returns the slot in the other pool
+		new_slot = pool.Allocate()
+
+		for field in EntityPool.FIELDS:
+			getattr(pool, field)[new_slot] = getattr(self, field)[slot]
+
+		self.Free(slot)
+
+		return new_slot
+
+class Snapshot():				# The fields of a pool copied into Python lists, each field is copied the first time it is read
+	def __init__(self, pool):
+		self.pool = pool
+
+	def __getattr__(self, name):
+		values = getattr(self.pool, name).tolist()
+		setattr(self, name, values)
+
+		return values
+
+DEFAULT_POOL = EntityPool()		# Entities live here until they are added to a world
+
+def Field(name, kind = float):	# A property which reads and writes a field of the entity's slot in its pool
+	def Get(self):
+		return kind(getattr(self.pool, name)[self.slot])
+
+	def Set(self, value):
+		getattr(self.pool, name)[self.slot] = value
+
+	return property(Get, Set)
@@ -1,66 +1,116 @@
-# Title:	Game module for Zombie (Transitions between game scenes)
-# Author:	Nicholas Wright
-# Info:		To be used with Zombie.py
-# Version:	v0.0
-
-import Assets
-import World
-
-import random
-
-class Game():
-	# Scenes
-	MAZE = 0
-	JESUS = 1
-	HAND = 2
-	
-	RESTART_KEY = 32	# Space Bar
-
-	def __init__(self, zombie):
-		self.z = zombie
-		
-		self.SetScene(Game.MAZE)	# Set the start scene
-		self.z.display.AddKeyListener(self._OnKeyEvent)
-		
-	def SetScene(self, scene):
-		self.scene = scene
-		
-		# Clean up
-		self.z.world.ClearPointListeners()
-		
-		# Setup the next scene
-		if self.scene == Game.MAZE:
-			# Setup the world
-			self.z.world.SetWorld(Assets.MAZE)
-			
-			# Add the player
-			self.player = World.Man(1.5, 12.5, 0.35)
-			self.player.BindToControls(self.z.display)
-			self.z.world.AddEntity(self.player)
-			
-			# Generate a random exit point from the list
-			treasure_points = Assets.MAZE["TreasurePoints"]
-			point = treasure_points[random.randrange(0, len(treasure_points))]
-			self.z.world.AddPointListener(point, self._NextScene)
-			
-		elif self.scene == Game.JESUS:
-			# Setup the world
-			self.z.world.SetWorld(Assets.JESUS)
-			
-			# Set the exit point
-			self.z.world.AddPointListener(Assets.JESUS["TreasurePoints"][0], self._NextScene)
-			
-		elif self.scene == Game.HAND:
-			self.z.world.SetWorld(Assets.HAND)
-			
-			# Delete the player
-			self.z.world.ClearEntities()
-
-	def _NextScene(self, *args):
-		self.SetScene(self.scene + 1)
-		
-	def _OnKeyEvent(self, event):
-		# Restart the game
-		if str(event.type) == "KeyPress" and event.keycode == Game.RESTART_KEY:
-			self.z.world.ClearEntities()
+# Title:	Game module for Zombie (Transitions between game scenes)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+import Assets
+import Level
+import World
+
+import random
+import threading
+
+class Game():
+	# Scenes
+	MAZE = 0
+	JESUS = 1
+	HAND = 2
+	
+	WORLDS = {			# The world of each scene, compiled once when the game is loaded
+		MAZE : Level.Compile(Assets.MAZE),
+		JESUS : Level.Compile(Assets.JESUS),
+		HAND : Level.Compile(Assets.HAND),
+	}
+	
+	RESTART_KEY = 32	# Space Bar
+
+	def __init__(self, zombie, seed = None):
+		self.z = zombie
+		
+		self.seed = seed if seed != None else random.randrange(1 << 32)		# Seed of the game's random numbers, the same seed and the same input play the same game
+		self.random = random.Random(self.seed)
+		
+		self.scene_listeners = {}	# Functions called with the new scene whenever the scene changes, dict of listener: True
+		
+		self.prepared = {}			# The world of each scene made ready to set (see World.Prepare), indexed by the scene. Filled in the background while the scene before is played
+		self.changing = False		# If the scene is about to change (at the end of the step)
+		
+		self.SetScene(Game.MAZE)	# Set the start scene
+		
+		self.z.display.input.Bind([Game.RESTART_KEY], "restart")
+		self.z.display.input.AddListener("restart", self._OnRestart)
+		
+	def SetScene(self, scene):
+		self.scene = scene
+		
+		# Clean up
+		self.z.world.ClearPointListeners()
+		
+		# Setup the world, using the prepared world if it is ready
+		self.z.world.SetWorld(self.prepared.get(self.scene, Game.WORLDS[self.scene]))
+		
+		# Setup the next scene
+		if self.scene == Game.MAZE:
+			# Add the player
+			self.player = World.Man(1.5, 12.5, 0.35)
+			self.player.BindToControls(self.z.display)
+			self.z.world.AddEntity(self.player)
+			self.z.world.camera.Follow(self.player)
+			
+			# Generate a random exit point from the list
+			treasure_points = Assets.MAZE["TreasurePoints"]
+			point = treasure_points[self.random.randrange(0, len(treasure_points))]
+			self.z.world.AddPointListener(point, self._NextScene)
+			
+		elif self.scene == Game.JESUS:
+			# Set the exit point
+			self.z.world.AddPointListener(Assets.JESUS["TreasurePoints"][0], self._NextScene)
+			
+		elif self.scene == Game.HAND:
+			# Delete the player
+			self.z.world.ClearEntities()
+			
+		for listener in tuple(self.scene_listeners):
+			listener(self.scene)
+			
+		# Get the next scene ready while this one is played
+		if self.scene + 1 in Game.WORLDS:
+			self._Prepare(self.scene + 1)
+			
+	def _Prepare(self, scene):
+		if scene in self.prepared:
+			return
+			
+		self.z.world.Preload(Game.WORLDS[scene])
+		
+		if self.z.world.threaded:
+			thread = threading.Thread(target = self._PrepareWorld, args = (scene,), name = "Scene preloader")
+			thread.daemon = True
+			thread.start()
+			
+		else:
+			self._PrepareWorld(scene)
+			
+	def _PrepareWorld(self, scene):		# Run on a background thread when the world is threaded
+		self.prepared[scene] = World.World.Prepare(Game.WORLDS[scene])
+			
+	def AddSceneListener(self, listener):		# listener is a function of the form: def Listener(scene)
+		self.scene_listeners[listener] = True
+		
+	def RemoveSceneListener(self, listener):
+		self.scene_listeners.pop(listener, None)
+
+	def _NextScene(self, *args):		# Called by a trigger while the men are stepped, the scene is changed once the step is over
+		if not self.changing:
+			self.changing = True
+			self.z.world.Defer(self._ChangeScene)
+			
+	def _ChangeScene(self):
+		self.changing = False
+		self.SetScene(self.scene + 1)
+		
+	def _OnRestart(self, action, pressed):
+		# Restart the game
+		if pressed:
+			self.z.world.ClearEntities()
 			self.SetScene(Game.MAZE)
\ No newline at end of file
@@ -0,0 +1,264 @@
+# Title:	Geometry module for Zombie (wall index and collisions)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# Walls are stored in a uniform grid so only the walls near a point have to be tested.
+# The geometry of each wall (direction, length and normal) is worked out once when the index is built.
+# Lines can be cast through the grid (a DDA walk over the cells the line passes through) to find the first
+# wall they hit, see Rays.py for casting many at once. Walls can be added and removed later (e.g. as chunks of a streamed world are loaded), the index of a
+# removed wall is given to the next wall added.
+
+import bisect
+import math
+
+class WallIndex():
+	CELL_SIZE = 1.0		# Size of one grid cell (relative to one size unit)
+	PACKED = False		# If the geometry and cells are packed arrays read from a level file (see Level.MappedWallIndex), they are then read with Arrays()
+
+	# Indexes into the precomputed wall geometry
+	X1 = 0
+	Y1 = 1
+	X2 = 2
+	Y2 = 3
+	UX = 4				# Unit direction from point 1 to point 2
+	UY = 5
+	LENGTH = 6
+	NX = 7				# Unit normal (the direction rotated 90 degrees clockwise on screen)
+	NY = 8
+
+	def __init__(self, walls, cell_size = CELL_SIZE):
+		self.cell_size = cell_size
+		self.walls = []		# Precomputed wall geometry, a list of (x1, y1, x2, y2, ux, uy, length, nx, ny) in the same order as the walls given (None for removed walls)
+		self.cells = {}		# Lists of wall indexes (in ascending order) indexed by (cell_x, cell_y)
+		self.queries = {}	# Results of Query indexed by the range of cells, entities close together share them
+		self.free = []		# Indexes of removed walls (their geometry is None) to reuse
+		self.version = 0	# Incremented whenever a wall is added or removed
+
+		for wall in walls:
+			self.Add(wall)
+
+	def Add(self, wall):
+		x1, y1, x2, y2 = wall[0], wall[1], wall[2], wall[3]
+
+		length = math.sqrt(math.pow(x2 - x1, 2) + math.pow(y2 - y1, 2))
+
+		if length > 0:
+			ux = (x2 - x1) / length
+			uy = (y2 - y1) / length
+
+		else:		# A point, treat it as facing right (the same as atan2(0, 0))
+			ux = 1.0
+			uy = 0.0
+
+		geometry = (x1, y1, x2, y2, ux, uy, length, -uy, ux)
+
+		self.queries = {}
+		self.version += 1
+
+		if len(self.free) > 0:
+			index = self.free.pop()
+			self.walls[index] = geometry
+
+		else:
+			index = len(self.walls)
+			self.walls.append(geometry)
+
+		# Put the wall in every cell its bounding box touches
+		for cell_key in self._Cells(geometry):
+			cell = self.cells.get(cell_key)
+
+			if cell is None:
+				self.cells[cell_key] = [index]
+
+			else:
+				bisect.insort(cell, index)
+
+		return index
+
+	def Remove(self, index):
+		geometry = self.walls[index]
+
+		self.queries = {}
+		self.version += 1
+
+		for cell_key in self._Cells(geometry):
+			cell = self.cells[cell_key]
+			cell.remove(index)
+
+			if len(cell) == 0:
+				del self.cells[cell_key]
+
+		self.walls[index] = None
+		self.free.append(index)
+
+	def _Cells(self, geometry):		# The cells a wall's bounding box touches
+		x1, y1, x2, y2 = geometry[0], geometry[1], geometry[2], geometry[3]
+
+		cx1, cy1 = self.Cell(min(x1, x2), min(y1, y2))
+		cx2, cy2 = self.Cell(max(x1, x2), max(y1, y2))
+
+		return [(cx, cy) for cx in range(cx1, cx2 + 1) for cy in range(cy1, cy2 + 1)]
+
+	def Cell(self, x, y):		# The cell which contains a point
+		return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+	def Query(self, x1, y1, x2, y2, cache = True):	# Indexes of the walls which may touch a rectangle, in ascending order. Use cache = False for one off queries
+		cx1, cy1 = self.Cell(x1, y1)
+		cx2, cy2 = self.Cell(x2, y2)
+
+		key = (cx1, cy1, cx2, cy2)
+		result = self.queries.get(key)
+
+		if result is None:
+			found = set()
+
+			if (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > len(self.cells):	# More cells than have walls in them (e.g. the whole of a streamed world), look through those instead
+				for (cx, cy), cell in self.cells.items():
+					if cx1 <= cx <= cx2 and cy1 <= cy <= cy2:
+						found.update(cell)
+
+			else:
+				for cx in range(cx1, cx2 + 1):
+					for cy in range(cy1, cy2 + 1):
+						cell = self.cells.get((cx, cy))
+
+						if cell is not None:
+							found.update(cell)
+
+			result = sorted(found)
+
+			if cache:
+				self.queries[key] = result
+
+		return result
+
+	def Collide(self, x, y, radius):	# Push a point out of every wall it is closer than radius to, returns the new (x, y)
+		# Look further than the radius, pushing out of one wall may move the point towards another
+		reach = radius * 2.0
+
+		for index in self.Query(x - reach, y - reach, x + reach, y + reach):
+			x, y = self.CollideWall(self.walls[index], x, y, radius)
+
+		return x, y
+
+	@staticmethod
+	def CollideWall(wall, x, y, radius):
+		x1, y1, x2, y2, ux, uy, length, nx, ny = wall
+
+		# Find how far along the wall the point is (relative to the first wall point)
+		px = x - x1
+		py = y - y1
+
+		distance_along = (px * ux) + (py * uy)
+
+		if distance_along < 0:				# The point is past point 1
+			distance = math.sqrt((px * px) + (py * py))
+
+			if distance < radius:			# Too close to the end, move it out
+				return x1 + (px / distance * radius), y1 + (py / distance * radius)
+
+		elif distance_along > length:		# Do the same as above but with the second wall point
+			qx = x - x2
+			qy = y - y2
+			distance = math.sqrt((qx * qx) + (qy * qy))
+
+			if distance < radius:
+				return x2 + (qx / distance * radius), y2 + (qy / distance * radius)
+
+		else:
+			# Check collisions with the whole wall
+			distance_from_wall = (px * nx) + (py * ny)
+
+			if abs(distance_from_wall) < radius:	# Too close to the wall, move it out on the side it is on
+				side = radius
+
+				if distance_from_wall < 0:
+					side = -radius
+
+				return x1 + (ux * distance_along) + (nx * side), y1 + (uy * distance_along) + (ny * side)
+
+		return x, y
+
+	def Raycast(self, x1, y1, x2, y2):	# The first wall the line from (x1, y1) to (x2, y2) hits as (t, index), t is 0 at the start and 1 at the end. None if it hits nothing
+		dx = x2 - x1
+		dy = y2 - y1
+
+		cx, cy = self.Cell(x1, y1)
+		end_cx, end_cy = self.Cell(x2, y2)
+
+		# The t where the line crosses into the next column and row, and the t it takes to cross a whole cell
+		step_x, t_max_x, t_delta_x = self._Steps(cx, x1, dx)
+		step_y, t_max_y, t_delta_y = self._Steps(cy, y1, dy)
+
+		best_t = math.inf
+		best = None
+		tested = set()
+
+		# Walk through the cells the line passes through until a hit comes before the way out of the current cell
+		while True:
+			cell = self.cells.get((cx, cy))
+
+			if cell is not None:
+				for index in cell:
+					if index in tested:		# Walls are in every cell they touch
+						continue
+
+					tested.add(index)
+
+					t = WallIndex.Intersect(self.walls[index], x1, y1, dx, dy)
+
+					if t is not None and (t < best_t or (t == best_t and index < best)):	# The lowest index if two are as near
+						best_t = t
+						best = index
+
+			t_exit = min(t_max_x, t_max_y)
+
+			if best_t <= t_exit or t_exit > 1.0 or (cx == end_cx and cy == end_cy):
+				break
+
+			if t_max_x < t_max_y:
+				cx += step_x
+				t_max_x += t_delta_x
+
+			else:
+				cy += step_y
+				t_max_y += t_delta_y
+
+		if best is None:
+			return None
+
+		return (best_t, best)
+
+	def LineOfSight(self, x1, y1, x2, y2):	# If no wall is in the way between two points
+		return self.Raycast(x1, y1, x2, y2) is None
+
+	def _Steps(self, cell, start, delta):	# (step, t of the first cell boundary, t across one cell) along one axis of a line
+		if delta > 0:
+			return 1, (((cell + 1) * self.cell_size) - start) / delta, self.cell_size / delta
+
+		if delta < 0:
+			return -1, ((cell * self.cell_size) - start) / delta, self.cell_size / -delta
+
+		return 0, math.inf, math.inf
+
+	@staticmethod
+	def Intersect(wall, x, y, dx, dy):		# Where the line from (x, y) to (x + dx, y + dy) crosses a wall, t from 0 to 1 along the line. None if it does not (or is parallel)
+		ex = wall[2] - wall[0]
+		ey = wall[3] - wall[1]
+
+		denominator = (dx * ey) - (dy * ex)
+
+		if denominator == 0:
+			return None
+
+		qx = wall[0] - x
+		qy = wall[1] - y
+
+		t = ((qx * ey) - (qy * ex)) / denominator
+		u = ((qx * dy) - (qy * dx)) / denominator
+
+		if t < 0 or t > 1 or u < 0 or u > 1:
+			return None
+
+		return t
@@ -0,0 +1,304 @@
+# Title:	Headless module for Zombie (runs the game without a window)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# Stand-ins for the parts of the game which need tkinter, so the World, Game and Men can be run from
+# a script or a test on a machine with no display, as fast as they can go.
+
+import Scene
+import Profiler
+import Input
+
+class VirtualClock():		# A clock which only moves when told to, use it in place of time.time
+	def __init__(self, start = 1.0):
+		self.time = start	# Not 0, a last update time of 0 means "never updated"
+
+	def __call__(self):
+		return self.time
+
+	def Advance(self, time_passed):
+		self.time += time_passed
+
+class NullCanvas():			# Accepts the same calls as a tkinter.Canvas, counts them but draws nothing
+	def __init__(self, width = 0, height = 0):
+		self.width = width
+		self.height = height
+
+		self.next_id = 1	# Item id given to the next item created
+		self.items = 0		# The number of items on the canvas
+		self.calls = {}		# The number of calls made to each method, indexed by the method name
+
+		# The items are kept like tkinter keeps them, so where they are and how they are stacked can be checked
+		self.stack = {}		# Item ids in stacking order, bottom first (the values are not used)
+		self.tags = {}		# Tuple of the tags of each item, indexed by item id
+		self.tagged = {}	# Sets of the items with each tag, indexed by the tag
+		self.positions = {}	# Coordinates of each item, indexed by item id
+
+	def ResetCalls(self):
+		self.calls = {}
+
+	def _Count(self, name):
+		self.calls[name] = self.calls.get(name, 0) + 1
+
+	def _Create(self, name, coords, options):
+		self._Count(name)
+		self.items += 1
+
+		item_id = self.next_id
+		self.next_id += 1
+
+		# tkinter reads a string of tags as a Tcl list, so it is split on spaces
+		tags = options.get("tags", ())
+
+		if isinstance(tags, str):
+			tags = tuple(tags.split())
+
+		self.stack[item_id] = None
+		self.tags[item_id] = tuple(tags)
+		self.positions[item_id] = [float(value) for value in coords]
+
+		for tag in tags:
+			self.tagged.setdefault(tag, set()).add(item_id)
+
+		return item_id
+
+	def _Find(self, tag_or_id):			# Set of the items a tag or id refers to
+		if isinstance(tag_or_id, int) or (isinstance(tag_or_id, str) and tag_or_id.isdigit()):
+			item_id = int(tag_or_id)
+
+			return set((item_id,)) if item_id in self.stack else set()
+
+		if tag_or_id == "all":
+			return set(self.stack)
+
+		return self.tagged.get(tag_or_id, set())
+
+	def create_line(self, *args, **options):
+		return self._Create("create_line", args, options)
+
+	def create_rectangle(self, *args, **options):
+		return self._Create("create_rectangle", args, options)
+
+	def create_oval(self, *args, **options):
+		return self._Create("create_oval", args, options)
+
+	def create_polygon(self, *args, **options):
+		return self._Create("create_polygon", args, options)
+
+	def create_text(self, *args, **options):
+		return self._Create("create_text", args, options)
+
+	def create_image(self, *args, **options):
+		return self._Create("create_image", args, options)
+
+	def delete(self, *items):
+		self._Count("delete")
+
+		for tag_or_id in items:
+			for item_id in list(self._Find(tag_or_id)):
+				for tag in self.tags.pop(item_id):
+					self.tagged[tag].discard(item_id)
+
+				del self.stack[item_id]
+				del self.positions[item_id]
+				self.items -= 1
+
+	def coords(self, tag_or_id, *coords):	# Set the coordinates of an item, or get them if none are given
+		self._Count("coords")
+
+		if len(coords) == 0:		# The first item (in stacking order)
+			found = self.find_withtag(tag_or_id)
+
+			return list(self.positions[found[0]]) if len(found) > 0 else []
+
+		for item_id in self._Find(tag_or_id):
+			self.positions[item_id] = [float(value) for value in coords]
+
+	def itemconfigure(self, *args, **options):
+		self._Count("itemconfigure")
+
+	def move(self, tag_or_id, dx, dy):
+		self._Count("move")
+
+		for item_id in self._Find(tag_or_id):
+			self.positions[item_id] = [value + (dy if i % 2 else dx) for i, value in enumerate(self.positions[item_id])]
+
+	def tag_raise(self, tag_or_id, *args):
+		self._Count("tag_raise")
+
+		found = self._Find(tag_or_id)
+
+		if len(found) > 1:		# Keeping their order
+			found = [item_id for item_id in self.stack if item_id in found]
+
+		for item_id in found:
+			del self.stack[item_id]
+			self.stack[item_id] = None
+
+	def tag_lower(self, tag_or_id, *args):
+		self._Count("tag_lower")
+
+		found = self._Find(tag_or_id)
+		stack = [item_id for item_id in self.stack if item_id in found] + [item_id for item_id in self.stack if not item_id in found]
+
+		self.stack = dict.fromkeys(stack)
+
+	def find_withtag(self, tag_or_id):	# The items a tag or id refers to, in stacking order
+		found = self._Find(tag_or_id)
+
+		return tuple(item_id for item_id in self.stack if item_id in found)
+
+	def find_all(self):
+		return tuple(self.stack)
+
+	def gettags(self, item_id):
+		return self.tags.get(item_id, ())
+
+	def configure(self, **options):
+		self.width = options.get("width", self.width)
+		self.height = options.get("height", self.height)
+
+def CheckScene(scene):		# Problems with where the items of a Scene.Scene on a NullCanvas are, a list of strings (empty if there are none)
+	canvas = scene.canvas
+	problems = []
+	layers = {}			# The layer of each item id
+
+	for layer in scene.layers.values():
+		for key, item in layer.items.items():
+			if isinstance(item[Scene.Scene.ID], int):
+				item_ids = (item[Scene.Scene.ID],)
+
+				# Moved as far as the layer has been moved from where it was drawn
+				x, y = layer.offset
+				expected = [value + (y if i % 2 else x) for i, value in enumerate(item[Scene.Scene.COORDS])]
+
+				if any(abs(a - b) > 1e-6 for a, b in zip(expected, canvas.coords(item[Scene.Scene.ID]))):
+					problems.append("item " + repr(key) + " of layer " + layer.name + " is not where it was drawn")
+
+			else:
+				item_ids = item[Scene.Scene.IDS]
+
+			for item_id in item_ids:
+				layers[item_id] = layer
+
+	# The layers are stacked in the order they were started
+	last = 0
+
+	for item_id in canvas.find_all():
+		layer = layers.get(item_id)
+
+		if layer is None or not layer in scene.stack:
+			continue
+
+		if scene.stack.index(layer) < last:
+			problems.append("layer " + layer.name + " is above a later layer")
+			break
+
+		last = scene.stack.index(layer)
+
+	return problems
+
+class NullImages():			# Used in place of Images.Images, there is nothing to load images into
+	def GetImage(self, index):
+		return "image " + str(index)
+
+	def GetScaledImage(self, index, zoom):
+		return self.GetImage(index)
+
+	def Preload(self, index, zoom = None):
+		pass
+
+	def Work(self):
+		return False
+
+class KeyEvent():			# Looks like the tkinter events the key listeners are given
+	def __init__(self, keycode, pressed):
+		self.keycode = keycode
+		self.type = "KeyPress" if pressed else "KeyRelease"
+
+class HeadlessDisplay():	# Used in place of Display.Display, runs frames with a virtual clock as fast as possible
+	FRAME_TIME = 1.0 / 40	# Time the clock is moved on by for each frame (the same as Display.REFRESH_RATE)
+
+	def __init__(self, draw_function, title, tick_function = None, clock = None, profiler = None, key_input = None, damage_function = None, width = 800, height = 700):
+		self.draw_function = draw_function		# A function of the form: def Draw(scene, width, height)
+		self.title = title
+		self.tick_function = tick_function		# A function of the form: def Tick()
+		self.clock = clock						# The VirtualClock moved on for each frame (None to leave time alone)
+		self.profiler = profiler if profiler != None else Profiler.Profiler()
+		self.input = key_input if key_input != None else Input.Input()
+		self.damage_function = damage_function	# A function of the form: def Damaged(), frames are skipped when it returns False (None to draw every frame)
+
+		self.show_stats = False
+		self.key_listeners = {}
+
+		self.width = width
+		self.height = height
+
+		self.canvas = NullCanvas(width, height)
+		self.scene = Scene.Scene(self.canvas)
+
+		self.alive = False
+		self.frame_count = 0					# Frames run so far
+		self.idle_count = 0						# Frames skipped because nothing changed
+		self.redraw = True						# If the next frame must be drawn whatever the damage_function says
+		self.max_frames = 1000					# Frames run by MainLoop
+
+	def AddKeyListener(self, listener):
+		self.key_listeners[listener] = True
+
+	def RemoveKeyListener(self, listener):
+		self.key_listeners.pop(listener, None)
+
+	def SendKey(self, keycode, pressed):		# Pretend a key has been pressed or released
+		event = KeyEvent(keycode, pressed)
+
+		for listener in tuple(self.key_listeners):
+			listener(event)
+
+		self.input.OnKeyEvent(event)
+
+	def MainLoop(self, on_ready = None):
+		self.alive = True
+
+		if on_ready != None:
+			on_ready()
+
+		self.Run(self.max_frames)
+		self.alive = False
+
+	def Run(self, frames, frame_time = FRAME_TIME):
+		for i in range(frames):
+			self.Frame(frame_time)
+
+	def Frame(self, frame_time = FRAME_TIME):	# Run one tick and draw one frame
+		if self.clock != None:
+			self.clock.Advance(frame_time)
+
+		profiler = self.profiler
+
+		if self.tick_function != None:
+			profiler.Begin("tick")
+			self.tick_function()
+			profiler.End("tick")
+
+		if not self.redraw and self.damage_function != None and not self.damage_function():
+			profiler.EndFrame()
+			self.frame_count += 1
+			self.idle_count += 1
+			return
+
+		self.redraw = False
+
+		self.scene.Begin()
+
+		profiler.Begin("draw")
+		self.draw_function(self.scene, self.width, self.height)
+		profiler.End("draw")
+
+		profiler.Begin("clear")
+		self.scene.End()
+		profiler.End("clear")
+
+		profiler.EndFrame()
+		self.frame_count += 1
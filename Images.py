@@ -1,23 +1,118 @@
-# Title:	Image module for Zombie (stores and loads all the images)
-# Author:	Nicholas Wright
-# Info:		To be used with Zombie.py
-# Version:	v0.0
-
-import tkinter
-
-import Assets
-
-class Images():
-	def __init__(self):
-		self.images = {}	# Images indexed by their number
-		
-	def GetImage(self, index):
-		# Load the image if not loaded
-		if not index in self.images:
-			self._LoadImage(index)
-			
-		return self.images[index]
-			
-	def _LoadImage(self, index):
-		image = tkinter.PhotoImage(data = Assets.RAW_IMAGE_DATA[index])
-		self.images[index] = image
\ No newline at end of file
+# Title:	Image module for Zombie (stores and loads all the images)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+import collections
+import math
+import tkinter
+
+import Assets
+import Pack
+
+class Images():
+	ZOOM_STEPS = 4					# Scaled images are made in steps of 1 / ZOOM_STEPS of their own size
+	MEMORY_BUDGET = 64 * 1024 * 1024	# Most memory (bytes, at 4 bytes a pixel) the scaled images may use before the least recently used are dropped
+
+	def __init__(self, memory_budget = MEMORY_BUDGET):
+		self.images = {}	# Images indexed by their number
+		self.pack = None	# The Pack.AssetPack the images are read from, opened when the first image is needed
+
+		self.scaled = collections.OrderedDict()		# Scaled copies of the images indexed by (number, zoom bucket), least recently used first
+		self.memory_budget = memory_budget
+		self.memory = 0								# Memory used by the scaled copies (bytes)
+
+		self.pending = collections.OrderedDict()	# Images to get ready before they are drawn, keys of (number, zoom bucket or None) in the order asked for
+
+	def GetImage(self, index):
+		# Load the image if not loaded
+		if not index in self.images:
+			self._LoadImage(index)
+
+		return self.images[index]
+
+	def Preload(self, index, zoom = None):		# Get an image (and its copy scaled by zoom) ready before it is needed, a piece at a time as Work is called
+		bucket = Images._Bucket(zoom) if zoom != None else None
+
+		# A copy at another zoom which is still waiting was asked for at an old window size, it is not needed now
+		for key in [key for key in self.pending if key[0] == index and key[1] != None and key[1] != bucket]:
+			del self.pending[key]
+
+		self.pending[(index, bucket)] = None
+
+	def Work(self):							# Do one piece of the preloading (decode one image or scale one copy), returns True if there is more to do
+		if len(self.pending) == 0:
+			return False
+
+		index, bucket = next(iter(self.pending))
+
+		if not index in self.images:
+			self._LoadImage(index)			# The scaled copy is made next time
+
+		else:
+			self.pending.popitem(last = False)
+
+			if bucket != None:
+				self._ScaledImage(index, bucket)
+
+		return len(self.pending) > 0
+
+	@staticmethod
+	def _Bucket(zoom):						# The zoom step a zoom is rounded to
+		return max(1, int(round(zoom * Images.ZOOM_STEPS)))
+
+	def GetScaledImage(self, index, zoom):		# The image scaled by zoom (rounded to the nearest step)
+		return self._ScaledImage(index, Images._Bucket(zoom))
+
+	def _ScaledImage(self, index, bucket):
+		if bucket == Images.ZOOM_STEPS:			# Own size
+			return self.GetImage(index)
+
+		key = (index, bucket)
+		image = self.scaled.get(key)
+
+		if image is not None:
+			self.scaled.move_to_end(key)
+			return image
+
+		# Make the scaled copy, zoom up by the bucket then subsample down by the steps (in lowest terms)
+		divisor = math.gcd(bucket, Images.ZOOM_STEPS)
+		image = self.GetImage(index)
+
+		if bucket // divisor > 1:
+			image = image.zoom(bucket // divisor)
+
+		if Images.ZOOM_STEPS // divisor > 1:
+			image = image.subsample(Images.ZOOM_STEPS // divisor)
+
+		self.scaled[key] = image
+		self.memory += Images._Memory(image)
+
+		self._Evict(key)
+
+		return image
+
+	def _Evict(self, keep):					# Drop the least recently used scaled images until they fit in the budget
+		while self.memory > self.memory_budget and len(self.scaled) > 1:
+			key, image = next(iter(self.scaled.items()))
+
+			if key == keep:
+				break
+
+			del self.scaled[key]
+			self.memory -= Images._Memory(image)
+
+	@staticmethod
+	def _Memory(image):
+		return image.width() * image.height() * 4
+
+	def _LoadImage(self, index):
+		if self.pack is None:
+			self.pack = Pack.AssetPack(Pack.Path(Assets.IMAGE_PACK))
+
+		# Only the PhotoImage is kept, the raw file read from the pack is dropped once it has been decoded
+		data = self.pack.Get(index)
+		image = tkinter.PhotoImage(data = data)
+		del data
+
+		self.images[index] = image
@@ -0,0 +1,77 @@
+# Title:	Input module for Zombie (turns key events into actions)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# Key codes are bound to actions (e.g. "left" or "restart"). Key events from the display are looked up once
+# and queued, the queue is then dispatched once per simulation step so input is handled at the same point
+# of every step. Listeners are called with (action, pressed) only for the actions they listen to.
+
+import collections
+
+class Input():
+	def __init__(self):
+		self.bindings = {}		# Actions indexed by key code
+		self.listeners = {}		# Listeners for each action indexed by the action name. Each is a dict (in the order added) of listener: True so they can be removed straight away
+
+		self.queue = collections.deque()	# Actions waiting to be dispatched, a list of (action, pressed, key code)
+		self.held = set()					# Key codes which are held down
+
+	def Bind(self, keycodes, action):		# Bind a list of key codes to an action
+		for keycode in keycodes:
+			self.bindings[keycode] = action
+
+	def Unbind(self, keycodes):
+		for keycode in keycodes:
+			self.bindings.pop(keycode, None)
+
+	def AddListener(self, action, listener):	# listener is a function of the form: def Listener(action, pressed)
+		self.listeners.setdefault(action, {})[listener] = True
+
+	def RemoveListener(self, action, listener):
+		listeners = self.listeners.get(action)
+
+		if listeners != None:
+			listeners.pop(listener, None)
+
+	def OnKeyEvent(self, event):			# Queue the action bound to a tkinter key event
+		action = self.bindings.get(event.keycode)
+
+		if action == None:
+			return
+
+		pressed = str(event.type) == "KeyPress"
+
+		if pressed:
+			if event.keycode in self.held:	# Key repeat (the key is still down), nothing has changed
+				return
+
+			# Some systems repeat with a release straight before the press, take the release back instead
+			if len(self.queue) > 0 and self.queue[-1] == (action, False, event.keycode):
+				self.queue.pop()
+				self.held.add(event.keycode)
+				return
+
+			self.held.add(event.keycode)
+
+		else:
+			self.held.discard(event.keycode)
+
+		self.queue.append((action, pressed, event.keycode))
+
+	def Press(self, action, pressed):		# Queue an action without a key (e.g. from a replay)
+		self.queue.append((action, pressed, None))
+
+	def Dispatch(self):						# Call the listeners for every queued action
+		while len(self.queue) > 0:
+			action, pressed, keycode = self.queue.popleft()
+
+			listeners = self.listeners.get(action)
+
+			if listeners == None:
+				continue
+
+			# Listeners may remove themselves (or others) while being called
+			for listener in tuple(listeners):
+				if listener in listeners:
+					listener(action, pressed)
@@ -0,0 +1,418 @@
+# Title:	Level module for Zombie (compiles world data before it is used)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py, build a level file from a world with: python3 Level.py <world name in Assets.py> <level file>
+# Version:	v0.0
+
+# The walls of a level are written as short segments, many of which carry straight on from one another.
+# Compiling a level merges every run of walls which lie on the same line and touch or overlap into one
+# wall. A run is the same shape to collide against as its parts (the men are pushed out of the line and
+# its two ends) and is drawn as one outline, so there is one wall to draw and test instead of several.
+#
+# A compiled level can be saved as a level file, which holds everything World.SetWorld would otherwise work
+# out: the wall geometry, the grid of walls and the navigation grid. A level file is read through mmap and
+# nothing is unpacked when it is loaded, the walls and the grid are read from the file as they are used
+# (and handed to NumPy as they are, when it is installed), so a level of any size loads straight away.
+#
+# Level file format (little endian, every section starts on a multiple of 8 bytes):
+#	Header:		magic "ZLVL", version (uint16), reserved (uint16), width, height, wall cell size (float64),
+#				counts of: walls, cells, wall indexes in the cells, treasure points, images, texts (uint32),
+#				navigation cell size (float64), navigation columns, navigation rows (uint32, 0 if there is no grid)
+#	Background:	length (uint16) and the colour (UTF-8)
+#	Geometry:	the geometry of each wall (see Geometry.WallIndex), x1, y1, x2, y2, ux, uy, length, nx, ny (float64)
+#	Cells:		the grid cells with walls, sorted by their key (cell x * 2^32 + cell y) (int64),
+#				then the start (uint32) and number (uint32) of each cell's wall indexes
+#	Indexes:	the wall indexes of every cell, one cell after another (uint32)
+#	Links:		the links of each navigation cell (see Navigation.NavGrid) (uint8)
+#	Points:		the treasure points, x, y (float64)
+#	Images:		x, y, size (float64), image key (uint32), 4 bytes of padding
+#	Texts:		x, y, size (float64), then the length (uint16) and UTF-8 of the text, font, colour and anchor
+
+import bisect
+import math
+import mmap
+import struct
+import sys
+
+import Geometry
+import Navigation
+import Rays
+import World
+
+try:
+	import numpy
+
+except ImportError:		# Optional, only needed to hand the packed arrays to NumPy
+	numpy = None
+
+MAGIC = b"ZLVL"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHdddIIIIIIdII")
+LENGTH = struct.Struct("<H")
+GEOMETRY = struct.Struct("<9d")
+WALL = struct.Struct("<4d40x")		# The line of a wall, the start of its geometry
+KEY = struct.Struct("<q")
+COUNT = struct.Struct("<I")
+POINT = struct.Struct("<dd")
+IMAGE = struct.Struct("<dddI4x")
+TEXT = struct.Struct("<ddd")
+
+CELL_KEY = Rays.RayCaster.CELL_KEY	# Cells are stored by (cell_x * CELL_KEY) + cell_y, in the same order Rays sorts them
+
+EPSILON = 1e-9		# Walls closer than this are treated as touching, and directions as the same
+PLACES = 9			# Decimal places lines are matched to (about EPSILON)
+
+class LevelError(Exception):
+	pass
+
+def Compile(world_data):		# A copy of a world (see World.SetWorld) with its walls merged, compiling it again changes nothing
+	if world_data.get("Compiled", False):
+		return world_data
+
+	compiled = dict(world_data)
+	compiled["Compiled"] = True
+
+	if "Walls" in world_data:
+		compiled["Walls"] = MergeWalls(world_data["Walls"])
+
+	return compiled
+
+def MergeWalls(walls):			# Merge the walls (x1, y1, x2, y2) on the same line which touch or overlap, the runs are in the order of their first wall
+	lines = {}		# Walls on each line, a list of (start, end, first index, start point, end point) indexed by (direction x, direction y, offset)
+	merged = []		# (first index, wall)
+
+	for i, wall in enumerate(walls):
+		x1, y1, x2, y2 = wall[0], wall[1], wall[2], wall[3]
+		length = math.sqrt(math.pow(x2 - x1, 2) + math.pow(y2 - y1, 2))
+
+		if length <= EPSILON:		# A point has no line, keep it as it is
+			merged.append((i, wall))
+			continue
+
+		ux = (x2 - x1) / length
+		uy = (y2 - y1) / length
+
+		# Point every wall on a line the same way
+		if ux < -EPSILON or (abs(ux) <= EPSILON and uy < 0):
+			ux = -ux
+			uy = -uy
+			x1, y1, x2, y2 = x2, y2, x1, y1
+
+		key = (round(ux, PLACES) + 0.0, round(uy, PLACES) + 0.0, round((y1 * ux) - (x1 * uy), PLACES) + 0.0)	# + 0.0 so -0.0 and 0.0 are the same line
+
+		lines.setdefault(key, []).append(((x1 * ux) + (y1 * uy), (x2 * ux) + (y2 * uy), i, (x1, y1), (x2, y2)))
+
+	for parts in lines.values():
+		parts.sort()
+
+		runs = []		# A list of [start, end, first index, start point, end point, number of walls]
+
+		for start, end, i, start_point, end_point in parts:
+			if len(runs) > 0 and start <= runs[-1][1] + EPSILON:	# Touches or overlaps the last run
+				run = runs[-1]
+				run[2] = min(run[2], i)
+				run[5] += 1
+
+				if end > run[1]:
+					run[1] = end
+					run[4] = end_point
+
+			else:
+				runs.append([start, end, i, start_point, end_point, 1])
+
+		for start, end, first, start_point, end_point, count in runs:
+			if count == 1:		# Nothing to merge, leave the wall as it was
+				merged.append((first, walls[first]))
+
+			else:
+				merged.append((first, start_point + end_point))
+
+	merged.sort(key = lambda run: run[0])
+
+	return [wall for first, wall in merged]
+
+class StructView():			# A read only list of records packed one after another in a buffer, each is unpacked when it is read
+	def __init__(self, data, offset, count, record):
+		self.data = data
+		self.offset = offset
+		self.count = count
+		self.record = record
+		self.single = len(record.unpack(bytes(record.size))) == 1	# Records of one value are read as the value
+
+	def __len__(self):
+		return self.count
+
+	def __getitem__(self, i):
+		if i < 0:
+			i += self.count
+
+		if i < 0 or i >= self.count:
+			raise IndexError("StructView index out of range")
+
+		value = self.record.unpack_from(self.data, self.offset + (i * self.record.size))
+
+		return value[0] if self.single else value
+
+	def __iter__(self):
+		for i in range(self.count):
+			yield self[i]
+
+class MappedCells():		# The cells of a MappedWallIndex, looks like the dict of a Geometry.WallIndex to Query and Raycast
+	def __init__(self, level):
+		self.level = level
+		self.keys = StructView(level.data, level.keys_offset, level.cell_count, KEY)
+		self.found = {}		# The cells read so far, indexed by (cell_x, cell_y)
+
+	def get(self, cell, default = None):
+		result = self.found.get(cell)
+
+		if result is not None:
+			return result
+
+		key = (cell[0] * CELL_KEY) + cell[1]
+		i = bisect.bisect_left(self.keys, key)
+
+		if i == len(self.keys) or self.keys[i] != key:
+			return default
+
+		level = self.level
+		start = COUNT.unpack_from(level.data, level.starts_offset + (i * COUNT.size))[0]
+		count = COUNT.unpack_from(level.data, level.counts_offset + (i * COUNT.size))[0]
+
+		result = list(struct.unpack_from("<" + str(count) + "I", level.data, level.indexes_offset + (start * COUNT.size)))
+		self.found[cell] = result
+
+		return result
+
+	def __len__(self):
+		return len(self.keys)
+
+	def items(self):		# ((cell_x, cell_y), wall indexes) of every cell, in key order
+		for key in self.keys:
+			cx = (key + (CELL_KEY // 2)) // CELL_KEY
+			cell = (cx, key - (cx * CELL_KEY))
+
+			yield cell, self.get(cell)
+
+class MappedWallIndex(Geometry.WallIndex):	# A Geometry.WallIndex read from a level file, it can't be changed (World copies it first)
+	PACKED = True
+
+	def __init__(self, level):
+		self.cell_size = level.cell_size
+		self.walls = StructView(level.data, level.geometry_offset, level.wall_count, GEOMETRY)
+		self.cells = MappedCells(level)
+		self.queries = {}
+		self.free = []
+		self.version = 0
+		self.level = level
+
+	def Add(self, wall):
+		raise LevelError("The walls of " + self.level.path + " can't be changed")
+
+	def Remove(self, index):
+		raise LevelError("The walls of " + self.level.path + " can't be changed")
+
+	def Arrays(self):		# NumPy views of the packed (geometry, cell keys, cell starts, cell counts, wall indexes)
+		level = self.level
+
+		return (
+			numpy.frombuffer(level.data, dtype = "<f8", count = level.wall_count * 9, offset = level.geometry_offset).reshape(-1, 9),
+			numpy.frombuffer(level.data, dtype = "<i8", count = level.cell_count, offset = level.keys_offset),
+			numpy.frombuffer(level.data, dtype = "<u4", count = level.cell_count, offset = level.starts_offset),
+			numpy.frombuffer(level.data, dtype = "<u4", count = level.cell_count, offset = level.counts_offset),
+			numpy.frombuffer(level.data, dtype = "<u4", count = level.index_count, offset = level.indexes_offset),
+		)
+
+class LevelFile():
+	def __init__(self, path):
+		self.path = path
+
+		self.file = open(path, "rb")
+
+		try:
+			self.data = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+
+		except ValueError:	# An empty file can't be mapped
+			self.file.close()
+			raise LevelError(path + " is not a level file")
+
+		self._ReadHeader()
+
+	def _ReadHeader(self):
+		if len(self.data) < HEADER.size:
+			raise LevelError(self.path + " is not a level file")
+
+		(
+			magic, version, reserved, self.width, self.height, self.cell_size,
+			self.wall_count, self.cell_count, self.index_count, self.point_count, self.image_count, self.text_count,
+			self.nav_cell_size, self.nav_columns, self.nav_rows
+		) = HEADER.unpack_from(self.data, 0)
+
+		if magic != MAGIC:
+			raise LevelError(self.path + " is not a level file")
+
+		if version != VERSION:
+			raise LevelError(self.path + " is version " + str(version) + ", expected " + str(VERSION))
+
+		offset = HEADER.size
+		self.background, offset = _ReadString(self.data, offset)
+
+		# Where each section starts
+		self.geometry_offset = _Align(offset)
+		self.keys_offset = self.geometry_offset + (self.wall_count * GEOMETRY.size)
+		self.starts_offset = self.keys_offset + (self.cell_count * KEY.size)
+		self.counts_offset = self.starts_offset + (self.cell_count * COUNT.size)
+		self.indexes_offset = self.counts_offset + (self.cell_count * COUNT.size)
+		self.links_offset = _Align(self.indexes_offset + (self.index_count * COUNT.size))
+		self.points_offset = _Align(self.links_offset + (self.nav_columns * self.nav_rows))
+		self.images_offset = self.points_offset + (self.point_count * POINT.size)
+		self.texts_offset = self.images_offset + (self.image_count * IMAGE.size)
+
+		if self.texts_offset > len(self.data):
+			raise LevelError(self.path + " is truncated")
+
+	def World(self):		# The world data to give World.SetWorld, the walls and grids are read from the file
+		world_data = {
+			"Width" : self.width,
+			"Height" : self.height,
+			"Background" : self.background,
+			"Walls" : StructView(self.data, self.geometry_offset, self.wall_count, WALL),
+			"WallIndex" : MappedWallIndex(self),
+			"TreasurePoints" : list(StructView(self.data, self.points_offset, self.point_count, POINT)),
+			"Images" : [(x, y, size, key) for x, y, size, key in StructView(self.data, self.images_offset, self.image_count, IMAGE)],
+			"Objects" : self._ReadTexts(),
+			"Compiled" : True,
+		}
+
+		if self.nav_columns > 0:
+			links = memoryview(self.data)[self.links_offset:self.links_offset + (self.nav_columns * self.nav_rows)]
+			nav = Navigation.NavGrid(self.width, self.height, None, self.nav_cell_size, links)
+
+			if nav.columns != self.nav_columns or nav.rows != self.nav_rows:
+				raise LevelError(self.path + " has a navigation grid of the wrong size")
+
+			world_data["NavGrid"] = nav
+
+		return world_data
+
+	def _ReadTexts(self):
+		texts = []
+		offset = self.texts_offset
+
+		try:
+			for i in range(self.text_count):
+				x, y, size = TEXT.unpack_from(self.data, offset)
+				offset += TEXT.size
+
+				text, offset = _ReadString(self.data, offset)
+				font, offset = _ReadString(self.data, offset)
+				colour, offset = _ReadString(self.data, offset)
+				anchor, offset = _ReadString(self.data, offset)
+
+				texts.append(World.ObjectText(x, y, text, font, size, colour, anchor))
+
+		except struct.error:
+			raise LevelError(self.path + " is truncated")
+
+		return texts
+
+def _ReadString(data, offset):		# (string, offset after it)
+	length = LENGTH.unpack_from(data, offset)[0]
+	offset += LENGTH.size
+
+	return data[offset:offset + length].decode("utf-8"), offset + length
+
+def _String(text):
+	data = text.encode("utf-8")
+
+	return LENGTH.pack(len(data)) + data
+
+def _Align(offset):				# The next multiple of 8
+	return (offset + 7) & ~7
+
+def _Padding(offset):
+	return bytes(_Align(offset) - offset)
+
+def Load(path):				# The world data of a level file, to give to World.SetWorld
+	return LevelFile(path).World()
+
+def Write(path, world_data):	# Compile a world and write it as a level file
+	world_data = Compile(world_data)
+
+	width = world_data["Width"]
+	height = world_data["Height"]
+	walls = world_data.get("Walls", [])
+
+	index = Geometry.WallIndex(walls)
+
+	nav = None
+
+	if Navigation.NavGrid.Fits(width, height):
+		nav = Navigation.NavGrid(width, height, index)
+
+	keys = sorted(index.cells.keys(), key = lambda cell: (cell[0] * CELL_KEY) + cell[1])
+	counts = [len(index.cells[key]) for key in keys]
+
+	objects = world_data.get("Objects", [])
+
+	for item in objects:
+		if not isinstance(item, World.ObjectText):
+			raise LevelError("Only text objects can be saved in a level file")
+
+	points = world_data.get("TreasurePoints", [])
+	images = world_data.get("Images", [])
+
+	header = HEADER.pack(
+		MAGIC, VERSION, 0, width, height, index.cell_size,
+		len(walls), len(keys), sum(counts), len(points), len(images), len(objects),
+		nav.cell_size if nav != None else 0.0, nav.columns if nav != None else 0, nav.rows if nav != None else 0
+	)
+
+	header += _String(world_data.get("Background", World.World.BACKGROUND_COLOUR))
+
+	with open(path, "wb") as f:
+		f.write(header)
+		f.write(_Padding(len(header)))
+
+		for geometry in index.walls:
+			f.write(GEOMETRY.pack(*geometry))
+
+		for key in keys:
+			f.write(KEY.pack((key[0] * CELL_KEY) + key[1]))
+
+		start = 0
+
+		for count in counts:
+			f.write(COUNT.pack(start))
+			start += count
+
+		for count in counts:
+			f.write(COUNT.pack(count))
+
+		for key in keys:
+			f.write(struct.pack("<" + str(len(index.cells[key])) + "I", *index.cells[key]))
+
+		f.write(_Padding(f.tell()))
+
+		if nav != None:
+			f.write(nav.links)
+			f.write(_Padding(f.tell()))
+
+		for point in points:
+			f.write(POINT.pack(point[0], point[1]))
+
+		for image in images:
+			f.write(IMAGE.pack(image[0], image[1], image[2], image[3]))
+
+		for item in objects:
+			f.write(TEXT.pack(item.x, item.y, item.size))
+			f.write(_String(item.text) + _String(item.font) + _String(item.colour) + _String(item.anchor))
+
+if __name__ == "__main__":
+	if len(sys.argv) < 3:
+		print("Usage: python3 Level.py <world name in Assets.py> <level file>")
+		sys.exit(1)
+
+	import Assets
+
+	Write(sys.argv[2], getattr(Assets, sys.argv[1]))
@@ -0,0 +1,173 @@
+# Title:	Navigation module for Zombie (finds the way through the maze)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# The world is split into a grid of cells when it is set. Two neighbouring cells are joined unless a wall
+# crosses the line between their centres. A flow field is a breadth first search over the grid out from
+# a target: every cell points at the next cell on the shortest way to the target. It is only searched
+# again when the target moves into another cell, so any number of entities can follow it by looking up
+# the cell they are in.
+
+import array
+import collections
+import math
+
+class NavGrid():
+	CELL_SIZE = 1.0		# Size of one cell (relative to one size unit)
+	MAX_CELLS = 1 << 14	# Worlds with more cells than this are not given a grid (it takes about 30 us a cell to build)
+
+	# Bits set in a cell's links for each open way out of it
+	RIGHT = 1
+	DOWN = 2
+	LEFT = 4
+	UP = 8
+
+	NEIGHBOURS = ((1, 0, RIGHT), (0, 1, DOWN), (-1, 0, LEFT), (0, -1, UP))	# (dx, dy, bit) of each neighbour
+
+	@staticmethod
+	def Fits(width, height, cell_size = CELL_SIZE):		# If a world is small enough to be given a grid
+		return (width / cell_size) * (height / cell_size) <= NavGrid.MAX_CELLS
+
+	def __init__(self, width, height, wall_index, cell_size = CELL_SIZE, links = None):	# links are the links of a grid worked out before (e.g. read from a level file), the walls are then not looked at
+		self.cell_size = cell_size
+		self.columns = max(1, int(math.ceil(width / cell_size)))
+		self.rows = max(1, int(math.ceil(height / cell_size)))
+
+		if links != None:
+			self.links = links
+			return
+
+		self.links = bytearray(self.columns * self.rows)	# Bits of the open ways out of each cell, indexed by (y * columns) + x
+
+		# Only look right and down, the other way round is the same link
+		for y in range(self.rows):
+			for x in range(self.columns):
+				cell = (y * self.columns) + x
+
+				if x + 1 < self.columns and not self._Blocked(wall_index, x, y, x + 1, y):
+					self.links[cell] |= NavGrid.RIGHT
+					self.links[cell + 1] |= NavGrid.LEFT
+
+				if y + 1 < self.rows and not self._Blocked(wall_index, x, y, x, y + 1):
+					self.links[cell] |= NavGrid.DOWN
+					self.links[cell + self.columns] |= NavGrid.UP
+
+	def _Blocked(self, wall_index, x1, y1, x2, y2):		# If a wall crosses the line between the centres of two cells
+		ax = (x1 + 0.5) * self.cell_size
+		ay = (y1 + 0.5) * self.cell_size
+		bx = (x2 + 0.5) * self.cell_size
+		by = (y2 + 0.5) * self.cell_size
+
+		for index in wall_index.Query(min(ax, bx), min(ay, by), max(ax, bx), max(ay, by), False):
+			wall = wall_index.walls[index]
+
+			if NavGrid._Crosses(ax, ay, bx, by, wall[0], wall[1], wall[2], wall[3]):
+				return True
+
+		return False
+
+	@staticmethod
+	def _Crosses(ax, ay, bx, by, cx, cy, dx, dy):		# If line a-b touches line c-d
+		def Side(px, py, qx, qy, rx, ry):
+			return ((qx - px) * (ry - py)) - ((qy - py) * (rx - px))
+
+		d1 = Side(cx, cy, dx, dy, ax, ay)
+		d2 = Side(cx, cy, dx, dy, bx, by)
+		d3 = Side(ax, ay, bx, by, cx, cy)
+		d4 = Side(ax, ay, bx, by, dx, dy)
+
+		if ((d1 > 0 and d2 < 0) or (d1 < 0 and d2 > 0)) and ((d3 > 0 and d4 < 0) or (d3 < 0 and d4 > 0)):
+			return True
+
+		# Touching at an end (e.g. a wall ending on the line)
+		return (
+			(d1 == 0 and NavGrid._Between(cx, cy, dx, dy, ax, ay)) or
+			(d2 == 0 and NavGrid._Between(cx, cy, dx, dy, bx, by)) or
+			(d3 == 0 and NavGrid._Between(ax, ay, bx, by, cx, cy)) or
+			(d4 == 0 and NavGrid._Between(ax, ay, bx, by, dx, dy))
+		)
+
+	@staticmethod
+	def _Between(px, py, qx, qy, rx, ry):		# If r (on the line p-q) is between p and q
+		return min(px, qx) <= rx <= max(px, qx) and min(py, qy) <= ry <= max(py, qy)
+
+	def Cell(self, x, y):		# The index of the cell a point is in (None if outside the grid)
+		cx = int(math.floor(x / self.cell_size))
+		cy = int(math.floor(y / self.cell_size))
+
+		if cx < 0 or cy < 0 or cx >= self.columns or cy >= self.rows:
+			return None
+
+		return (cy * self.columns) + cx
+
+class FlowField():
+	def __init__(self, grid):
+		self.grid = grid
+		self.target = None		# The cell the field leads to (None until Update is called with a point in the grid)
+		self.target_x = 0.0		# The point the field leads to
+		self.target_y = 0.0
+
+		self.next = array.array("i", [-1]) * (grid.columns * grid.rows)		# The next cell on the way to the target for each cell (-1 if there is no way)
+		self.searches = 0		# Number of times the field has been searched
+
+	def Update(self, x, y):		# Move the target to (x, y), the field is only searched again if it is in another cell
+		self.target_x = x
+		self.target_y = y
+
+		cell = self.grid.Cell(x, y)
+
+		if cell == self.target:
+			return False
+
+		self.target = cell
+		self.searches += 1
+
+		grid = self.grid
+		columns = grid.columns
+		links = grid.links
+
+		next_cell = array.array("i", [-1]) * (columns * grid.rows)
+
+		if cell != None:
+			# Breadth first out from the target, each cell found points back at the cell it was found from
+			next_cell[cell] = cell
+			queue = collections.deque([cell])
+
+			while len(queue) > 0:
+				current = queue.popleft()
+				open_links = links[current]
+				cx = current % columns
+				cy = current // columns
+
+				for dx, dy, bit in NavGrid.NEIGHBOURS:
+					if open_links & bit:
+						neighbour = ((cy + dy) * columns) + cx + dx
+
+						if next_cell[neighbour] == -1:
+							next_cell[neighbour] = current
+							queue.append(neighbour)
+
+		self.next = next_cell
+
+		return True
+
+	def Direction(self, x, y):	# Radians to travel from (x, y) towards the target, None if there is no way there
+		cell = self.grid.Cell(x, y)
+
+		if cell == None or self.target == None:
+			return None
+
+		next_cell = self.next[cell]
+
+		if next_cell == -1:
+			return None
+
+		if next_cell == cell:	# In the target's cell, go straight to it
+			return math.atan2(self.target_y - y, self.target_x - x)
+
+		# Head for the middle of the next cell so corners are not cut
+		size = self.grid.cell_size
+		columns = self.grid.columns
+
+		return math.atan2((((next_cell // columns) + 0.5) * size) - y, (((next_cell % columns) + 0.5) * size) - x)
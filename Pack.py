@@ -0,0 +1,126 @@
+# Title:	Pack module for Zombie (reads and writes asset pack files)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py, build a pack with: python3 Pack.py Images.pack 1=jesus.gif 2=hand.gif
+# Version:	v0.0
+
+# An asset pack is one file holding many raw image files (GIF or PNG) which are read through mmap only
+# when they are needed, nothing is decoded when the pack is opened.
+#
+# Format (little endian):
+#	Header:		magic "ZPAK", version (uint16), entry count (uint16)
+#	Index:		one entry per asset: key (uint32), format (4 bytes, "GIF " or "PNG "), offset (uint32), length (uint32)
+#	Data:		the raw asset files, at the offsets given in the index (from the start of the file)
+
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"ZPAK"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHH")
+ENTRY = struct.Struct("<I4sII")
+
+FORMATS = {		# Formats indexed by the start of their files
+	b"GIF8" : b"GIF ",
+	b"\x89PNG" : b"PNG ",
+}
+
+class PackError(Exception):
+	pass
+
+class AssetPack():
+	def __init__(self, path):
+		self.path = path
+		self.index = {}		# (format, offset, length) indexed by the asset key
+
+		self.file = open(path, "rb")
+
+		try:
+			self.data = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+
+		except ValueError:	# An empty file can't be mapped
+			self.file.close()
+			raise PackError(path + " is not an asset pack")
+
+		self._ReadIndex()
+
+	def _ReadIndex(self):
+		if len(self.data) < HEADER.size:
+			raise PackError(self.path + " is not an asset pack")
+
+		magic, version, count = HEADER.unpack_from(self.data, 0)
+
+		if magic != MAGIC:
+			raise PackError(self.path + " is not an asset pack")
+
+		if version != VERSION:
+			raise PackError(self.path + " is version " + str(version) + ", expected " + str(VERSION))
+
+		for i in range(count):
+			key, format, offset, length = ENTRY.unpack_from(self.data, HEADER.size + (i * ENTRY.size))
+
+			if offset + length > len(self.data):
+				raise PackError(self.path + " is truncated")
+
+			self.index[key] = (format, offset, length)
+
+	def Keys(self):
+		return list(self.index.keys())
+
+	def Format(self, key):
+		return self.index[key][0].decode().strip()
+
+	def Get(self, key):		# The raw file of an asset (a copy, the caller can drop it when done)
+		format, offset, length = self.index[key]
+
+		return self.data[offset:offset + length]
+
+	def Close(self):
+		self.data.close()
+		self.file.close()
+
+def Write(path, assets):	# Write a pack from a dict of raw image files (bytes) indexed by their key
+	keys = sorted(assets.keys())
+	offset = HEADER.size + (len(keys) * ENTRY.size)
+
+	index = b""
+
+	for key in keys:
+		data = assets[key]
+		format = FORMATS.get(data[:4])
+
+		if format is None:
+			raise PackError("Asset " + str(key) + " is not a GIF or PNG file")
+
+		index += ENTRY.pack(key, format, offset, len(data))
+		offset += len(data)
+
+	with open(path, "wb") as f:
+		f.write(HEADER.pack(MAGIC, VERSION, len(keys)))
+		f.write(index)
+
+		for key in keys:
+			f.write(assets[key])
+
+def Path(name):				# Where a pack shipped with the game is (next to the exe when built with py2exe)
+	if getattr(sys, "frozen", False):
+		return os.path.join(os.path.dirname(sys.executable), name)
+
+	return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+if __name__ == "__main__":
+	if len(sys.argv) < 3:
+		print("Usage: python3 Pack.py <pack file> <key>=<image file> ...")
+		sys.exit(1)
+
+	assets = {}
+
+	for argument in sys.argv[2:]:
+		key, file_name = argument.split("=", 1)
+
+		with open(file_name, "rb") as f:
+			assets[int(key)] = f.read()
+
+	Write(sys.argv[1], assets)
@@ -0,0 +1,249 @@
+# Title:	Physics module for Zombie (moves every entity and collides them with the walls)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# All the entities are stepped at once, working straight on the arrays of their Entities.EntityPool.
+# When NumPy is installed they are moved together, the walls near each of them are gathered from flat arrays
+# of the wall grid's cells and every (entity, nearby wall) pair is tested in one vectorised pass. The entities
+# touching a wall are then pushed out in rounds, each pushed out of the next wall it touches in wall order,
+# which gives exactly the same result as Geometry.WallIndex.Collide. Without NumPy each entity is stepped on its own.
+
+import math
+
+import Rays
+
+try:
+	import numpy
+
+except ImportError:		# Optional, fall back to stepping one entity at a time
+	numpy = None
+
+class Physics():
+	BATCH_MIN = 16			# Fewer entities than this are stepped one at a time, it is quicker than setting up the arrays
+	NO_WALL = (0.0,) * 9	# Geometry put in the wall arrays for removed walls
+
+	def __init__(self):
+		# Working state of the entities being stepped, one element per entity (NumPy arrays)
+		self.x = None			# Positions
+		self.y = None
+		self.radius = None		# Collision radii
+
+		self.wall_index = None	# The Geometry.WallIndex the wall arrays were made from
+		self.wall_version = 0	# The version of the wall index they were made from
+		self.wall_arrays = None	# The precomputed wall geometry as a tuple of arrays (x1, y1, x2, y2, ux, uy, length, nx, ny)
+
+		# The cells of the wall index as sorted keys, with the start and number of their walls in one flat array (as Rays.RayCaster)
+		self.keys = None
+		self.starts = None
+		self.counts = None
+		self.flat = None
+
+	def Step(self, pool, slots, wall_index, time_passed):	# Move the entities in the slots of an Entities.EntityPool for time_passed seconds and push them out of the walls
+		if len(slots) == 0:
+			return
+
+		if numpy is None or len(slots) < Physics.BATCH_MIN:
+			self._StepEach(pool, slots, wall_index, time_passed)
+			return
+
+		slots = numpy.array(slots, dtype = numpy.intp)
+
+		# Remember where the entities were, to draw them between steps
+		x = pool.x[slots]
+		y = pool.y[slots]
+
+		pool.last_x[slots] = x
+		pool.last_y[slots] = y
+
+		distance = pool.velocity[slots] * time_passed
+		direction = pool.direction[slots]
+
+		self.x = x + (numpy.cos(direction) * distance)
+		self.y = y + (numpy.sin(direction) * distance)
+		self.radius = pool.radius[slots]
+
+		self._Collide(wall_index)
+
+		pool.x[slots] = self.x
+		pool.y[slots] = self.y
+
+	def _StepEach(self, pool, slots, wall_index, time_passed):
+		for slot in slots:
+			x = pool.x[slot]
+			y = pool.y[slot]
+
+			pool.last_x[slot] = x
+			pool.last_y[slot] = y
+
+			x += math.cos(pool.direction[slot]) * (pool.velocity[slot] * time_passed)
+			y += math.sin(pool.direction[slot]) * (pool.velocity[slot] * time_passed)
+
+			pool.x[slot], pool.y[slot] = wall_index.Collide(x, y, pool.radius[slot])
+
+	def _WallArrays(self, wall_index):
+		if self.wall_index is not wall_index or self.wall_version != wall_index.version:
+			self.wall_index = wall_index
+			self.wall_version = wall_index.version
+
+			if wall_index.PACKED:	# Read from a level file, use the packed geometry and cells as they are
+				geometry, self.keys, starts, counts, flat = wall_index.Arrays()
+
+				self.starts = starts.astype(numpy.intp)
+				self.counts = counts.astype(numpy.intp)
+				self.flat = flat.astype(numpy.intp)
+
+			else:
+				# Removed walls are never queried, they only keep the other walls at their indexes
+				geometry = numpy.array([wall if wall is not None else Physics.NO_WALL for wall in wall_index.walls], dtype = float).reshape(-1, 9)
+
+				keys = sorted(wall_index.cells.keys())
+
+				self.keys = numpy.array([(cx * Rays.RayCaster.CELL_KEY) + cy for cx, cy in keys], dtype = numpy.int64)
+				self.counts = numpy.array([len(wall_index.cells[key]) for key in keys], dtype = numpy.intp)
+				self.starts = numpy.zeros(len(keys), dtype = numpy.intp)
+
+				if len(keys) > 0:
+					self.starts[1:] = numpy.cumsum(self.counts)[:-1]
+
+				self.flat = numpy.array([index for key in keys for index in wall_index.cells[key]], dtype = numpy.intp)
+
+			self.wall_arrays = tuple(geometry[:, i] for i in range(9))
+
+		return self.wall_arrays
+
+	def _Candidates(self, wall_index):	# (entity, wall) arrays of every wall near every entity, sorted by entity then wall (the same search as WallIndex.Collide)
+		size = wall_index.cell_size
+		last = len(self.keys) - 1
+
+		# The range of cells each entity looks in, further than the radius as pushing out of one wall may move it towards another
+		reach = self.radius * 2.0
+
+		cx1 = numpy.floor((self.x - reach) / size).astype(numpy.int64)
+		cy1 = numpy.floor((self.y - reach) / size).astype(numpy.int64)
+		cx2 = numpy.floor((self.x + reach) / size).astype(numpy.int64)
+		cy2 = numpy.floor((self.y + reach) / size).astype(numpy.int64)
+
+		rows = cy2 - cy1 + 1
+		cell_counts = (cx2 - cx1 + 1) * rows
+		total = int(cell_counts.sum())
+
+		# Every (entity, cell) pair
+		e = numpy.repeat(numpy.arange(len(self.x)), cell_counts)
+		local = numpy.arange(total) - numpy.repeat(numpy.cumsum(cell_counts) - cell_counts, cell_counts)
+
+		keys = ((cx1[e] + (local // rows[e])) * Rays.RayCaster.CELL_KEY) + (cy1[e] + (local % rows[e]))
+		found = numpy.minimum(numpy.searchsorted(self.keys, keys), last)
+		counts = numpy.where(self.keys[found] == keys, self.counts[found], 0)
+
+		# Every (entity, wall) pair, a wall in more than one cell is only kept once
+		total = int(counts.sum())
+
+		if total == 0:
+			return numpy.zeros(0, dtype = numpy.intp), numpy.zeros(0, dtype = numpy.intp)
+
+		firsts = numpy.cumsum(counts) - counts
+
+		e = numpy.repeat(e, counts)
+		w = self.flat[numpy.repeat(self.starts[found], counts) + (numpy.arange(total) - numpy.repeat(firsts, counts))]
+
+		walls = len(self.wall_arrays[0])
+		pairs = numpy.sort((e * walls) + w)
+		pairs = pairs[numpy.concatenate(([True], pairs[1:] != pairs[:-1]))]
+
+		return pairs // walls, pairs % walls
+
+	def _Touching(self, wall_arrays, e, w, x, y):	# If each entity (at x, y) is touching each wall, in the same way as WallIndex.CollideWall
+		x1, y1, x2, y2, ux, uy, length, nx, ny = wall_arrays
+		radius = self.radius[e]
+
+		px = x - x1[w]
+		py = y - y1[w]
+		qx = x - x2[w]
+		qy = y - y2[w]
+
+		distance_along = (px * ux[w]) + (py * uy[w])
+		distance_from_wall = (px * nx[w]) + (py * ny[w])
+
+		return numpy.where(
+			distance_along < 0,
+			numpy.sqrt((px * px) + (py * py)) < radius,
+			numpy.where(
+				distance_along > length[w],
+				numpy.sqrt((qx * qx) + (qy * qy)) < radius,
+				numpy.abs(distance_from_wall) < radius
+			)
+		)
+
+	def _PushOut(self, wall_arrays, e, w):		# Where each entity ends up pushed out of the wall it is touching, in the same way as WallIndex.CollideWall
+		x1, y1, x2, y2, ux, uy, length, nx, ny = wall_arrays
+		radius = self.radius[e]
+
+		px = self.x[e] - x1[w]
+		py = self.y[e] - y1[w]
+		qx = self.x[e] - x2[w]
+		qy = self.y[e] - y2[w]
+
+		distance_along = (px * ux[w]) + (py * uy[w])
+		distance_from_wall = (px * nx[w]) + (py * ny[w])
+
+		before = distance_along < 0
+		after = distance_along > length[w]
+
+		# Only the distance to the end the entity is past is used, it is never 0 as the entity is touching it
+		distance = numpy.sqrt(numpy.where(before, (px * px) + (py * py), (qx * qx) + (qy * qy)))
+		side = numpy.where(distance_from_wall < 0, -radius, radius)
+
+		with numpy.errstate(divide = "ignore", invalid = "ignore"):
+			x = numpy.where(
+				before,
+				x1[w] + (px / distance * radius),
+				numpy.where(after, x2[w] + (qx / distance * radius), x1[w] + (ux[w] * distance_along) + (nx[w] * side))
+			)
+
+			y = numpy.where(
+				before,
+				y1[w] + (py / distance * radius),
+				numpy.where(after, y2[w] + (qy / distance * radius), y1[w] + (uy[w] * distance_along) + (ny[w] * side))
+			)
+
+		return x, y
+
+	def _Collide(self, wall_index):
+		if len(wall_index.walls) == 0:
+			return
+
+		wall_arrays = self._WallArrays(wall_index)
+
+		if len(self.keys) == 0:
+			return
+
+		e, w = self._Candidates(wall_index)
+
+		if len(e) == 0:
+			return
+
+		# The pairs of each entity are a run, ends is one past the last pair of each entity
+		ends = numpy.searchsorted(e, numpy.arange(len(self.x)), side = "right")
+
+		# An entity which is not touching any wall is not moved. The rest are pushed out of the first wall they touch,
+		# pushing out of one wall can move an entity into another so the order matters. The walls after it are tested
+		# again from where it was pushed to, and it is pushed out of the first of those it touches, until it touches none
+		pairs = numpy.flatnonzero(self._Touching(wall_arrays, e, w, self.x[e], self.y[e]))
+
+		while len(pairs) > 0:
+			entities = e[pairs]
+			firsts = pairs[numpy.concatenate(([True], entities[1:] != entities[:-1]))]
+
+			moved = e[firsts]
+			self.x[moved], self.y[moved] = self._PushOut(wall_arrays, moved, w[firsts])
+
+			# The pairs after the wall each entity was pushed out of
+			counts = ends[moved] - (firsts + 1)
+			total = int(counts.sum())
+
+			if total == 0:
+				break
+
+			later = numpy.repeat(firsts + 1, counts) + (numpy.arange(total) - numpy.repeat(numpy.cumsum(counts) - counts, counts))
+			pairs = later[self._Touching(wall_arrays, e[later], w[later], self.x[e[later]], self.y[e[later]])]
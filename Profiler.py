@@ -0,0 +1,112 @@
+# Title:	Profiler module for Zombie (times each phase of a frame)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# Phases are timed with Begin(name) / End(name) (or Add), the time spent in each phase is summed over a
+# frame and kept in a rolling history when EndFrame is called. A phase made of many items (e.g. one per
+# entity) can also keep the time of its slowest item each frame with Slowest. Stats and histograms of the history can
+# then be read back (e.g. by the Display stats overlay or the benchmark).
+
+import collections
+import math
+import time
+
+class Profiler():
+	HISTORY = 120		# Number of frames kept for each phase
+
+	# Upper edges of the histogram buckets in seconds, the last bucket holds anything slower
+	HISTOGRAM_EDGES = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+
+	def __init__(self, history = HISTORY, clock = time.perf_counter):
+		self.clock = clock			# Returns the time in seconds
+		self.enabled = True			# If False, Begin, End and Add do nothing
+
+		self.Reset(history)
+
+	def Reset(self, history = None):	# Forget everything, optionally changing how many frames are kept
+		if history != None:
+			self.history = history
+
+		self.phases = collections.OrderedDict()		# Rolling history of the time spent in each phase per frame, indexed by the phase name (in the order first seen)
+		self.current = {}							# Time spent in each phase in the current frame
+		self.starts = {}							# The clock() each running phase was started at
+		self.frames = 0								# Number of frames ended
+
+	def Begin(self, name):
+		if self.enabled:
+			self.starts[name] = self.clock()
+
+	def End(self, name):
+		if self.enabled:
+			self.Add(name, self.clock() - self.starts.pop(name))
+
+	def Add(self, name, time_passed):	# Add time to a phase in the current frame
+		if not self.enabled:
+			return
+
+		if not name in self.phases:
+			self.phases[name] = collections.deque(maxlen = self.history)
+
+		self.current[name] = self.current.get(name, 0.0) + time_passed
+
+	def Slowest(self, name, time_passed):	# Time one item of a phase, the slowest in the current frame is kept as the phase name + " slowest"
+		if not self.enabled:
+			return
+
+		name += " slowest"
+
+		if not name in self.phases:
+			self.phases[name] = collections.deque(maxlen = self.history)
+
+		if time_passed > self.current.get(name, 0.0):
+			self.current[name] = time_passed
+
+	def EndFrame(self):				# Store the times of the current frame in the history
+		for name, samples in self.phases.items():
+			samples.append(self.current.get(name, 0.0))
+
+		self.current = {}
+		self.frames += 1
+
+	def Samples(self, name):		# The times stored for a phase, oldest first
+		return list(self.phases.get(name, ()))
+
+	def Stats(self, name):			# Stats (in seconds) of the stored times of a phase
+		samples = sorted(self.phases.get(name, ()))
+
+		if len(samples) == 0:
+			return {"last" : 0.0, "mean" : 0.0, "p50" : 0.0, "p99" : 0.0, "max" : 0.0}
+
+		return {
+			"last" : self.phases[name][-1],
+			"mean" : sum(samples) / len(samples),
+			"p50" : Profiler.Percentile(samples, 50),
+			"p99" : Profiler.Percentile(samples, 99),
+			"max" : samples[-1],
+		}
+
+	def GetStats(self):				# Stats of every phase, indexed by the phase name
+		return collections.OrderedDict((name, self.Stats(name)) for name in self.phases)
+
+	def Histogram(self, name, edges = HISTOGRAM_EDGES):		# Number of stored times in each bucket (len(edges) + 1 buckets)
+		counts = [0] * (len(edges) + 1)
+
+		for sample in self.phases.get(name, ()):
+			bucket = 0
+
+			while bucket < len(edges) and sample > edges[bucket]:
+				bucket += 1
+
+			counts[bucket] += 1
+
+		return counts
+
+	@staticmethod
+	def Percentile(ordered, percent):	# Nearest rank percentile of a sorted list
+		if len(ordered) == 0:
+			return 0.0
+
+		rank = int(math.ceil((percent / 100.0) * len(ordered))) - 1
+
+		return ordered[max(0, min(rank, len(ordered) - 1))]
@@ -0,0 +1,185 @@
+# Title:	Rays module for Zombie (casts many lines through the walls at once)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# Every line is walked through the cells of a Geometry.WallIndex together: on each pass all the lines still
+# going take one step (the same DDA walk as WallIndex.Raycast) and every (line, wall in its cell) pair is
+# tested in one vectorised pass with NumPy. A line stops once its nearest hit comes before the way out of its
+# cell, so only the walls along each line are ever tested. The results are the same as WallIndex.Raycast.
+# Without NumPy each line is cast on its own.
+
+import math
+
+try:
+	import numpy
+
+except ImportError:		# Optional, fall back to casting one line at a time
+	numpy = None
+
+class RayCaster():
+	BATCH_MIN = 16			# Fewer lines than this are cast one at a time, it is quicker than setting up the arrays
+	CELL_KEY = 1 << 32		# Cells are looked up by (cell_x * CELL_KEY) + cell_y
+
+	def __init__(self):
+		self.wall_index = None	# The Geometry.WallIndex the arrays were made from
+		self.wall_version = 0	# The version of the wall index they were made from
+
+		# The cells of the wall index as sorted keys, with the start and number of their walls in one flat array
+		self.keys = None
+		self.starts = None
+		self.counts = None
+		self.flat = None
+
+		self.walls = None		# The wall lines as a tuple of arrays (x1, y1, x2, y2)
+
+	def Cast(self, wall_index, x1, y1, x2, y2):		# Cast lists of lines, the result for each is (t, index) of the first wall it hits or None (see WallIndex.Raycast)
+		if numpy is None or len(x1) < RayCaster.BATCH_MIN:
+			return [wall_index.Raycast(x1[i], y1[i], x2[i], y2[i]) for i in range(len(x1))]
+
+		best_t, best = self._Cast(wall_index, x1, y1, x2, y2)
+
+		return [None if index < 0 else (t, index) for t, index in zip(best_t.tolist(), best.tolist())]
+
+	def Visible(self, wall_index, x1, y1, x2, y2):	# If no wall is in the way along each line
+		if numpy is None or len(x1) < RayCaster.BATCH_MIN:
+			return [wall_index.Raycast(x1[i], y1[i], x2[i], y2[i]) is None for i in range(len(x1))]
+
+		best_t, best = self._Cast(wall_index, x1, y1, x2, y2)
+
+		return (best < 0).tolist()
+
+	def _Arrays(self, wall_index):
+		if self.wall_index is wall_index and self.wall_version == wall_index.version:
+			return
+
+		self.wall_index = wall_index
+		self.wall_version = wall_index.version
+
+		if wall_index.PACKED:	# Read from a level file, which stores the cells in the same way
+			geometry, self.keys, starts, counts, flat = wall_index.Arrays()
+
+			self.starts = starts.astype(numpy.intp)
+			self.counts = counts.astype(numpy.intp)
+			self.flat = flat.astype(numpy.intp)
+			self.walls = tuple(geometry[:, i] for i in range(4))
+			return
+
+		keys = sorted(wall_index.cells.keys())
+
+		self.keys = numpy.array([(cx * RayCaster.CELL_KEY) + cy for cx, cy in keys], dtype = numpy.int64)
+		self.counts = numpy.array([len(wall_index.cells[key]) for key in keys], dtype = numpy.intp)
+		self.starts = numpy.zeros(len(keys), dtype = numpy.intp)
+
+		if len(keys) > 0:
+			self.starts[1:] = numpy.cumsum(self.counts)[:-1]
+
+		self.flat = numpy.array([index for key in keys for index in wall_index.cells[key]], dtype = numpy.intp)
+
+		lines = numpy.array([wall[:4] if wall is not None else (0.0, 0.0, 0.0, 0.0) for wall in wall_index.walls], dtype = float).reshape(-1, 4)
+		self.walls = tuple(lines[:, i] for i in range(4))
+
+	def _Cast(self, wall_index, x1, y1, x2, y2):	# (t, index) arrays of the first wall each line hits (index -1 if none)
+		self._Arrays(wall_index)
+
+		x1 = numpy.asarray(x1, dtype = float)
+		y1 = numpy.asarray(y1, dtype = float)
+		dx = numpy.asarray(x2, dtype = float) - x1
+		dy = numpy.asarray(y2, dtype = float) - y1
+
+		count = len(x1)
+		size = wall_index.cell_size
+
+		best_t = numpy.full(count, math.inf)
+		best = numpy.full(count, -1, dtype = numpy.intp)
+
+		if len(self.keys) == 0:
+			return best_t, best
+
+		cx = numpy.floor(x1 / size).astype(numpy.int64)
+		cy = numpy.floor(y1 / size).astype(numpy.int64)
+		end_cx = numpy.floor((x1 + dx) / size).astype(numpy.int64)
+		end_cy = numpy.floor((y1 + dy) / size).astype(numpy.int64)
+
+		step_x, t_max_x, t_delta_x = RayCaster._Steps(cx, x1, dx, size)
+		step_y, t_max_y, t_delta_y = RayCaster._Steps(cy, y1, dy, size)
+
+		wx1, wy1, wx2, wy2 = self.walls
+		last = len(self.keys) - 1
+
+		active = numpy.arange(count)
+
+		while len(active) > 0:
+			# Find the walls in the cell each line is in
+			keys = (cx[active] * RayCaster.CELL_KEY) + cy[active]
+			found = numpy.minimum(numpy.searchsorted(self.keys, keys), last)
+			counts = numpy.where(self.keys[found] == keys, self.counts[found], 0)
+
+			total = int(counts.sum())
+
+			if total > 0:
+				lines = numpy.repeat(active, counts)
+				firsts = numpy.cumsum(counts) - counts
+				walls = self.flat[numpy.repeat(self.starts[found], counts) + (numpy.arange(total) - numpy.repeat(firsts, counts))]
+
+				# Test every pair, in the same way as WallIndex.Intersect
+				ex = wx2[walls] - wx1[walls]
+				ey = wy2[walls] - wy1[walls]
+				ldx = dx[lines]
+				ldy = dy[lines]
+
+				denominator = (ldx * ey) - (ldy * ex)
+				qx = wx1[walls] - x1[lines]
+				qy = wy1[walls] - y1[lines]
+
+				with numpy.errstate(divide = "ignore", invalid = "ignore"):
+					t = ((qx * ey) - (qy * ex)) / denominator
+					u = ((qx * ldy) - (qy * ldx)) / denominator
+
+				hit = (denominator != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+
+				if hit.any():
+					lines = lines[hit]
+					walls = walls[hit]
+					t = t[hit]
+
+					# Keep the nearest hit of each line, the lowest wall index if two are as near
+					order = numpy.lexsort((walls, t, lines))
+					lines = lines[order]
+					first = numpy.ones(len(lines), dtype = bool)
+					first[1:] = lines[1:] != lines[:-1]
+
+					lines = lines[first]
+					walls = walls[order][first]
+					t = t[order][first]
+
+					better = (t < best_t[lines]) | ((t == best_t[lines]) & (walls < best[lines]))
+					best_t[lines[better]] = t[better]
+					best[lines[better]] = walls[better]
+
+			# Stop the lines which have hit a wall before leaving their cell or have reached their end, step the rest
+			t_exit = numpy.minimum(t_max_x[active], t_max_y[active])
+			done = (best_t[active] <= t_exit) | (t_exit > 1.0) | ((cx[active] == end_cx[active]) & (cy[active] == end_cy[active]))
+
+			active = active[~done]
+
+			along_x = t_max_x[active] < t_max_y[active]
+			moving_x = active[along_x]
+			moving_y = active[~along_x]
+
+			cx[moving_x] += step_x[moving_x]
+			t_max_x[moving_x] += t_delta_x[moving_x]
+			cy[moving_y] += step_y[moving_y]
+			t_max_y[moving_y] += t_delta_y[moving_y]
+
+		return best_t, best
+
+	@staticmethod
+	def _Steps(cell, start, delta, size):	# Arrays of (step, t of the first cell boundary, t across one cell) along one axis, as WallIndex._Steps
+		step = numpy.sign(delta).astype(numpy.int64)
+
+		with numpy.errstate(divide = "ignore", invalid = "ignore"):
+			t_max = numpy.where(delta > 0, (((cell + 1) * size) - start) / delta, numpy.where(delta < 0, ((cell * size) - start) / delta, math.inf))
+			t_delta = numpy.where(delta != 0, size / numpy.abs(delta), math.inf)
+
+		return step, t_max, t_delta
@@ -0,0 +1,232 @@
+# Title:	Replay module for Zombie (records games and plays them back)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py, record with: python3 Zombie.py --record game.zrec, replay with: python3 Replay.py game.zrec
+# Version:	v0.0
+
+# A recording holds the seed of the game, every key event and every scene change, each with the simulation
+# step it happened at. The world runs in fixed steps and key events are only handled at the start of a
+# step, so feeding the same keys in at the same steps of a game with the same seed plays exactly the same
+# game, however fast the frames were drawn. A replay runs headless with a virtual clock as fast as it can,
+# checks the scene changes happen at the same steps and that the men end where they did, and times each
+# phase of the frames like the benchmark.
+#
+# Recording format (little endian):
+#	Header:		magic "ZREC", version (uint16), reserved (uint16), seed (uint64), step time (float64),
+#				steps (uint32), digest of the end state (uint32), event count (uint32)
+#	Events:		step (uint32), kind (uint8), pressed or scene (uint8), key code (uint16)
+
+import argparse
+import itertools
+import json
+import struct
+import sys
+import time
+import zlib
+
+import World
+
+MAGIC = b"ZREC"
+VERSION = 1
+
+HEADER = struct.Struct("<4sHHQdIII")
+EVENT = struct.Struct("<IBBH")
+POSITION = struct.Struct("<dd")
+
+# Kinds of event
+KEY = 0
+SCENE = 1
+
+class ReplayError(Exception):
+	pass
+
+class Recording():
+	def __init__(self, seed, steps = 0, digest = 0, events = None):
+		self.seed = seed						# Seed of the game's random numbers
+		self.steps = steps						# Steps simulated in the game
+		self.digest = digest					# Digest of the state the game ended in
+		self.events = events if events != None else []	# A list of (step, kind, pressed or scene, key code) in the order they happened
+
+	@staticmethod
+	def Load(path):
+		with open(path, "rb") as f:
+			data = f.read()
+
+		if len(data) < HEADER.size:
+			raise ReplayError(path + " is not a recording")
+
+		magic, version, reserved, seed, step_time, steps, digest, count = HEADER.unpack_from(data, 0)
+
+		if magic != MAGIC:
+			raise ReplayError(path + " is not a recording")
+
+		if version != VERSION:
+			raise ReplayError(path + " is version " + str(version) + ", expected " + str(VERSION))
+
+		if step_time != World.World.STEP_TIME:
+			raise ReplayError(path + " was recorded with a step time of " + str(step_time) + ", the world steps every " + str(World.World.STEP_TIME))
+
+		if len(data) < HEADER.size + (count * EVENT.size):
+			raise ReplayError(path + " is truncated")
+
+		return Recording(seed, steps, digest, list(EVENT.iter_unpack(data[HEADER.size:HEADER.size + (count * EVENT.size)])))
+
+	def Save(self, path):
+		with open(path, "wb") as f:
+			f.write(HEADER.pack(MAGIC, VERSION, 0, self.seed, World.World.STEP_TIME, self.steps, self.digest, len(self.events)))
+
+			for event in self.events:
+				f.write(EVENT.pack(*event))
+
+class Recorder():			# Records a game as it is played, attach it before the first Tick
+	def __init__(self, zombie):
+		self.z = zombie
+		self.recording = Recording(zombie.game.seed)
+
+		self.z.display.AddKeyListener(self._OnKeyEvent)
+		self.z.game.AddSceneListener(self._OnScene)
+
+	def _OnKeyEvent(self, event):
+		self.recording.events.append((self.z.world.steps, KEY, str(event.type) == "KeyPress", event.keycode))
+
+	def _OnScene(self, scene):
+		self.recording.events.append((self.z.world.steps, SCENE, scene, 0))
+
+	def Stop(self):			# Stop recording, the Recording is returned
+		self.z.display.RemoveKeyListener(self._OnKeyEvent)
+		self.z.game.RemoveSceneListener(self._OnScene)
+
+		self.recording.steps = self.z.world.steps
+		self.recording.digest = Digest(self.z)
+
+		return self.recording
+
+	def Save(self, path):	# Stop recording and save the recording
+		self.Stop().Save(path)
+
+class Replayer():			# Plays a recording back headless
+	FRAME_STEPS = 3			# Steps run for each frame drawn (40 frames per second)
+
+	def __init__(self, recording, frame_steps = FRAME_STEPS):
+		import Zombie
+
+		self.recording = recording
+		self.frame_steps = frame_steps
+
+		self.z = Zombie.Zombie(headless = True, seed = recording.seed)
+		self.z.display.tick_function = self._Tick		# Run whole steps with the recorded keys rather than following the clock
+
+		self.next_event = 0		# Index of the next recorded event
+		self.scenes = []		# The (step, scene) of the scene changes in the replay
+		self.diverged = None	# The step the replay first did something the recording did not (None if it has not)
+
+		self.z.game.AddSceneListener(self._OnScene)
+
+	def _OnScene(self, scene):
+		self.scenes.append((self.z.world.steps, scene))
+
+	def _Tick(self):
+		world = self.z.world
+		events = self.recording.events
+
+		for i in range(self.frame_steps):
+			if world.steps >= self.recording.steps:
+				return
+
+			# Feed in the keys pressed before this step, the scene changes are checked afterwards
+			while self.next_event < len(events) and events[self.next_event][0] <= world.steps:
+				step, kind, value, keycode = events[self.next_event]
+
+				if kind == KEY:
+					self.z.display.SendKey(keycode, value)
+
+				self.next_event += 1
+
+			world.Step(World.World.STEP_TIME)
+
+	def Run(self):			# Play the whole recording, gives the results
+		import Benchmark
+
+		recording = self.recording
+		display = self.z.display
+
+		frames = ((recording.steps + self.frame_steps - 1) // self.frame_steps) + 1
+		self.z.profiler.Reset(frames)
+
+		frame_times = []
+		start = time.perf_counter()
+
+		while self.z.world.steps < recording.steps or len(frame_times) == 0:
+			frame_start = time.perf_counter()
+			display.Frame(self.frame_steps * World.World.STEP_TIME)
+			frame_times.append(time.perf_counter() - frame_start)
+
+		seconds = time.perf_counter() - start
+
+		# Compare with what was recorded
+		recorded_scenes = [(step, value) for step, kind, value, keycode in recording.events if kind == SCENE]
+
+		for recorded, replayed in itertools.zip_longest(recorded_scenes, self.scenes):
+			if recorded != replayed:
+				self.diverged = min(event[0] for event in (recorded, replayed) if event != None)
+				break
+
+		digest = Digest(self.z)
+
+		return {
+			"steps" : recording.steps,
+			"frames" : len(frame_times),
+			"game_seconds" : recording.steps * World.World.STEP_TIME,
+			"seconds" : seconds,
+			"speed" : (recording.steps * World.World.STEP_TIME) / seconds if seconds > 0 else 0.0,
+			"scenes" : self.scenes,
+			"diverged" : self.diverged,
+			"matches" : self.diverged == None and digest == recording.digest,
+			"frame" : Benchmark.Summary(frame_times),
+			"phases" : dict((name, Benchmark.Summary(self.z.profiler.Samples(name))) for name in self.z.profiler.phases),
+		}
+
+def Digest(zombie):			# A checksum of the scene, the steps run and where the men are, the same game ends with the same digest
+	digest = zlib.crc32(struct.pack("<II", zombie.game.scene, zombie.world.steps))
+
+	for entity in zombie.world.entities:
+		digest = zlib.crc32(POSITION.pack(entity.x, entity.y), digest)
+
+	return digest
+
+def Main():
+	parser = argparse.ArgumentParser(description = "Replay a recorded Zombie game headless as fast as possible")
+	parser.add_argument("recording", help = "Recording made with: python3 Zombie.py --record <file>")
+	parser.add_argument("--frame-steps", type = int, default = Replayer.FRAME_STEPS, help = "Simulation steps run for each frame drawn")
+	parser.add_argument("--output", help = "JSON file to save the results to")
+	args = parser.parse_args()
+
+	try:
+		recording = Recording.Load(args.recording)
+
+	except (OSError, ReplayError) as error:
+		print(error)
+		sys.exit(1)
+
+	results = Replayer(recording, args.frame_steps).Run()
+
+	print("%d steps (%.1f s of play) in %.3f s, %.1fx real time" % (results["steps"], results["game_seconds"], results["seconds"], results["speed"]))
+	print("frame p50 %.3f ms, p99 %.3f ms" % (results["frame"]["p50"] * 1000, results["frame"]["p99"] * 1000))
+
+	if results["matches"]:
+		print("The replay matches the recording")
+
+	elif results["diverged"] != None:
+		print("The replay diverged from the recording at step %d" % results["diverged"])
+
+	else:
+		print("The replay ended in a different state to the recording")
+
+	if args.output != None:
+		with open(args.output, "w") as f:
+			json.dump(results, f, indent = 2)
+
+	if not results["matches"]:
+		sys.exit(1)
+
+if __name__ == "__main__":
+	Main()
@@ -0,0 +1,260 @@
+# Title:	Scene module for Zombie (keeps canvas items alive between frames)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# A retained scene graph on top of a tkinter canvas.
+# Every item is identified by a key (any hashable, e.g. (man, "head")). The first time a key is drawn
+# the item is created, after that it is only changed with coords / itemconfigure when its values change.
+# Items which were not drawn during a frame are deleted when the frame ends.
+#
+# A group draws a template (several items with coordinates relative to an origin) as one item. When only
+# the origin changes the whole group is moved with one canvas.move call.
+#
+# Items are grouped into layers which are stacked in the order they are started each frame.
+# A layer started with a stamp is static: it is only redrawn when the stamp changes, otherwise
+# its items are kept as they are without any work. A static layer which is kept can be given an offset,
+# then all its items are moved that far from where they were drawn with one canvas.move call (for scrolling).
+
+class Layer():
+	def __init__(self, name):
+		self.name = name
+		self.tag = "layer_" + name	# Canvas tag given to every item in the layer (tags can't have spaces, tkinter splits a string of tags on them)
+
+		self.stamp = None			# The stamp the layer was last drawn with (None for dynamic layers)
+		self.offset = (0, 0)		# How far the items have been moved from where they were drawn
+		self.items = {}				# Items indexed by their key. A list of: [item id, coords, options, last frame drawn]
+									# or for groups: [group tag, origin, template, last frame drawn, item ids]
+
+		self.order = []				# Item ids in the order they were drawn this frame
+		self.created = False		# If an item has been created this frame
+		self.restack = False		# If the items need to be restacked at the end of the frame
+		self.drawn = False			# If the layer was drawn (not kept) this frame
+
+class Scene():
+	ID = 0			# Index of the values stored for each item
+	COORDS = 1
+	OPTIONS = 2
+	FRAME = 3
+	IDS = 4			# Index of the item ids of a group
+
+	def __init__(self, canvas):
+		self.canvas = canvas	# The tkinter canvas the items live on
+
+		self.layers = {}		# Layers indexed by their name
+		self.stack = []			# Layers in the order they were started this frame, bottom first
+		self.last_stack = []	# The stack of the previous frame
+		self.layer = None		# The layer currently being drawn
+		self.frame = 0			# The current frame number
+		self.groups = 0			# Number of groups made, used to give each group its own tag
+
+		self.Layer("default")
+
+	def Begin(self):			# Start a new frame
+		self.frame += 1
+		self.last_stack = self.stack
+		self.stack = []
+
+		self.Layer("default")
+
+	def Layer(self, name, stamp = None, offset = (0, 0)):	# Start drawing a layer, returns False if the layer is static and has not changed (it is then moved to offset)
+		if not name in self.layers:
+			self.layers[name] = Layer(name)
+
+		layer = self.layers[name]
+
+		if not layer in self.stack:
+			self.stack.append(layer)
+
+		self.layer = layer
+
+		if stamp is not None and stamp == layer.stamp:		# Nothing has changed, keep it
+			if offset != layer.offset:
+				self.canvas.move(layer.tag, offset[0] - layer.offset[0], offset[1] - layer.offset[1])
+				layer.offset = offset
+
+			layer.drawn = False
+			return False
+
+		if layer.offset != (0, 0):		# Put the items back where they were drawn, so they can be compared
+			self.canvas.move(layer.tag, -layer.offset[0], -layer.offset[1])
+			layer.offset = (0, 0)
+
+		layer.stamp = stamp
+		layer.order = []
+		layer.created = False
+		layer.restack = False
+		layer.drawn = True
+
+		return True
+
+	def Stamp(self, name):		# The stamp a layer was last drawn with (None if it has not been drawn or is dynamic)
+		layer = self.layers.get(name)
+
+		if layer is None:
+			return None
+
+		return layer.stamp
+
+	def End(self):				# Finish the frame, deleting everything which was not drawn
+		restack = self.stack != self.last_stack
+
+		for layer in list(self.layers.values()):
+			if not layer in self.stack:		# The layer was not used this frame, remove it
+				self._ClearLayer(layer)
+				del self.layers[layer.name]
+				continue
+
+			if not layer.drawn:
+				continue
+
+			dead = []
+
+			for key, item in layer.items.items():
+				if item[Scene.FRAME] != self.frame:
+					dead.append(key)
+
+			for key in dead:
+				self.canvas.delete(layer.items[key][Scene.ID])
+				del layer.items[key]
+
+			# New items are created on top, put everything in the layer back in the order it was drawn
+			if layer.restack:
+				for item_id in layer.order:
+					self.canvas.tag_raise(item_id)
+
+			if layer.created:
+				restack = True
+
+		# Put the layers back in order
+		if restack:
+			for layer in self.stack:
+				self.canvas.tag_raise(layer.tag)
+
+	def Clear(self):			# Delete every item
+		for layer in self.layers.values():
+			self._ClearLayer(layer)
+
+	def _ClearLayer(self, layer):
+		for item in layer.items.values():
+			self.canvas.delete(item[Scene.ID])
+
+		layer.items = {}
+		layer.stamp = None
+		layer.offset = (0, 0)
+
+	def Line(self, key, coords, **options):
+		return self._Item(key, "line", coords, options)
+
+	def Rectangle(self, key, coords, **options):
+		return self._Item(key, "rectangle", coords, options)
+
+	def Polygon(self, key, coords, **options):
+		return self._Item(key, "polygon", coords, options)
+
+	def Oval(self, key, coords, **options):
+		return self._Item(key, "oval", coords, options)
+
+	def Text(self, key, coords, **options):
+		return self._Item(key, "text", coords, options)
+
+	def Image(self, key, coords, **options):
+		return self._Item(key, "image", coords, options)
+
+	def Group(self, key, origin, template):		# Draw a template, a tuple of (kind, coords, options) with coords relative to origin (x, y)
+		layer = self.layer
+		group = layer.items.get(key)
+		x, y = origin
+
+		if group is not None and group[Scene.OPTIONS] is not template and len(group[Scene.OPTIONS]) != len(template):
+			self.canvas.delete(group[Scene.ID])		# A different shape, start again
+			group = None
+
+		if group is None:		# Create the items
+			self.groups += 1
+			tag = "group_" + str(self.groups)
+
+			ids = []
+
+			for kind, coords, options in template:
+				ids.append(getattr(self.canvas, "create_" + kind)(*Scene._Translate(coords, x, y), tags = (layer.tag, tag), **options))
+
+			group = [tag, origin, template, self.frame, ids]
+			layer.items[key] = group
+			layer.created = True
+
+		else:
+			if group[Scene.OPTIONS] is not template:	# A new template, change each item
+				moved = group[Scene.COORDS] != origin
+
+				for item_id, part, old_part in zip(group[Scene.IDS], template, group[Scene.OPTIONS]):
+					if moved or part[1] != old_part[1]:
+						self.canvas.coords(item_id, *Scene._Translate(part[1], x, y))
+
+					if part[2] != old_part[2]:
+						self.canvas.itemconfigure(item_id, **part[2])
+
+				group[Scene.OPTIONS] = template
+				group[Scene.COORDS] = origin
+
+			elif group[Scene.COORDS] != origin:		# Only moved
+				old_x, old_y = group[Scene.COORDS]
+				self.canvas.move(group[Scene.ID], x - old_x, y - old_y)
+				group[Scene.COORDS] = origin
+
+			group[Scene.FRAME] = self.frame
+
+			if layer.created:
+				layer.restack = True
+
+		layer.order.append(group[Scene.ID])
+
+		return group[Scene.ID]
+
+	def Keep(self, key):		# Keep an item (or group) as it was last drawn, returns False if there is no such item to keep
+		layer = self.layer
+		item = layer.items.get(key)
+
+		if item is None:
+			return False
+
+		item[Scene.FRAME] = self.frame
+
+		if layer.created:
+			layer.restack = True
+
+		layer.order.append(item[Scene.ID])
+
+		return True
+
+	@staticmethod
+	def _Translate(coords, x, y):		# Move a flat list of (x, y) coordinates by (x, y)
+		return [value + (y if i % 2 else x) for i, value in enumerate(coords)]
+
+	def _Item(self, key, kind, coords, options):
+		layer = self.layer
+		item = layer.items.get(key)
+
+		if item is None:	# Create the item
+			item_id = getattr(self.canvas, "create_" + kind)(*coords, tags = (layer.tag,), **options)
+			item = [item_id, coords, options, self.frame]
+			layer.items[key] = item
+			layer.created = True
+
+		else:				# Only change what has changed
+			if item[Scene.COORDS] != coords:
+				self.canvas.coords(item[Scene.ID], *coords)
+				item[Scene.COORDS] = coords
+
+			if item[Scene.OPTIONS] != options:
+				self.canvas.itemconfigure(item[Scene.ID], **options)
+				item[Scene.OPTIONS] = options
+
+			item[Scene.FRAME] = self.frame
+
+			if layer.created:	# An older item is drawn after a new one, so the new one is in the wrong place
+				layer.restack = True
+
+		layer.order.append(item[Scene.ID])
+
+		return item[Scene.ID]
@@ -0,0 +1,159 @@
+# Title:	Triggers module for Zombie (zones in the world which entities set off)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# Triggers are circles in the world (pickups, doors, checkpoints, exits). They are kept in a spatial hash so
+# each entity is only tested against the triggers near it. Each entity remembers which triggers it is inside,
+# so a trigger raises exactly one enter event when an entity comes in, one exit event when it leaves and a
+# stay event for every update in between.
+
+import math
+
+class Trigger():
+	def __init__(self, x, y, radius, on_enter = None, on_stay = None, on_exit = None):
+		self.x = x					# Centre of the trigger
+		self.y = y
+		self.radius = radius		# Distance from the centre an entity needs to be inside to set it off
+
+		# Functions of the form: def Callback(entity), any can be None
+		self.on_enter = on_enter	# Called when an entity moves into the trigger
+		self.on_stay = on_stay		# Called on every update an entity is still inside the trigger
+		self.on_exit = on_exit		# Called when an entity moves out of the trigger
+
+		self.id = None				# Set when added, events are raised in the order triggers were added
+		self.cells = []				# The cells the trigger has been put in
+		self.active = False			# If the trigger is in a TriggerSystem
+
+	def Contains(self, x, y):
+		dx = x - self.x
+		dy = y - self.y
+
+		return (dx * dx) + (dy * dy) <= self.radius * self.radius
+
+class TriggerSystem():
+	CELL_SIZE = 2.0		# Size of one spatial hash cell (relative to one size unit)
+
+	ENTER = 0			# Event types, raised in this order for each entity
+	STAY = 1
+	EXIT = 2
+
+	def __init__(self, cell_size = CELL_SIZE):
+		self.cell_size = cell_size
+
+		self.cells = {}		# Lists of triggers indexed by (cell_x, cell_y)
+		self.count = 0		# Number of triggers
+		self.next_id = 0	# Id given to the next trigger added
+
+		self.inside = {}	# Sets of the triggers each entity is inside, indexed by the entity
+		self.triggers = {}	# Every trigger indexed by its id
+
+	def Add(self, trigger):
+		trigger.id = self.next_id
+		trigger.active = True
+		self.next_id += 1
+		self.count += 1
+
+		self.triggers[trigger.id] = trigger
+
+		# Put the trigger in every cell its circle touches
+		cx1, cy1 = self._Cell(trigger.x - trigger.radius, trigger.y - trigger.radius)
+		cx2, cy2 = self._Cell(trigger.x + trigger.radius, trigger.y + trigger.radius)
+
+		trigger.cells = []
+
+		for cx in range(cx1, cx2 + 1):
+			for cy in range(cy1, cy2 + 1):
+				self.cells.setdefault((cx, cy), []).append(trigger)
+				trigger.cells.append((cx, cy))
+
+		return trigger
+
+	def Remove(self, trigger):		# Remove a trigger, no exit events are raised for it
+		if not trigger.active:
+			return
+
+		for cell in trigger.cells:
+			triggers = self.cells[cell]
+			triggers.remove(trigger)
+
+			if len(triggers) == 0:
+				del self.cells[cell]
+
+		trigger.cells = []
+		trigger.active = False
+		self.count -= 1
+
+		del self.triggers[trigger.id]
+
+		for triggers in self.inside.values():
+			triggers.discard(trigger)
+
+	def Clear(self):				# Remove every trigger, no exit events are raised
+		for triggers in self.cells.values():
+			for trigger in triggers:
+				trigger.active = False
+				trigger.cells = []
+
+		self.cells = {}
+		self.count = 0
+		self.inside = {}
+		self.triggers = {}
+
+	def State(self):				# (trigger, number of entities inside it) for every trigger, in the order they were added
+		inside = {}
+
+		for triggers in self.inside.values():
+			for trigger in triggers:
+				inside[trigger.id] = inside.get(trigger.id, 0) + 1
+
+		return [(self.triggers[id], inside.get(id, 0)) for id in sorted(self.triggers)]
+
+	def _Cell(self, x, y):
+		return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+	def Query(self, x, y):			# The triggers a point is inside
+		triggers = self.cells.get(self._Cell(x, y))
+
+		if triggers is None:
+			return set()
+
+		return set(trigger for trigger in triggers if trigger.Contains(x, y))
+
+	def Update(self, entities, xs = None, ys = None):	# Find which triggers each entity is inside and raise the events for the changes
+		events = []
+		inside = {}
+
+		# The positions of the entities can be given, otherwise they are read from the entities
+		if xs is None:
+			xs = [entity.x for entity in entities]
+			ys = [entity.y for entity in entities]
+
+		for entity, x, y in zip(entities, xs, ys):
+			now = self.Query(x, y)
+			before = self.inside.get(entity, ())
+
+			for trigger in now:
+				events.append((entity, TriggerSystem.STAY if trigger in before else TriggerSystem.ENTER, trigger))
+
+			for trigger in before:
+				if not trigger in now:
+					events.append((entity, TriggerSystem.EXIT, trigger))
+
+			inside[entity] = now
+
+		# Entities which are no longer in the world are forgotten
+		self.inside = inside
+
+		# Raise the events in a fixed order. A callback may remove triggers (e.g. changing the scene),
+		# events for triggers which have been removed are not raised
+		events.sort(key = lambda event: (event[1], event[2].id))
+
+		for entity, event, trigger in events:
+			if not trigger.active:
+				continue
+
+			callback = (trigger.on_enter, trigger.on_stay, trigger.on_exit)[event]
+
+			if callback != None:
+				callback(entity)
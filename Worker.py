@@ -0,0 +1,256 @@
+# Title:	Worker module for Zombie (runs the simulation in another process)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py, run with: python3 Zombie.py --worker
+# Version:	v0.0
+
+# The world, the men and the game are run by a second process (a headless Zombie) so heavy simulation does
+# not hold up input or drawing. After every tick it publishes a snapshot of the scene, the entities and the
+# triggers into a ring of slots in shared memory. The window process only reads the latest snapshot and draws
+# it with its own World, which holds a stand in Man for each entity. Only the stand ins which changed are
+# damaged, so the window still skips frames when nothing moves. Key events are sent to the worker on a queue.
+#
+# Each slot is guarded by two sequence numbers (written before and after the snapshot). A reader copies the
+# slot and checks both match the sequence it expected, otherwise the writer was part way through and the
+# snapshot is skipped.
+#
+# Shared memory layout (little endian):
+#	Header:		sequence of the latest snapshot (uint64)
+#	Slots:		SLOTS of: begin sequence (uint64), end sequence (uint64), frame, MAX_ENTITIES entities, MAX_TRIGGERS triggers
+#	Frame:		scene (uint32), world version (uint32), entity count (uint32), trigger count (uint32),
+#				camera target id (int32, -1 for none), time not simulated yet (float64), time published (float64, time.time())
+#	Entity:		id (uint32), x, y, last x, last y, size (float64), facing right, animation (uint8)
+#	Trigger:	id (uint32), x, y, radius (float64), entities inside (uint32)
+
+import multiprocessing
+import queue
+import struct
+import time
+
+from multiprocessing import shared_memory
+
+import Entities
+import Game
+import World
+
+HEADER = struct.Struct("<Q")
+SEQUENCE = struct.Struct("<QQ")
+FRAME = struct.Struct("<IIIIidd")
+ENTITY = struct.Struct("<IdddddBB")
+TRIGGER = struct.Struct("<IdddI")
+
+SLOTS = 3				# Snapshots kept, the writer can fill the others while the reader copies one
+MAX_ENTITIES = 4096		# Most entities in a snapshot, any more are left out
+MAX_TRIGGERS = 256		# Most triggers in a snapshot, any more are left out
+
+SLOT_SIZE = SEQUENCE.size + FRAME.size + (MAX_ENTITIES * ENTITY.size) + (MAX_TRIGGERS * TRIGGER.size)
+SIZE = HEADER.size + (SLOTS * SLOT_SIZE)
+
+class SnapshotRing():
+	def __init__(self, buffer):
+		self.buffer = buffer		# The shared memory (a writable buffer of SIZE bytes)
+		self.sequence = 0			# The last snapshot written or read
+
+	def Write(self, scene, version, target, time_lag, entities, triggers):	# Publish a snapshot, entities is a list of (id, x, y, last x, last y, size, facing, animation)
+																				# and triggers a list of (id, x, y, radius, entities inside)
+		self.sequence += 1
+		offset = HEADER.size + ((self.sequence % SLOTS) * SLOT_SIZE)
+
+		entities = entities[:MAX_ENTITIES]
+		triggers = triggers[:MAX_TRIGGERS]
+
+		SEQUENCE.pack_into(self.buffer, offset, self.sequence, 0)
+		FRAME.pack_into(self.buffer, offset + SEQUENCE.size, scene, version, len(entities), len(triggers), target, time_lag, time.time())
+
+		position = offset + SEQUENCE.size + FRAME.size
+
+		for entity in entities:
+			ENTITY.pack_into(self.buffer, position, *entity)
+			position += ENTITY.size
+
+		position = offset + SEQUENCE.size + FRAME.size + (MAX_ENTITIES * ENTITY.size)
+
+		for trigger in triggers:
+			TRIGGER.pack_into(self.buffer, position, *trigger)
+			position += TRIGGER.size
+
+		SEQUENCE.pack_into(self.buffer, offset, self.sequence, self.sequence)
+		HEADER.pack_into(self.buffer, 0, self.sequence)
+
+	def Read(self):			# The latest snapshot as (scene, version, target, time_lag, published, entities, triggers), None if there is nothing new
+		sequence = HEADER.unpack_from(self.buffer, 0)[0]
+
+		if sequence == self.sequence:
+			return None
+
+		offset = HEADER.size + ((sequence % SLOTS) * SLOT_SIZE)
+
+		if SEQUENCE.unpack_from(self.buffer, offset)[1] != sequence:		# Not finished
+			return None
+
+		scene, version, count, trigger_count, target, time_lag, published = FRAME.unpack_from(self.buffer, offset + SEQUENCE.size)
+
+		start = offset + SEQUENCE.size + FRAME.size
+		data = bytes(self.buffer[start:start + (min(count, MAX_ENTITIES) * ENTITY.size)])
+
+		start += MAX_ENTITIES * ENTITY.size
+		trigger_data = bytes(self.buffer[start:start + (min(trigger_count, MAX_TRIGGERS) * TRIGGER.size)])
+
+		if SEQUENCE.unpack_from(self.buffer, offset)[0] != sequence:		# Overwritten while it was copied
+			return None
+
+		self.sequence = sequence
+
+		return (scene, version, target, time_lag, published, list(ENTITY.iter_unpack(data)), list(TRIGGER.iter_unpack(trigger_data)))
+
+class Simulation():		# The window side, starts the worker process and draws what it sends
+	def __init__(self):
+		self.memory = shared_memory.SharedMemory(create = True, size = SIZE)
+		self.memory.buf[:HEADER.size] = bytes(HEADER.size)
+
+		self.ring = SnapshotRing(self.memory.buf)
+		self.events = multiprocessing.Queue()	# Key events for the worker, (keycode, pressed) or None to stop
+
+		self.world_key = None		# The (scene, world version) drawn
+		self.men = {}				# Stand in World.Man for each entity id
+		self.states = {}			# The last published state of each entity, indexed by its id
+		self.triggers = []			# The last published triggers, a list of (id, x, y, radius, entities inside)
+
+		self.process = multiprocessing.Process(target = Main, args = (self.memory.name, self.events), name = "Zombie simulation")
+		self.process.daemon = True
+		self.process.start()
+
+	def OnKeyEvent(self, event):	# A key listener for the display
+		self.events.put((event.keycode, str(event.type) == "KeyPress"))
+
+	def Update(self, world):		# Copy the latest snapshot into the world, run instead of World.Tick
+		snapshot = self.ring.Read()
+
+		if snapshot == None:
+			return
+
+		scene, version, target, time_lag, published, entities, self.triggers = snapshot
+
+		if (scene, version) != self.world_key:
+			self.world_key = (scene, version)
+			world.SetWorld(Game.Game.WORLDS[scene])
+
+			# The images are drawn here, get the next scene's ready while this one is played
+			if scene + 1 in Game.Game.WORLDS:
+				world.Preload(Game.Game.WORLDS[scene + 1])
+
+		# Each snapshot is a step, the moving men are only drawn between its positions until the next one
+		world.moving = set()
+
+		# Add, move and remove the stand ins to match the entities
+		seen = {}
+		states = {}
+
+		for state in entities:
+			entity_id, x, y, last_x, last_y, size, facing, animation = state
+			man = self.men.get(entity_id)
+
+			if man == None or man.size != size:
+				if man != None:
+					world.RemoveEntity(man)
+
+				man = World.Man(x, y, size)
+				world.AddEntity(man)
+
+			# Only the men which have changed or are still moving are redrawn, where they were and where they are now
+			moving = x != last_x or y != last_y
+
+			if state != self.states.get(entity_id) or moving:
+				world.Damage(man.Bounds())
+
+				man.x = x
+				man.y = y
+				man.last_x = last_x
+				man.last_y = last_y
+				man.dir = facing
+				man.animation = animation
+
+				world.Damage(man.Bounds(), moving)
+
+			seen[entity_id] = man
+			states[entity_id] = state
+
+		for entity_id, man in self.men.items():
+			if not entity_id in seen:
+				world.RemoveEntity(man)
+
+		self.men = seen
+		self.states = states
+
+		world.camera.target = seen.get(target)
+
+		# Draw between the steps as far as the time since the snapshot was taken
+		world.time_lag = min(time_lag + max(0.0, time.time() - published), World.World.STEP_TIME)
+
+	def Close(self):
+		self.events.put(None)
+		self.process.join(1.0)
+
+		if self.process.is_alive():
+			self.process.terminate()
+
+		self.ring.buffer = None
+		self.ring = None
+		self.memory.close()
+		self.memory.unlink()
+
+def Main(name, events):		# Run in the worker process
+	import Zombie
+
+	# The window process owns the shared memory, it removes it when done. Before Python 3.13 the memory is
+	# tracked again here, but by the window process's resource tracker so it is still only removed once.
+	try:
+		memory = shared_memory.SharedMemory(name = name, track = False)
+
+	except TypeError:		# Before Python 3.13
+		memory = shared_memory.SharedMemory(name = name)
+
+	try:
+		z = Zombie.Zombie(headless = True, clock = time.time)
+		ring = SnapshotRing(memory.buf)
+
+		next_tick = time.time()
+
+		while True:
+			# Pass on the key events
+			try:
+				while True:
+					event = events.get_nowait()
+
+					if event == None:
+						return
+
+					z.display.SendKey(event[0], event[1])
+
+			except queue.Empty:
+				pass
+
+			z.world.Tick()
+
+			values = Entities.Snapshot(z.world.pool)
+
+			ring.Write(z.game.scene, z.world.version, _Id(z.world.camera.target), z.world.time_lag, [
+				(slot, values.x[slot], values.y[slot], values.last_x[slot], values.last_y[slot], values.size[slot], values.facing[slot] != 0.0, values.animation[slot] != 0.0)
+				for slot in z.world.slots
+			], [
+				(trigger.id, trigger.x, trigger.y, trigger.radius, inside)
+				for trigger, inside in z.world.triggers.State()
+			])
+
+			# Tick once a step
+			next_tick = max(next_tick + World.World.STEP_TIME, time.time() - World.World.STEP_TIME)
+			time.sleep(max(0.0, next_tick - time.time()))
+
+	finally:
+		ring = None
+		memory.close()
+
+def _Id(entity):			# The id of an entity in the snapshots
+	if entity == None:
+		return -1
+
+	return entity.slot
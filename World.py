@@ -1,524 +1,943 @@
-# Title:	World module for Zombie (draws the maze and men)
-# Author:	Nicholas Wright
-# Info:		To be used with Zombie.py
-# Version:	v0.0
-
-# The World, all sizes are relative to smallest dimension (width or height)
-
-import time
-import math
-
-class World():
-	WALL_WIDTH = 0.35			# Width of the wall relative to one size unit
-	WALL_EXTENSION_WIDTH = 0.2	# With of the wall extension
-	
-	WALL_SET_BACK = -0.1		# How much the wall is set back from the end of it (relative to one size unit)
-	WALL_EXTENSION = 0.15		# How much the wall sticks out at the ends (relative to one size unit)
-	
-	WALL_COLOUR = "#000000"
-	BACKGROUND_COLOUR = "#555555"
-	
-	POINT_DISTANCE = 0.5		# The distance from the point a player needs to be to trigger it
-
-	def __init__(self, zombie):
-		self.z = zombie
-		
-		self.SetSize(1, 1)
-	
-		self.background_colour = World.BACKGROUND_COLOUR	# Background colour of the world
-	
-		self.walls = []			# Walls in the world, a list of (x1, y1, x2, y2) for lines
-		self.objects = []		# Objects
-		self.entities = []		# Entities (players)
-		self.images = []		# Images
-		
-		self.point_listeners = []	# Listeners listening for points on the world where a play pay move to. A list of: ((point_x, point_y), function) where the function is of the form: def Point(man), where is the player who triggered the point
-		
-	def AddPointListener(self, point, callback):
-		self.point_listeners.append((point, callback))
-		
-	def ClearPointListeners(self):
-		self.point_listeners = []
-		
-	def SetSize(self, width, height):
-		self.width = width
-		self.height = height
-		
-		# Define the relative size
-		self.size = height
-		
-		if width < height:
-			self.size = height
-		
-	def Update(self, canvas, width, height):
-		# Centre the world on the display
-		world_ratio = self.width / float(self.height)
-		display_ratio = width / float(height)
-		
-		if display_ratio >= world_ratio:		# Relative to height
-			msize = height
-			mx = (width - (world_ratio * msize)) / 2.0
-			my = 0
-			
-		else:									# Relative to width
-			msize = width
-			mx = 0
-			my = (height - (msize / world_ratio)) / 2.0
-			
-		scale = msize / self.size
-		
-		# Update everything
-		canvas.create_rectangle(0, 0, width, height, fill = self.background_colour)
-		
-		self._DrawWalls(canvas, scale, mx, my)
-		
-		for o in self.objects:
-			o.Update(canvas, scale, mx, my)
-			
-		for entity in self.entities:
-			entity.Update(canvas, scale, mx, my, self)
-			
-		for image in self.images:
-			self._DrawImage(canvas, scale, mx, my, image)
-			
-	def _DrawImage(self, canvas, scale, mx, my, image):
-		image_object = self.z.images.GetImage(image[3])
-		
-		canvas.create_image(
-			mx + (image[0] * scale),
-			my + (image[1] * scale),
-			image = image_object
-		)
-	
-	def _DrawWalls(self, canvas, scale, mx, my):
-		# Draw the walls
-		set_back = World.WALL_SET_BACK * scale
-		extension = World.WALL_EXTENSION * scale
-		
-		wall_width = World.WALL_WIDTH * scale
-		wall_extension_width = World.WALL_EXTENSION_WIDTH * scale
-		
-		for wall in self.walls:
-			x1 = mx + (wall[0] * scale)
-			y1 = my + (wall[1] * scale)
-			x2 = mx + (wall[2] * scale)
-			y2 = my + (wall[3] * scale)
-			
-			# Define wall end extensions
-			x1b = x1
-			y1b = y1
-			
-			x2b = x2
-			y2b = y2
-			
-			if x1 < x2:
-				x1 += set_back
-				x2 -= set_back
-				
-				x1b -= extension
-				x2b += extension
-				
-			if x1 > x2:
-				x1 -= set_back
-				x2 += set_back
-				
-				x1b += extension
-				x2b -= extension
-			
-			if y1 < y2:
-				y1 += set_back
-				y2 -= set_back
-				
-				y1b -= extension
-				y2b += extension
-				
-			if y1 > y2:
-				y1 -= set_back
-				y2 += set_back
-				
-				y1b += extension
-				y2b -= extension
-			
-			canvas.create_line(
-				x1, y1, x2, y2,
-				
-				width = wall_width,
-				fill = World.WALL_COLOUR
-			)
-			
-			canvas.create_line(
-				x1, y1, x1b, y1b,
-				
-				width = wall_extension_width,
-				fill = World.WALL_COLOUR
-			)
-			
-			canvas.create_line(
-				x2, y2, x2b, y2b,
-				
-				width = wall_extension_width,
-				fill = World.WALL_COLOUR
-			)
-			
-	def SetWorld(self, world_data):
-		self.SetSize(world_data["Width"], world_data["Height"])
-		
-		if "Background" in world_data:
-			self.background_colour = world_data["Background"]
-			
-		else:
-			self.background_colour = World.BACKGROUND_COLOUR
-		
-		if "Walls" in world_data:
-			self.walls = world_data["Walls"]
-			
-		else:
-			self.walls = []
-			
-		if "Objects" in world_data:
-			self.objects = world_data["Objects"]
-			
-		else:
-			self.objects = []
-			
-		if "Images" in world_data:
-			self.images = world_data["Images"]
-			
-		else:
-			self.images = []
-			
-	def AddEntity(self, entitie):
-		self.entities.append(entitie)
-		
-	def ClearEntities(self):
-		for entity in self.entities:
-			entity.Kill()
-	
-		self.entities = []
-		
-######## WORLD OBJECTS ########
-
-# All world objects must have an Update(canvas, scale, x_offset, y_offset) method
-
-class ObjectText():
-	def __init__(self, x, y, text, font, size, colour, anchor):
-		self.x = x				# X location of the text (centre)
-		self.y = y				# Y location of the text (centre)
-		self.text = text		# The text to render
-		self.font = font		# The font family e.g. "Times"
-		self.size = size		# Font size
-		self.colour = colour	# The text colour
-		self.anchor = anchor	# The anchor of the text e.g. tkinter.NW or tkinter.CENTER
-	
-	def Update(self, canvas, scale, x_offset, y_offset):
-		canvas.create_text(
-			x_offset + (self.x * scale),
-			y_offset + (self.y * scale),
-			text = self.text,
-			font = (self.font, int(self.size * scale)),
-			fill = self.colour,
-			anchor = self.anchor
-		)
-
-class Man():
-	ANIMATION_TIME = 0.2
-	WALK_SPEED = 4.0
-	
-	MOVE_UP = [38, 87]
-	MOVE_DOWN = [40, 84]
-	MOVE_LEFT = [37, 65]
-	MOVE_RIGHT = [39, 68]
-	
-	COLIDE_RADIUS = 1.1
-
-	def __init__(self, x, y, size):
-		self.x = x			# X location of the man
-		self.y = y			# Y location of the man
-		
-		self.size = size	# Relative size of the man (the width) The height is twice the width
-		
-		self.dir = False		# The direction the man is facing (True = Right)
-		self.animation = False	# The current animation stage
-		self.last_animation = 0	# The last time.time() the animation was flipped
-		
-		# Velocity and direction the man is travailing in
-		self.velocity = 0.0		# Size units per second
-		self.direction = 0.0	# Radians, up = right, going clockwise
-		
-		self.last_update = 0	# The last time the man was updated
-		
-		# Store the states of the controls (0, 1 or -1)
-		self.xc = 0
-		self.yc = 0
-		
-		# Store the key status
-		self.up = False
-		self.down = False
-		self.left = False
-		self.right = False
-		
-	def BindToControls(self, display):
-		self.display = display
-		display.AddKeyListener(self._KeyEvent)
-		
-	def Kill(self):
-		self.display.RemoveKeyListener(self._KeyEvent)
-		
-	def _KeyEvent(self, event):
-		if str(event.type) == "KeyPress":
-			if event.keycode in Man.MOVE_LEFT:
-				self.left = True
-				self.xc = -1
-				
-			elif event.keycode in Man.MOVE_RIGHT:
-				self.right = True
-				self.xc = 1
-				
-			if event.keycode in Man.MOVE_UP:
-				self.up = True
-				self.yc = -1
-				
-			elif event.keycode in Man.MOVE_DOWN:
-				self.down = True
-				self.yc = 1
-				
-		elif str(event.type) == "KeyRelease":
-			if event.keycode in Man.MOVE_LEFT:
-				self.left = False
-				self.xc = 0
-				
-				if self.right:
-					self.xc = 1
-				
-			elif event.keycode in Man.MOVE_RIGHT:
-				self.right = False
-				self.xc = 0
-				
-				if self.left:
-					self.xc = -1
-				
-			if event.keycode in Man.MOVE_UP:
-				self.up = False
-				self.yc = 0
-				
-				if self.down:
-					self.yc = 1
-				
-			elif event.keycode in Man.MOVE_DOWN:
-				self.down = False
-				self.yc = 0
-				
-				if self.up:
-					self.yc = -1
-			
-		if self.xc != 0 or self.yc != 0:
-			self.velocity = Man.WALK_SPEED
-			
-		else:
-			self.velocity = 0
-			
-		if self.xc > 0:
-			self.dir = True
-			
-		elif self.xc < 0:
-			self.dir = False
-			
-		self.direction = math.atan2(self.yc, self.xc)
-		
-	def Update(self, canvas, scale, x_offset, y_offset, world):
-		# Change the animation stage if needed
-		time_now = time.time()
-		ani_time_passed = time_now - self.last_animation
-		
-		if ani_time_passed >= Man.ANIMATION_TIME:
-			self.last_animation = time_now
-			self.animation = not self.animation
-		
-		# Update movement
-		if self.last_update == 0:
-			self.last_update = time_now
-			
-		up_time_passed = time_now - self.last_update
-		self.last_update = time_now
-		
-		self.x += math.cos(self.direction) * (self.velocity * up_time_passed)
-		self.y += math.sin(self.direction) * (self.velocity * up_time_passed)
-		
-		# Collide with walls
-		for wall in world.walls:
-			# Find the distance and angle the man is relative to the first wall point (wall[0] and wall[1])
-			wall_length = math.sqrt(math.pow(wall[3] - wall[1], 2) + math.pow(wall[2] - wall[0], 2))
-			wall_theta = math.atan2(wall[3] - wall[1], wall[2] - wall[0])
-			man_theta = math.atan2(self.y - wall[1], self.x - wall[0])
-			relative_theta = man_theta - wall_theta
-			man_distance = math.sqrt(math.pow(self.y - wall[1], 2) + math.pow(self.x - wall[0], 2))
-			
-			# Check if the man is facing the wall (find the adjacent length)
-			distance_along = math.cos(relative_theta) * man_distance
-			
-			if distance_along < 0:	# The man is past point 1 (wall[0] and wall[1])
-				# Check if the man is too close
-				if abs(man_distance) < Man.COLIDE_RADIUS * self.size:	# Too close to the wall
-					# Move the man out
-					self.x = wall[0] + (math.cos(man_theta) * Man.COLIDE_RADIUS * self.size)
-					self.y = wall[1] + (math.sin(man_theta) * Man.COLIDE_RADIUS * self.size)
-					
-			elif distance_along > wall_length:	# Do the same as above but with the second wall node
-				man_distance2 = math.sqrt(math.pow(self.y - wall[3], 2) + math.pow(self.x - wall[2], 2))
-				man_theta2 = math.atan2(self.y - wall[3], self.x - wall[2])
-				
-				if abs(man_distance2) < Man.COLIDE_RADIUS * self.size:	# Too close to the wall
-					# Move the man out
-					self.x = wall[2] + (math.cos(man_theta2) * Man.COLIDE_RADIUS * self.size)
-					self.y = wall[3] + (math.sin(man_theta2) * Man.COLIDE_RADIUS * self.size)
-					
-			else:	
-				# Check collisions with the whole wall
-				distance_from_wall = math.sin(relative_theta) * man_distance
-				
-				if abs(distance_from_wall) < Man.COLIDE_RADIUS * self.size:	# Too close to the wall
-					# Move the man
-					d = 1.0
-					
-					if distance_from_wall < 0:
-						d = -1.0
-					
-					new_theta = math.atan2(Man.COLIDE_RADIUS * self.size * d, distance_along)
-					new_distance = math.sqrt(math.pow(Man.COLIDE_RADIUS * self.size, 2) + math.pow(distance_along, 2))
-					
-					self.x = wall[0] + (math.cos(new_theta + wall_theta) * new_distance)
-					self.y = wall[1] + (math.sin(new_theta + wall_theta) * new_distance)
-					
-		# Check for matching points
-		for point, callback in world.point_listeners:
-			distance = math.sqrt(math.pow(point[0] - self.x, 2) + math.pow(point[1] - self.y, 2))
-			
-			if distance <= World.POINT_DISTANCE:	# Man is in the point!
-				callback(self)
-	
-		# Render the main body (no animation)
-		canvas.create_line(		# Head
-			x_offset + (self.x * scale),
-			y_offset + ((self.y - (self.size)) * scale),
-			x_offset + (self.x * scale),
-			y_offset + ((self.y - (self.size * 0.7)) * scale),
-			width = (self.size * 0.2) * scale
-		)
-		
-		canvas.create_line(		# Body
-			x_offset + (self.x * scale),
-			y_offset + ((self.y - (self.size * 0.6)) * scale),
-			x_offset + (self.x * scale),
-			y_offset + ((self.y + (self.size * 0.6)) * scale),
-			width = (self.size * 0.2) * scale
-		)
-		
-		# Render the arms and legs
-		dir = [-1.0, 1.0][self.dir]
-		
-		if self.animation:
-			canvas.create_line(		# Back leg
-				x_offset + ((self.x - (self.size * 0.2 * dir)) * scale),
-				y_offset + ((self.y + (self.size * 0.55)) * scale),
-				x_offset + ((self.x - (self.size * 0.3 * dir)) * scale),
-				y_offset + ((self.y + self.size) * scale),
-				width = (self.size * 0.2) * scale
-			)
-			
-			canvas.create_line(		# Front leg
-				x_offset + ((self.x + (self.size * 0.1 * dir)) * scale),
-				y_offset + ((self.y + (self.size * 0.5)) * scale),
-				x_offset + ((self.x + (self.size * 0.3 * dir)) * scale),
-				y_offset + ((self.y + self.size) * scale),
-				width = (self.size * 0.2) * scale
-			)
-			
-			canvas.create_line(		# Upper arm 1
-				x_offset + (self.x * scale),
-				y_offset + ((self.y - (self.size * 0.52)) * scale),
-				x_offset + ((self.x + (self.size * 0.45 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.55)) * scale),
-				width = (self.size * 0.18) * scale
-			)
-			
-			canvas.create_line(		# Upper arm 2
-				x_offset + ((self.x + (self.size * 0.3 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.45)) * scale),
-				x_offset + ((self.x + (self.size * 0.6 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.45)) * scale),
-				width = (self.size * 0.16) * scale
-			)
-			
-			canvas.create_line(		# Lower arm 1
-				x_offset + (self.x * scale),
-				y_offset + ((self.y - (self.size * 0.25)) * scale),
-				x_offset + ((self.x + (self.size * 0.35 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.25)) * scale),
-				width = (self.size * 0.16) * scale
-			)
-			
-			canvas.create_line(		# Lower arm 2
-				x_offset + ((self.x + (self.size * 0.3 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.15)) * scale),
-				x_offset + ((self.x + (self.size * 0.55 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.15)) * scale),
-				width = (self.size * 0.16) * scale
-			)
-			
-		else:
-			canvas.create_line(		# Back leg
-				x_offset + ((self.x - (self.size * 0.2 * dir)) * scale),
-				y_offset + ((self.y + (self.size * 0.5)) * scale),
-				x_offset + ((self.x - (self.size * 0.2 * dir)) * scale),
-				y_offset + ((self.y + self.size) * scale),
-				width = (self.size * 0.2) * scale
-			)
-			
-			canvas.create_line(		# Front leg
-				x_offset + ((self.x + (self.size * 0.2 * dir)) * scale),
-				y_offset + ((self.y + (self.size * 0.4)) * scale),
-				x_offset + ((self.x + (self.size * 0.2 * dir)) * scale),
-				y_offset + ((self.y + self.size) * scale),
-				width = (self.size * 0.2) * scale
-			)
-			
-			canvas.create_line(		# Upper arm 1
-				x_offset + (self.x * scale),
-				y_offset + ((self.y - (self.size * 0.5)) * scale),
-				x_offset + ((self.x + (self.size * 0.45 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.5)) * scale),
-				width = (self.size * 0.2) * scale
-			)
-			
-			canvas.create_line(		# Upper arm 2
-				x_offset + ((self.x + (self.size * 0.3 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.4)) * scale),
-				x_offset + ((self.x + (self.size * 0.6 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.4)) * scale),
-				width = (self.size * 0.16) * scale
-			)
-			
-			canvas.create_line(		# Lower arm 1
-				x_offset + (self.x * scale),
-				y_offset + ((self.y - (self.size * 0.2)) * scale),
-				x_offset + ((self.x + (self.size * 0.35 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.2)) * scale),
-				width = (self.size * 0.16) * scale
-			)
-			
-			canvas.create_line(		# Lower arm 2
-				x_offset + ((self.x + (self.size * 0.3 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.1)) * scale),
-				x_offset + ((self.x + (self.size * 0.55 * dir)) * scale),
-				y_offset + ((self.y - (self.size * 0.1)) * scale),
-				width = (self.size * 0.16) * scale
-			)
-			
-		# Draw a circle to show the COLIDE_RADIUS
-		#canvas.create_oval(
-		#	x_offset + ((self.x - (self.size * Man.COLIDE_RADIUS))  * scale),
-		#	y_offset + ((self.y - (self.size * Man.COLIDE_RADIUS))  * scale),
-		#	x_offset + ((self.x + (self.size * Man.COLIDE_RADIUS)) * scale),
-		#	y_offset + ((self.y + (self.size * Man.COLIDE_RADIUS)) * scale)
-		#)
-		
\ No newline at end of file
+# Title:	World module for Zombie (draws the maze and men)
+# Author:	Nicholas Wright
+# Info:		To be used with Zombie.py
+# Version:	v0.0
+
+# The World, all sizes are relative to smallest dimension (width or height)
+
+import collections
+import time
+import math
+
+import Camera
+import Chunks
+import Entities
+import Geometry
+import Navigation
+import Physics
+import Profiler
+import Rays
+import Triggers
+
+class World():
+	WALL_WIDTH = 0.35			# Width of the wall relative to one size unit
+	WALL_EXTENSION_WIDTH = 0.2	# With of the wall extension
+	
+	WALL_SET_BACK = -0.1		# How much the wall is set back from the end of it (relative to one size unit)
+	WALL_EXTENSION = 0.15		# How much the wall sticks out at the ends (relative to one size unit)
+	
+	WALL_COLOUR = "#000000"
+	BACKGROUND_COLOUR = "#555555"
+	
+	POINT_DISTANCE = 0.5		# The distance from the point a player needs to be to trigger it
+	
+	IMAGE_PIXEL_SIZE = 12.0 / 700	# Size of one image pixel relative to one size unit (images in a 12 unit world are their own size in the smallest window)
+	
+	STEP_TIME = 1.0 / 120		# Time simulated by one step (seconds), the simulation runs at a fixed rate whatever the frame rate
+	MAX_STEPS = 12				# Most steps run by one Tick, any more time than this is dropped so the game slows rather than locking up
+	
+	DAMAGE_CELL_SIZE = 2.0		# Size of the cells changes are tracked in (relative to one size unit)
+	MAX_DAMAGE_CELLS = 256		# Most damaged cells tracked for a scene, any more and the whole scene is redrawn
+
+	def __init__(self, zombie, clock = time.time, profiler = None, key_input = None):
+		self.z = zombie
+		self.clock = clock		# Returns the time in seconds, e.g. time.time or a Headless.VirtualClock
+		self.profiler = profiler if profiler != None else Profiler.Profiler()	# Times each phase of the update
+		self.input = key_input		# The Input.Input dispatched at the start of every step (None for no input)
+		
+		self.SetSize(1, 1)
+	
+		self.background_colour = World.BACKGROUND_COLOUR	# Background colour of the world
+	
+		self.walls = []			# Walls in the world, a list of (x1, y1, x2, y2) for lines (None where a wall has been removed)
+		self.wall_index = Geometry.WallIndex(self.walls)	# Grid of the walls and their geometry, built by SetWorld
+		self.walls_shared = False	# If the walls and their index came with the world data (see Prepare), they are copied before they are changed
+		self.objects = []		# Objects
+		self.entities = []		# Entities (players)
+		self.pool = Entities.EntityPool()	# State of the entities, they are moved into it when added
+		self.slots = []						# Slot of each entity in the pool (in the same order as entities)
+		self.images = []		# Images
+		
+		self.physics = Physics.Physics()	# Moves the entities and collides them with the walls
+		self.rays = Rays.RayCaster()		# Casts many lines through the walls at once
+		self.last_update = 0				# The last clock() time the world was ticked
+		self.time_lag = 0.0					# Time passed which has not been simulated yet (less than one step after a Tick)
+		self.steps = 0						# Steps simulated so far, input is dispatched at the start of step number steps
+		self.deferred = collections.deque()	# Functions to call once the current step is over, see Defer
+		
+		self.version = 0		# Incremented whenever the static parts of the world (background, walls, objects and images) change
+		
+		self.damaged = True		# If anything has changed since the last frame was drawn
+		self.moving = set()		# Cells of the entities which moved in the last step, they are drawn in a new place every frame until the next
+		self.damage = {}		# Sets of the cells changed since each scene last drew, indexed by the scene (None to redraw everything)
+		
+		self.triggers = Triggers.TriggerSystem()	# Zones in the world which entities set off (see Triggers.py)
+		
+		self.camera = Camera.Camera()	# The part of the world shown, follows an entity when told to
+		
+		self.chunks = None		# The Chunks.ChunkLoader streaming walls around the camera (None if the world is not chunked)
+		
+		self.nav = None			# The Navigation.NavGrid of the world, built when the first flow field is asked for (None until then, and for chunked or very large worlds)
+		self.flow_fields = {}	# The Navigation.FlowField leading to each entity being followed, indexed by the entity
+		self.threaded = True	# If chunks are loaded on a background thread, otherwise they are loaded as soon as they are needed
+		self.views = {}					# The (scale, x offset, y offset) each scene was last drawn with, indexed by the scene
+		self.window = None				# The (width, height) of the window last drawn in (None until the first draw)
+		self.preloading = None			# The world data whose images are being got ready (see Preload), they are got ready again if the window size changes
+		
+	def AddTrigger(self, trigger):
+		return self.triggers.Add(trigger)
+		
+	def RemoveTrigger(self, trigger):
+		self.triggers.Remove(trigger)
+		
+	def AddPointListener(self, point, callback):	# Call callback(man) once when a man moves to within POINT_DISTANCE of the point
+		return self.AddTrigger(Triggers.Trigger(point[0], point[1], World.POINT_DISTANCE, on_enter = callback))
+		
+	def ClearPointListeners(self):					# Remove every trigger
+		self.triggers.Clear()
+		
+	def Damage(self, bounds = None, moving = False):	# Mark the part of the world inside bounds (x1, y1, x2, y2) as changed, or all of it if None.
+														# moving is True if it keeps changing every frame until the next step (an entity drawn between two steps)
+		self.damaged = True
+		
+		if bounds is None:
+			for scene in self.damage:
+				self.damage[scene] = None
+				
+			return
+			
+		cells = World._Cells(bounds)
+		
+		if moving:
+			self.moving.update(cells)
+			
+		for scene, damaged in self.damage.items():
+			if damaged is None:
+				continue
+				
+			damaged.update(cells)
+			
+			if len(damaged) > World.MAX_DAMAGE_CELLS:
+				self.damage[scene] = None
+				
+	def IsDamaged(self):			# If the next frame needs drawing, False when it would look the same as the last one
+		return self.damaged or len(self.moving) > 0
+		
+	@staticmethod
+	def _Cells(bounds):				# The damage cells bounds (x1, y1, x2, y2) touch
+		cx1 = int(math.floor(bounds[0] / World.DAMAGE_CELL_SIZE))
+		cy1 = int(math.floor(bounds[1] / World.DAMAGE_CELL_SIZE))
+		cx2 = int(math.floor(bounds[2] / World.DAMAGE_CELL_SIZE))
+		cy2 = int(math.floor(bounds[3] / World.DAMAGE_CELL_SIZE))
+		
+		return [(cx, cy) for cx in range(cx1, cx2 + 1) for cy in range(cy1, cy2 + 1)]
+		
+	def _Touches(self, cells, bounds):	# If bounds (x1, y1, x2, y2) touch any of the damaged or moving cells
+		for cell in World._Cells(bounds):
+			if cell in cells or cell in self.moving:
+				return True
+				
+		return False
+		
+	def SetSize(self, width, height):
+		self.width = width
+		self.height = height
+		
+		# Define the relative size
+		self.size = height
+		
+		if width < height:
+			self.size = height
+		
+	def Update(self, scene, width, height):
+		# Draw the entities part way between their last two steps so movement is smooth at any frame rate
+		alpha = self.time_lag / World.STEP_TIME
+		
+		if self.window != (width, height):
+			self.window = (width, height)
+			
+			if self.preloading != None:		# The images will be drawn at another size
+				self.Preload(self.preloading)
+				
+		# Find where the camera is looking and the part of the world in the window
+		scale, mx, my = self.camera.View(self, width, height, alpha)
+		view = (-mx / scale, -my / scale, (width - mx) / scale, (height - my) / scale)
+		
+		# The static layers are drawn around the view (with a margin) and only when the world, the window size or the zoom
+		# changes or the camera leaves the margin. Otherwise they are moved to follow the camera
+		stamp = scene.Stamp("static")
+		
+		if stamp is None or stamp[:4] != (self.version, width, height, scale) or not World._Inside(view, stamp[4]):
+			margin_x = (view[2] - view[0]) * Camera.Camera.MARGIN
+			margin_y = (view[3] - view[1]) * Camera.Camera.MARGIN
+			
+			region = (view[0] - margin_x, view[1] - margin_y, view[2] + margin_x, view[3] + margin_y)
+			stamp = (self.version, width, height, scale, region, mx, my)
+			
+		region = stamp[4]
+		offset = (mx - stamp[5], my - stamp[6])
+		
+		profiler = self.profiler
+		
+		# Only the entities in the cells changed since this scene was last drawn need drawing, the scenes are
+		# drawn in turn (one for each buffer) so each keeps its own damage. If the camera has moved everything is redrawn
+		cells = self.damage.get(scene)
+		
+		if self.views.get(scene) != (scale, mx, my):
+			cells = None
+			self.views[scene] = (scale, mx, my)
+		
+		# Update everything
+		if scene.Layer("background", (self.version, width, height)):
+			scene.Rectangle(("background",), (0, 0, width, height), fill = self.background_colour)
+			
+		if scene.Layer("static", stamp, offset):
+			profiler.Begin("walls")
+			self._DrawWalls(scene, scale, mx, my, self.wall_index.Query(region[0], region[1], region[2], region[3], False))
+			profiler.End("walls")
+			
+			profiler.Begin("objects")
+			
+			for o in self.objects:
+				if World._Overlaps(o.Bounds(), region):
+					o.Update(scene, scale, mx, my)
+				
+			profiler.End("objects")
+			
+		scene.Layer("entities")
+		
+		profiler.Begin("entity draw")
+		
+		values = Entities.Snapshot(self.pool)
+		clock = profiler.clock
+		
+		for entity in self.entities:
+			bounds = entity.Bounds(values)
+			
+			if not World._Overlaps(bounds, view):		# Off screen
+				continue
+				
+			if cells is not None and not self._Touches(cells, bounds) and scene.Keep((entity,)):
+				continue
+				
+			start = clock()
+			entity.Update(scene, scale, mx, my, alpha, values)
+			profiler.Slowest("entity draw", clock() - start)
+			
+		profiler.End("entity draw")
+		
+		self.damage[scene] = set()
+		self.damaged = False
+			
+		if scene.Layer("images", stamp, offset):
+			profiler.Begin("images")
+			
+			for i, image in enumerate(self.images):
+				size = image[2]
+				
+				if World._Overlaps((image[0] - size, image[1] - size, image[0] + size, image[1] + size), region):
+					self._DrawImage(scene, scale, mx, my, i, image)
+				
+			profiler.End("images")
+			
+	@staticmethod
+	def _Overlaps(a, b):			# If two rectangles (x1, y1, x2, y2) overlap
+		return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+		
+	@staticmethod
+	def _Inside(a, b):				# If rectangle a is inside rectangle b
+		return a[0] >= b[0] and a[1] >= b[1] and a[2] <= b[2] and a[3] <= b[3]
+		
+	def Tick(self):					# Run as many simulation steps as the time passed since the last Tick needs
+		time_now = self.clock()
+		
+		if self.last_update == 0:
+			self.last_update = time_now
+			
+		self.time_lag += time_now - self.last_update
+		self.last_update = time_now
+		
+		steps = 0
+		
+		while self.time_lag >= World.STEP_TIME:
+			if steps == World.MAX_STEPS:	# Too far behind to catch up, drop the rest
+				self.time_lag = 0.0
+				break
+				
+			self.Step(World.STEP_TIME)
+			self.time_lag -= World.STEP_TIME
+			steps += 1
+			
+		# Stream the chunks around where the camera is looking
+		if self.chunks != None:
+			self.profiler.Begin("chunks")
+			
+			target = self.camera.target
+			
+			if target != None:
+				self.chunks.Update(target.x, target.y)
+				
+			else:
+				self.chunks.Update(self.width / 2.0, self.height / 2.0)
+				
+			self.profiler.End("chunks")
+			
+	def Step(self, time_passed):	# Simulate the world for one step
+		# Handle the input which has come in since the last step
+		if self.input != None:
+			self.input.Dispatch()
+			
+		self.moving = set()
+		
+		# Move the flow fields to where the entities they lead to are, they are only searched again when they change cells
+		self.profiler.Begin("navigation")
+		
+		for target, field in self.flow_fields.items():
+			field.Update(target.x, target.y)
+			
+		self.profiler.End("navigation")
+		
+		# Move all the entities and collide them with the walls
+		self.profiler.Begin("physics")
+		self.physics.Step(self.pool, self.slots, self.wall_index, time_passed)
+		self.profiler.End("physics")
+		
+		# The entities read the pool from a snapshot taken after it has been moved, they only write to their own slots
+		values = Entities.Snapshot(self.pool)
+		
+		profiler = self.profiler
+		clock = profiler.clock
+		
+		profiler.Begin("entity update")
+		
+		for entity in self.entities:
+			start = clock()
+			entity.Step(time_passed, self, values)
+			profiler.Slowest("entity update", clock() - start)
+			
+		profiler.End("entity update")
+			
+		# Raise the trigger events for the entities which have moved in or out of them
+		self.profiler.Begin("triggers")
+		self.triggers.Update(self.entities, [values.x[slot] for slot in self.slots], [values.y[slot] for slot in self.slots])
+		self.profiler.End("triggers")
+		
+		self.steps += 1
+		
+		# Make the changes put off until the step was over
+		while len(self.deferred) > 0:
+			self.deferred.popleft()()
+			
+	def Defer(self, function):		# Call function() once the current step is over, e.g. to change the world from a trigger while the entities are being stepped
+		self.deferred.append(function)
+			
+	def _DrawImage(self, scene, scale, mx, my, i, image):
+		# Scale the image with the world, the images module keeps the scaled copies
+		image_object = self.z.images.GetScaledImage(image[3], scale * World.IMAGE_PIXEL_SIZE)
+		
+		scene.Image(
+			("image", i),
+			(mx + (image[0] * scale), my + (image[1] * scale)),
+			image = image_object
+		)
+	
+	def _DrawWalls(self, scene, scale, mx, my, indexes):
+		# Draw the walls with the given indexes
+		set_back = World.WALL_SET_BACK * scale
+		extension = World.WALL_EXTENSION * scale
+		
+		# The outline is half the width either side of the wall
+		half_width = World.WALL_WIDTH * scale / 2.0
+		half_extension_width = World.WALL_EXTENSION_WIDTH * scale / 2.0
+		
+		walls = self.walls
+		
+		for i in indexes:
+			wall = walls[i]
+			x1 = mx + (wall[0] * scale)
+			y1 = my + (wall[1] * scale)
+			x2 = mx + (wall[2] * scale)
+			y2 = my + (wall[3] * scale)
+			
+			# Define wall end extensions
+			x1b = x1
+			y1b = y1
+			
+			x2b = x2
+			y2b = y2
+			
+			if x1 < x2:
+				x1 += set_back
+				x2 -= set_back
+				
+				x1b -= extension
+				x2b += extension
+				
+			if x1 > x2:
+				x1 -= set_back
+				x2 += set_back
+				
+				x1b += extension
+				x2b -= extension
+			
+			if y1 < y2:
+				y1 += set_back
+				y2 -= set_back
+				
+				y1b -= extension
+				y2b += extension
+				
+			if y1 > y2:
+				y1 -= set_back
+				y2 += set_back
+				
+				y1b += extension
+				y2b -= extension
+			
+			# Outline the wall and its end extensions as one shape, the wall runs from point 1 to point 2 and the
+			# extensions from there to point 1b and 2b
+			length = math.sqrt(math.pow(x2 - x1, 2) + math.pow(y2 - y1, 2))
+			
+			if length > 0:
+				nx = (y1 - y2) / length
+				ny = (x2 - x1) / length
+				
+			else:
+				nx = 0.0
+				ny = 1.0
+				
+			wx = nx * half_width
+			wy = ny * half_width
+			ex = nx * half_extension_width
+			ey = ny * half_extension_width
+			
+			scene.Polygon(
+				("wall", i),
+				(
+					x1b + ex, y1b + ey, x1 + ex, y1 + ey, x1 + wx, y1 + wy, x2 + wx, y2 + wy, x2 + ex, y2 + ey, x2b + ex, y2b + ey,
+					x2b - ex, y2b - ey, x2 - ex, y2 - ey, x2 - wx, y2 - wy, x1 - wx, y1 - wy, x1 - ex, y1 - ey, x1b - ex, y1b - ey
+				),
+				
+				fill = World.WALL_COLOUR
+			)
+			
+	def SetWorld(self, world_data):	# Set the world from a dict, walls may be streamed in from a chunk source given as "Chunks" (see Chunks.py)
+		self.version += 1
+		self.Damage()
+		self.preloading = None
+		
+		if self.chunks != None:
+			self.chunks.Close()
+			self.chunks = None
+			
+		self.SetSize(world_data["Width"], world_data["Height"])
+		
+		if "Background" in world_data:
+			self.background_colour = world_data["Background"]
+			
+		else:
+			self.background_colour = World.BACKGROUND_COLOUR
+		
+		if "WallIndex" in world_data:	# Prepared (see Prepare) or read from a level file (see Level.py), there is nothing to build
+			self.walls = world_data["Walls"]
+			self.wall_index = world_data["WallIndex"]
+			self.walls_shared = True
+			
+		else:
+			self.walls_shared = False
+			
+			if "Walls" in world_data:
+				self.walls = list(world_data["Walls"])
+				
+			else:
+				self.walls = []
+				
+			self.wall_index = Geometry.WallIndex(self.walls)
+		
+		if "Chunks" in world_data:
+			self.chunks = Chunks.ChunkLoader(world_data["Chunks"], self, self.threaded)
+			
+		# A grid worked out before (see Prepare and Level.py) is used as it is, otherwise it is only built if a flow field is asked for
+		self.nav = world_data.get("NavGrid")
+		self.flow_fields = {}
+		
+		if "Objects" in world_data:
+			self.objects = world_data["Objects"]
+			
+		else:
+			self.objects = []
+			
+		if "Images" in world_data:
+			self.images = world_data["Images"]
+			
+		else:
+			self.images = []
+			
+		self.camera.zoom = world_data.get("Zoom", 1.0)
+			
+	def AddWalls(self, walls):		# Add walls (x1, y1, x2, y2) to the world, returns their indexes
+		self._Unshare()
+		
+		indexes = []
+		
+		for wall in walls:
+			index = self.wall_index.Add(wall)
+			
+			if index == len(self.walls):
+				self.walls.append(wall)
+				
+			else:
+				self.walls[index] = wall
+				
+			indexes.append(index)
+			
+		self.version += 1
+		self.damaged = True
+		
+		return indexes
+		
+	def RemoveWalls(self, indexes):
+		self._Unshare()
+		
+		for index in indexes:
+			self.wall_index.Remove(index)
+			self.walls[index] = None
+			
+		self.version += 1
+		self.damaged = True
+		
+	def _Unshare(self):				# The walls of the world data may be used again (and can't be changed if read from a level file), copy them into a list and index them first
+		if self.walls_shared:
+			self.walls = list(self.walls)
+			self.wall_index = Geometry.WallIndex(self.walls)
+			self.walls_shared = False
+			
+	@staticmethod
+	def Prepare(world_data):		# A copy of a world with its wall index and navigation grid made, so SetWorld has nothing to build. It does not touch any World, so it can be run on another thread
+		if "WallIndex" in world_data or "Chunks" in world_data:
+			return world_data
+			
+		prepared = dict(world_data)
+		prepared["Walls"] = list(world_data.get("Walls", []))
+		prepared["WallIndex"] = Geometry.WallIndex(prepared["Walls"])
+		
+		if Navigation.NavGrid.Fits(world_data["Width"], world_data["Height"]):
+			prepared["NavGrid"] = Navigation.NavGrid(world_data["Width"], world_data["Height"], prepared["WallIndex"])
+			
+		return prepared
+		
+	def Preload(self, world_data):	# Get the images of a world ready to be drawn at the size of the window now (see Images.Preload)
+		self.preloading = world_data
+		
+		for image in world_data.get("Images", []):
+			zoom = None
+			
+			if self.window != None:
+				zoom = Camera.Camera.Scale(world_data["Width"], world_data["Height"], self.window[0], self.window[1], world_data.get("Zoom", 1.0)) * World.IMAGE_PIXEL_SIZE
+				
+			self.z.images.Preload(image[3], zoom)
+			
+	def Raycast(self, x1, y1, x2, y2):	# The first wall on the line from (x1, y1) to (x2, y2) as (t, wall index), t is 0 at the start and 1 at the end. None if there is no wall in the way
+		return self.wall_index.Raycast(x1, y1, x2, y2)
+		
+	def RaycastMany(self, lines):		# Raycast a list of lines (x1, y1, x2, y2) at once
+		return self.rays.Cast(
+			self.wall_index,
+			[line[0] for line in lines],
+			[line[1] for line in lines],
+			[line[2] for line in lines],
+			[line[3] for line in lines]
+		)
+		
+	def CanSee(self, viewers, target):	# If there is no wall between each of a list of entities and the target entity
+		x = target.x
+		y = target.y
+		
+		return self.rays.Visible(self.wall_index, [viewer.x for viewer in viewers], [viewer.y for viewer in viewers], [x] * len(viewers), [y] * len(viewers))
+		
+	def FlowField(self, target):	# The Navigation.FlowField leading to an entity (None if the world has no grid), it is kept up to date every step
+		field = self.flow_fields.get(target)
+		
+		# The walls of a chunked world are not all there, so it is not given a grid
+		if field == None and self.nav == None and self.chunks == None and Navigation.NavGrid.Fits(self.width, self.height):
+			self.nav = Navigation.NavGrid(self.width, self.height, self.wall_index)
+			
+		if field == None and self.nav != None:
+			field = Navigation.FlowField(self.nav)
+			field.Update(target.x, target.y)
+			self.flow_fields[target] = field
+			
+		return field
+		
+	def AddEntity(self, entitie):
+		entitie.SetPool(self.pool)
+		
+		self.entities.append(entitie)
+		self.slots.append(entitie.slot)
+		
+		self.Damage(entitie.Bounds())
+		
+	def RemoveEntity(self, entity):
+		index = self.entities.index(entity)
+		
+		self.Damage(entity.Bounds())
+		
+		del self.entities[index]
+		del self.slots[index]
+		
+		if self.camera.target is entity:
+			self.camera.target = None
+			
+		self.flow_fields.pop(entity, None)
+		entity.Kill()
+		
+	def ClearEntities(self):
+		for entity in self.entities:
+			self.Damage(entity.Bounds())
+			entity.Kill()
+	
+		self.entities = []
+		self.slots = []
+		
+		self.camera.target = None
+		self.flow_fields = {}
+		
+######## WORLD OBJECTS ########
+
+# All entities must have a Step(time_passed, world, values) method which runs their logic and an Update(scene, scale, x_offset, y_offset, alpha, values) method
+# which draws them between their last position (last_x, last_y) and their current one (x, y), drawing to the scene with (self,) as the key.
+# They must have a Bounds(values) method giving (x1, y1, x2, y2) around everything they draw between the two positions, and must call
+# world.Damage(bounds, moving) in Step whenever they change how they look, otherwise they are not redrawn.
+# values is an Entities.Snapshot of the pool to read the fields from (None to read the pool itself)
+# Their state lives in a slot of an Entities.EntityPool: they must have pool and slot attributes, a SetPool(pool) method which
+# moves them into another pool and a Kill() method which frees their slot
+
+# All world objects must have an Update(scene, scale, x_offset, y_offset) method, drawing to the Scene.Scene with themselves as part of the key,
+# and a Bounds() method giving (x1, y1, x2, y2) around what they draw so they are only drawn near the camera
+
+class ObjectText():
+	def __init__(self, x, y, text, font, size, colour, anchor):
+		self.x = x				# X location of the text (centre)
+		self.y = y				# Y location of the text (centre)
+		self.text = text		# The text to render
+		self.font = font		# The font family e.g. "Times"
+		self.size = size		# Font size
+		self.colour = colour	# The text colour
+		self.anchor = anchor	# The anchor of the text e.g. tkinter.NW or tkinter.CENTER
+	
+	def Bounds(self):		# Roughly, the text is about as tall as its size and each character at most as wide
+		width = len(self.text) * self.size
+		
+		return (self.x - width, self.y - self.size, self.x + width, self.y + self.size)
+		
+	def Update(self, scene, scale, x_offset, y_offset):
+		scene.Text(
+			(self,),
+			(x_offset + (self.x * scale), y_offset + (self.y * scale)),
+			text = self.text,
+			font = (self.font, int(self.size * scale)),
+			fill = self.colour,
+			anchor = self.anchor
+		)
+
+class Man():
+	ANIMATION_TIME = 0.2
+	WALK_SPEED = 4.0
+	
+	MOVE_UP = [38, 87]
+	MOVE_DOWN = [40, 84]
+	MOVE_LEFT = [37, 65]
+	MOVE_RIGHT = [39, 68]
+	
+	ACTIONS = ("left", "right", "up", "down")	# The actions the man listens to when bound to the controls
+	
+	COLIDE_RADIUS = 1.1
+	
+	# The lines of the stick figure for each animation stage, (x1, y1, x2, y2, width) relative to the size of the man.
+	# The x values are for facing right, they are flipped when facing left
+	BODY = (
+		(0.0, -1.0, 0.0, -0.7, 0.2),		# Head
+		(0.0, -0.6, 0.0, 0.6, 0.2),			# Body
+	)
+	
+	POSES = {
+		True : BODY + (
+			(-0.2, 0.55, -0.3, 1.0, 0.2),		# Back leg
+			(0.1, 0.5, 0.3, 1.0, 0.2),			# Front leg
+			(0.0, -0.52, 0.45, -0.55, 0.18),	# Upper arm 1
+			(0.3, -0.45, 0.6, -0.45, 0.16),		# Upper arm 2
+			(0.0, -0.25, 0.35, -0.25, 0.16),	# Lower arm 1
+			(0.3, -0.15, 0.55, -0.15, 0.16),	# Lower arm 2
+		),
+		
+		False : BODY + (
+			(-0.2, 0.5, -0.2, 1.0, 0.2),		# Back leg
+			(0.2, 0.4, 0.2, 1.0, 0.2),			# Front leg
+			(0.0, -0.5, 0.45, -0.5, 0.2),		# Upper arm 1
+			(0.3, -0.4, 0.6, -0.4, 0.16),		# Upper arm 2
+			(0.0, -0.2, 0.35, -0.2, 0.16),		# Lower arm 1
+			(0.3, -0.1, 0.55, -0.1, 0.16),		# Lower arm 2
+		),
+	}
+	
+	POSE_CACHE_SIZE = 64	# Most pose templates kept (they are made for each size and scale)
+	pose_cache = {}			# Pose templates indexed by (size, scale, animation, dir)
+	
+	# Only these attributes are stored on the man, everything else is in its slot of the pool
+	__slots__ = ("pool", "slot", "xc", "yc", "up", "down", "left", "right", "input", "turned", "moved")
+	
+	# Fields of the man's slot in its pool
+	x = Entities.Field("x")							# X location of the man
+	y = Entities.Field("y")							# Y location of the man
+	last_x = Entities.Field("last_x")				# Location at the previous step, used to draw between steps
+	last_y = Entities.Field("last_y")
+	velocity = Entities.Field("velocity")			# Size units per second
+	direction = Entities.Field("direction")			# Radians, up = right, going clockwise
+	dir = Entities.Field("facing", bool)			# The direction the man is facing (True = Right)
+	animation = Entities.Field("animation", bool)	# The current animation stage
+	animation_time = Entities.Field("animation_time")	# Time since the animation was flipped
+	size = Entities.Field("size")					# Relative size of the man (the width) The height is twice the width
+	radius = Entities.Field("radius")				# Collision radius
+	
+	def __init__(self, x, y, size, pool = None):
+		# The man lives in the default pool until it is added to a world
+		self.pool = pool if pool != None else Entities.DEFAULT_POOL
+		self.slot = self.pool.Allocate()
+		
+		self.x = x
+		self.y = y
+		self.last_x = x
+		self.last_y = y
+		
+		self.size = size
+		self.radius = Man.COLIDE_RADIUS * size
+		
+		# Store the states of the controls (0, 1 or -1)
+		self.xc = 0
+		self.yc = 0
+		
+		# Store the key status
+		self.up = False
+		self.down = False
+		self.left = False
+		self.right = False
+		
+		self.input = None		# The Input.Input the man is controlled from (None if not bound to the controls)
+		
+		self.turned = False		# If the man has turned around since the last step
+		self.moved = False		# If the man moved in the last step (it was drawn part way between two places)
+		
+	def BindToControls(self, display):
+		self.input = display.input
+		self.input.Bind(Man.MOVE_LEFT, "left")
+		self.input.Bind(Man.MOVE_RIGHT, "right")
+		self.input.Bind(Man.MOVE_UP, "up")
+		self.input.Bind(Man.MOVE_DOWN, "down")
+		
+		for action in Man.ACTIONS:
+			self.input.AddListener(action, self._Action)
+		
+	def Kill(self):
+		if self.input != None:
+			for action in Man.ACTIONS:
+				self.input.RemoveListener(action, self._Action)
+				
+			self.input = None
+			
+		# Free the slot, the man has no state after this
+		if self.pool != None:
+			self.pool.Free(self.slot)
+			self.pool = None
+			
+	def SetPool(self, pool):
+		if pool is not self.pool:
+			self.slot = self.pool.Move(self.slot, pool)
+			self.pool = pool
+			
+	@staticmethod
+	def Pose(size, scale, animation, dir):	# The Scene.Group template of a pose, made once for each size and scale
+		key = (size, scale, animation, dir)
+		template = Man.pose_cache.get(key)
+		
+		if template is None:
+			if len(Man.pose_cache) >= Man.POSE_CACHE_SIZE:
+				Man.pose_cache.clear()
+				
+			unit = size * scale
+			flip = unit if dir else -unit
+			
+			template = tuple(
+				("line", (x1 * flip, y1 * unit, x2 * flip, y2 * unit), {"width" : width * unit})
+				for x1, y1, x2, y2, width in Man.POSES[animation]
+			)
+			
+			Man.pose_cache[key] = template
+			
+		return template
+		
+	def __del__(self):
+		if getattr(self, "pool", None) != None:
+			self.pool.Free(self.slot)
+		
+	def _Action(self, action, pressed):
+		if pressed:		# The last direction pressed wins
+			if action == "left":
+				self.left = True
+				self.xc = -1
+				
+			elif action == "right":
+				self.right = True
+				self.xc = 1
+				
+			elif action == "up":
+				self.up = True
+				self.yc = -1
+				
+			elif action == "down":
+				self.down = True
+				self.yc = 1
+				
+		else:			# Go back to the opposite direction if it is still held
+			if action == "left":
+				self.left = False
+				self.xc = 1 if self.right else 0
+				
+			elif action == "right":
+				self.right = False
+				self.xc = -1 if self.left else 0
+				
+			elif action == "up":
+				self.up = False
+				self.yc = 1 if self.down else 0
+				
+			elif action == "down":
+				self.down = False
+				self.yc = -1 if self.up else 0
+			
+		if self.xc != 0 or self.yc != 0:
+			self.velocity = Man.WALK_SPEED
+			
+		else:
+			self.velocity = 0
+			
+		if self.xc != 0 and (self.xc > 0) != self.dir:
+			self.dir = self.xc > 0
+			self.turned = True
+			
+		self.direction = math.atan2(self.yc, self.xc)
+		
+	def Bounds(self, values = None):	# The area the man is drawn in between the last step and this one
+		if values is None:
+			values = self.pool
+			
+		slot = self.slot
+		x = values.x[slot]
+		y = values.y[slot]
+		last_x = values.last_x[slot]
+		last_y = values.last_y[slot]
+		size = values.size[slot]
+		
+		return (min(x, last_x) - size, min(y, last_y) - size, max(x, last_x) + size, max(y, last_y) + size)
+		
+	def Step(self, time_passed, world, values = None):
+		if values is None:
+			values = self.pool
+			
+		pool = self.pool
+		slot = self.slot
+		
+		changed = self.turned
+		self.turned = False
+		
+		# Change the animation stage if needed
+		animation_time = values.animation_time[slot] + time_passed
+		
+		if animation_time >= Man.ANIMATION_TIME:
+			animation_time = 0.0
+			pool.animation[slot] = 0.0 if values.animation[slot] else 1.0
+			changed = True
+			
+		pool.animation_time[slot] = animation_time
+		
+		# A man which has just stopped was last drawn part way along its last move, so it is damaged once more
+		moving = values.x[slot] != values.last_x[slot] or values.y[slot] != values.last_y[slot]
+		
+		if changed or moving or self.moved:
+			world.Damage(self.Bounds(values), moving)
+			
+		self.moved = moving
+				
+	def Update(self, scene, scale, x_offset, y_offset, alpha, values = None):
+		if values is None:
+			values = self.pool
+			
+		slot = self.slot
+		x = values.x[slot]
+		y = values.y[slot]
+		last_x = values.last_x[slot]
+		last_y = values.last_y[slot]
+		
+		# Draw between the last step and this one
+		x = last_x + ((x - last_x) * alpha)
+		y = last_y + ((y - last_y) * alpha)
+		
+		# Draw the pose for the current animation stage and direction at the man's position
+		scene.Group(
+			(self,),
+			(x_offset + (x * scale), y_offset + (y * scale)),
+			Man.Pose(values.size[slot], scale, values.animation[slot] != 0.0, values.facing[slot] != 0.0)
+		)
+			
+		# Draw a circle to show the COLIDE_RADIUS
+		#canvas.create_oval(
+		#	x_offset + ((x - (self.size * Man.COLIDE_RADIUS))  * scale),
+		#	y_offset + ((y - (self.size * Man.COLIDE_RADIUS))  * scale),
+		#	x_offset + ((x + (self.size * Man.COLIDE_RADIUS)) * scale),
+		#	y_offset + ((y + (self.size * Man.COLIDE_RADIUS)) * scale)
+		#)
+		
+		
+class Hunter(Man):		# A man which walks towards a target entity (e.g. the player) through the maze on its own
+	WALK_SPEED = 2.0
+	
+	__slots__ = ("target",)
+	
+	def __init__(self, x, y, size, target, pool = None):
+		Man.__init__(self, x, y, size, pool)
+		
+		self.target = target		# The entity walked towards (None to stand still)
+		
+	def Step(self, time_passed, world, values = None):
+		if values is None:
+			values = self.pool
+			
+		slot = self.slot
+		x = values.x[slot]
+		y = values.y[slot]
+		
+		direction = None
+		
+		if self.target != None and self.target.pool != None:
+			# Follow the world's flow field to the target, or walk straight at it if the world has none
+			field = world.FlowField(self.target)
+			
+			if field != None:
+				direction = field.Direction(x, y)
+				
+			else:
+				direction = math.atan2(self.target.y - y, self.target.x - x)
+				
+		if direction == None:		# Nowhere to go
+			self.velocity = 0
+			
+		else:
+			self.velocity = Hunter.WALK_SPEED
+			self.direction = direction
+			
+			facing = math.cos(direction) >= 0
+			
+			if facing != self.dir:
+				self.dir = facing
+				self.turned = True
+				
+		Man.Step(self, time_passed, world, values)
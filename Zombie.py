@@ -1,27 +1,106 @@
-# Title:	Zombie
-# Author:	Nicholas Wright
-# Info:		A simple Zombie in a maze based off the Lonely (by BRIGHTLINE) music video produced by Jonah Geh.
-# Version:	v0.0
-
-import Game
-import World
-import Images
-import Display
-
-class Zombie():
-	def __init__(self):
-		self.display = Display.Display(self._Update, "Zombie")
-		self.images = Images.Images()
-		self.world = World.World(self)
-		self.game = Game.Game(self)
-		
-	def MainLoop(self):
-		self.display.MainLoop()
-		
-	def _Update(self, canvas, width, height):
-		self.world.Update(canvas, width, height)
-		
-if __name__ == "__main__":
-	z = Zombie()
-	z.MainLoop()
-	
+# Title:	Zombie
+# Author:	Nicholas Wright
+# Info:		A simple Zombie in a maze based off the Lonely (by BRIGHTLINE) music video produced by Jonah Geh.
+# Version:	v0.0
+
+import argparse
+import multiprocessing
+import time
+
+import Game
+import World
+import Images
+import Display
+import Headless
+import Profiler
+import Input
+import Replay
+import Worker
+
+class Zombie():
+	def __init__(self, headless = False, clock = None, present = Display.Display.SWAP, worker = False, seed = None):
+		# headless runs the game without a window (see Headless.py), the clock defaults to a Headless.VirtualClock when headless.
+		# present is how the window shows frames, Display.Display.SINGLE or Display.Display.SWAP.
+		# worker runs the world and the game in another process (see Worker.py), this one only draws them.
+		# seed is the seed of the game's random numbers (None for a random one)
+		self.profiler = Profiler.Profiler()		# Times each phase of a frame, shared by the display and the world
+		self.input = Input.Input()				# Key bindings and the queue of actions, filled by the display and dispatched by the world
+		
+		if headless:
+			if clock == None:
+				clock = Headless.VirtualClock()
+				
+			# The display moves a virtual clock on for each frame, any other clock (e.g. time.time) keeps its own time
+			display_clock = clock if isinstance(clock, Headless.VirtualClock) else None
+			
+			self.display = Headless.HeadlessDisplay(self._Update, "Zombie", self._Tick, display_clock, self.profiler, self.input, self._Damaged)
+			self.images = Headless.NullImages()
+			
+		else:
+			if clock == None:
+				clock = time.time
+				
+			self.display = Display.Display(self._Update, "Zombie", self._Tick, self.profiler, self.input, self._Damaged, present)
+			self.images = Images.Images()
+			
+		self.clock = clock
+		self.world = World.World(self, clock, self.profiler, self.input)
+		self.world.threaded = not headless		# Headless runs load chunks straight away so they are repeatable
+		self.worker = None		# The Worker.Simulation running the game (None if it runs in this process)
+		self.game = None
+		
+		if worker:
+			self.worker = Worker.Simulation()
+			self.display.AddKeyListener(self.worker.OnKeyEvent)
+			
+		else:
+			self.game = Game.Game(self, seed)
+		
+	def MainLoop(self):
+		self.display.MainLoop()
+		
+		if self.worker != None:
+			self.worker.Close()
+		
+	def _Tick(self):
+		if self.worker != None:		# Draw the latest state from the worker
+			self.worker.Update(self.world)
+			
+			# The world is not stepped here, so the actions for this process (e.g. showing the stats) are dispatched instead
+			self.input.Dispatch()
+			
+		else:
+			self.world.Tick()
+			
+		# Get the images of the next scene ready, a piece at a time
+		self.profiler.Begin("preload")
+		self.images.Work()
+		self.profiler.End("preload")
+		
+	def _Damaged(self):
+		return self.world.IsDamaged()
+		
+	def _Update(self, scene, width, height):
+		self.world.Update(scene, width, height)
+		
+if __name__ == "__main__":
+	multiprocessing.freeze_support()
+	
+	parser = argparse.ArgumentParser(description = "A simple Zombie in a maze game")
+	parser.add_argument("--worker", action = "store_true", help = "Run the game in a second process, this one only draws it")
+	parser.add_argument("--record", help = "Record the game to a file, play it back with: python3 Replay.py <file>")
+	parser.add_argument("--seed", type = int, help = "Seed of the game's random numbers")
+	parser.add_argument("--present", choices = (Display.Display.SWAP, Display.Display.SINGLE), default = Display.Display.SWAP, help = "How the window shows frames, compare them with: python3 Benchmark.py --display")
+	args = parser.parse_args()
+	
+	if args.worker and args.record != None:
+		parser.error("--record can't be used with --worker, the game is played in the other process")
+	
+	z = Zombie(present = args.present, worker = args.worker, seed = args.seed)
+	recorder = Replay.Recorder(z) if args.record != None else None
+	
+	z.MainLoop()
+	
+	if recorder != None:
+		recorder.Save(args.record)
+	
@@ -1,8 +1,9 @@
-from distutils.core import setup
-import py2exe
-
-setup(
-	options = {'py2exe': {'bundle_files': 1, 'compressed': True}},
-	zipfile = None,
-	windows = ["Zombie.py"]
+from distutils.core import setup
+import py2exe
+
+setup(
+	options = {'py2exe': {'bundle_files': 1, 'compressed': True}},
+	zipfile = None,
+	data_files = [("", ["Images.pack"])],		# Read by Images.py from next to the exe
+	windows = ["Zombie.py"]
 )
\ No newline at end of file